@@ -0,0 +1,48 @@
+"""
+Throughput of the batch checkout engine replaying an order file against a temporary users.json.
+
+Run from the Assignment_1 directory:
+    python -m benchmarks.bench_batch_checkout [orders]
+"""
+import json
+import os
+import sys
+from tempfile import TemporaryDirectory
+
+from online_shopping_cart.checkout.batch_checkout import BatchResult, read_orders, run_batches
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_inventory import Inventory
+from online_shopping_cart.user.user_data import UserDataManager
+
+USERS: int = 10_000
+PRODUCTS: int = 1_000
+
+
+def bench_batches(orders: int = 200_000) -> None:
+    with TemporaryDirectory() as directory:
+        UserDataManager.USER_FILE_PATHNAME = os.path.join(directory, 'users.json')
+        with open(UserDataManager.USER_FILE_PATHNAME, 'w') as file:
+            json.dump([{'username': f'User{i}', 'password': 'Password1!', 'cards': [{'card_number': '1234'}],
+                        'wallet': 1e9} for i in range(USERS)], file)
+        orders_filename: str = os.path.join(directory, 'orders.csv')
+        with open(orders_filename, 'w') as file:
+            file.write('Username,Product,Quantity,Payment\n')
+            file.writelines(f'User{i % USERS},Product{i % PRODUCTS},{1 + i % 3},{("wallet", "card")[i % 2]}\n'
+                            for i in range(orders))
+
+        print(f'{orders} orders, {USERS} users, {PRODUCTS} products')
+        print(f'{"batch size":>12} {"batches":>8} {"total (ms)":>12} {"orders/s":>12}')
+        for batch_size in (1_000, 10_000, 100_000):
+            inventory: Inventory = Inventory(products=[
+                Product(name=f'Product{i}', price=1.5, units=orders) for i in range(PRODUCTS)
+            ])
+            result: BatchResult = run_batches(
+                orders=read_orders(csv_filename=orders_filename), inventory=inventory, batch_size=batch_size,
+                results_filename=os.path.join(directory, f'results_{batch_size}.csv')
+            )
+            print(f'{batch_size:>12} {result.batches:>8} {result.seconds * 1e3:>12.1f} '
+                  f'{result.orders_per_second:>12.0f}')
+
+
+if __name__ == '__main__':
+    bench_batches(orders=int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,67 @@
+"""
+Wallet checkouts of many shoppers: one blocking checkout after another versus concurrent async checkouts
+whose wallet writes are coalesced by a group-commit writer.
+
+Run from the Assignment_1 directory:
+    python -m benchmarks.bench_checkout_async [shoppers]
+"""
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from online_shopping_cart.checkout.checkout_async import checkout_many
+from online_shopping_cart.checkout.checkout_process import checkout
+from online_shopping_cart.checkout.shopping_cart import ShoppingCart
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.user.user import User
+from online_shopping_cart.user.user_data import UserDataManager
+from online_shopping_cart.user.user_interface import UserInterface
+from online_shopping_cart.user.user_writer import GroupCommitWriter
+
+
+def make_orders(shoppers: int) -> list[tuple[User, ShoppingCart, str, None]]:
+    orders: list[tuple[User, ShoppingCart, str, None]] = []
+    for i in range(shoppers):
+        cart: ShoppingCart = ShoppingCart()
+        cart.add_item(Product(name='Apple', price=1.5, units=1))
+        orders.append((User(name=f'User{i}', wallet=100.0), cart, '1', None))
+    return orders
+
+
+def bench_checkout(shoppers: int = 500) -> None:
+    with TemporaryDirectory() as directory:
+        UserDataManager.USER_FILE_PATHNAME = os.path.join(directory, 'users.json')
+        with open(UserDataManager.USER_FILE_PATHNAME, 'w') as file:
+            json.dump([{'username': f'User{i}', 'password': 'Password1!', 'cards': [], 'wallet': 100.0}
+                       for i in range(shoppers)], file)
+
+        UserInterface.get_user_input = staticmethod(lambda prompt: '1')  # Always pay by wallet
+        with redirect_stdout(StringIO()):
+            start = perf_counter()
+            for user, cart, _, _ in make_orders(shoppers):
+                checkout(user=user, cart=cart)
+            blocking_s: float = perf_counter() - start
+
+            UserDataManager.use_writer(GroupCommitWriter(pathname=UserDataManager.USER_FILE_PATHNAME))
+            start = perf_counter()
+            with ThreadPoolExecutor(max_workers=32) as executor:
+                asyncio.run(checkout_many(make_orders(shoppers), executor=executor))
+            async_s: float = perf_counter() - start
+            metrics: dict[str, float] = UserDataManager.writer.metrics()
+            UserDataManager.use_writer(None)
+
+    print(f'{shoppers} shoppers')
+    print(f'{"checkout":>10} {"total (ms)":>12} {"per second":>12}')
+    print(f'{"blocking":>10} {blocking_s * 1e3:>12.1f} {shoppers / blocking_s:>12.0f}')
+    print(f'{"async":>10} {async_s * 1e3:>12.1f} {shoppers / async_s:>12.0f}')
+    print(f'async writes: {metrics["batches"]} batches, mean batch size {metrics["mean_batch_size"]:.1f}')
+
+
+if __name__ == '__main__':
+    bench_checkout(shoppers=int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,58 @@
+"""
+Filtered display of a products file too large to cache: parsing every row versus scanning the mapped bytes.
+
+Run from the Assignment_1 directory:
+    python -m benchmarks.bench_csv_scan [max_products]
+"""
+import os
+import sys
+from contextlib import redirect_stdout
+from csv import reader
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from online_shopping_cart.product import product_data
+from online_shopping_cart.product.product_search import display_filtered_table, scan_csv_within
+
+QUERY: str = 'Green Apple Juice'
+
+
+def parse_within(csv_filename: str, query: str) -> int:
+    with open(file=csv_filename, mode='r', newline='') as csv_file:
+        csv_reader = reader(csv_file)
+        next(csv_reader)
+        query = query.casefold()
+        return sum(1 for row in csv_reader if row[0].casefold() in query)
+
+
+def timed(function) -> tuple[float, object]:
+    start = perf_counter()
+    result = function()
+    return perf_counter() - start, result
+
+
+def bench_csv_scan(max_products: int = 2_000_000) -> None:
+    product_data.STREAMING_THRESHOLD_BYTES = 0  # Every file is streamed, as a very large one would be
+    print(f'{"products":>10} {"parse (ms)":>11} {"scan (ms)":>10} {"speedup":>8} {"display (ms)":>13}')
+    count: int = 1_000
+    with TemporaryDirectory() as directory, open(os.devnull, 'w') as devnull:
+        while count <= max_products:
+            csv_filename: str = os.path.join(directory, f'products_{count}.csv')
+            with open(csv_filename, 'w') as file:
+                file.write('Product,Price,Units\n')
+                file.writelines(f'{"Apple" if i % 1000 == 0 else f"Product {i}"},{i % 100 + 0.5},{i % 50}\n'
+                                for i in range(count))
+
+            parse_s, parsed = timed(lambda: parse_within(csv_filename=csv_filename, query=QUERY))
+            scan_s, scanned = timed(lambda: sum(1 for _ in scan_csv_within(csv_filename, 0, QUERY)))
+            assert parsed == scanned
+            with redirect_stdout(devnull):
+                display_s, _ = timed(lambda: display_filtered_table(csv_filename=csv_filename, search_target=QUERY))
+
+            print(f'{count:>10} {parse_s * 1e3:>11.1f} {scan_s * 1e3:>10.1f} {parse_s / scan_s:>7.1f}x '
+                  f'{display_s * 1e3:>13.1f}')
+            count *= 10
+
+
+if __name__ == '__main__':
+    bench_csv_scan(max_products=int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
@@ -0,0 +1,35 @@
+"""
+Cold import time of the checkout module, each run in a fresh interpreter.
+
+Run from the Assignment_1 directory:
+    python -m benchmarks.bench_import_time [runs]
+"""
+import subprocess
+import sys
+from statistics import median
+from time import perf_counter
+
+MODULE: str = 'online_shopping_cart.checkout.checkout_process'
+
+
+def bench_import(runs: int = 20) -> None:
+    # The bare interpreter start-up is measured too, so that it can be subtracted
+    startup: list[float] = []
+    imports: list[float] = []
+    for _ in range(runs):
+        start = perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        startup.append(perf_counter() - start)
+
+        start = perf_counter()
+        subprocess.run([sys.executable, '-c', f'import {MODULE}'], check=True)
+        imports.append(perf_counter() - start)
+
+    print(f'{runs} runs of: import {MODULE}')
+    print(f'{"interpreter (ms)":>18} {"with import (ms)":>18} {"import (ms)":>12}')
+    print(f'{median(startup) * 1e3:>18.1f} {median(imports) * 1e3:>18.1f} '
+          f'{(median(imports) - median(startup)) * 1e3:>12.1f}')
+
+
+if __name__ == '__main__':
+    bench_import(runs=int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,51 @@
+"""
+Memory and scan time of a list of Product objects against the columnar ProductCatalog.
+
+Run from the Assignment_1 directory:
+    python -m benchmarks.bench_product_catalog [products]
+"""
+import sys
+import tracemalloc
+from time import perf_counter
+
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_catalog import ProductCatalog
+
+
+def measure(build):
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def bench_catalog(count: int = 1_000_000) -> None:
+    rows = [(f'Product {i}', float(i % 1000) / 10, i % 50) for i in range(count)]
+
+    products, products_bytes = measure(
+        lambda: [Product(name=name, price=price, units=units) for name, price, units in rows]
+    )
+    catalog, catalog_bytes = measure(lambda: ProductCatalog(
+        names=[name for name, _, _ in rows], prices=[price for _, price, _ in rows], units=[units for _, _, units in rows]
+    ))
+    del rows
+
+    start = perf_counter()
+    sum(product.price * product.units for product in products)
+    [i for i, product in enumerate(products) if product.units > 0]
+    products_scan = perf_counter() - start
+
+    start = perf_counter()
+    catalog.total_value()
+    catalog.in_stock()
+    catalog_scan = perf_counter() - start
+
+    print(f'{count} products')
+    print(f'{"":>16} {"memory (MB)":>12} {"total + stock scan (ms)":>24}')
+    print(f'{"list[Product]":>16} {products_bytes / 2**20:>12.1f} {products_scan * 1e3:>24.1f}')
+    print(f'{"ProductCatalog":>16} {catalog_bytes / 2**20:>12.1f} {catalog_scan * 1e3:>24.1f}')
+
+
+if __name__ == '__main__':
+    bench_catalog(count=int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,45 @@
+"""
+Catalog load time of a large products.csv: one process versus chunks parsed by a growing pool of processes.
+
+Run from the Assignment_1 directory:
+    python -m benchmarks.bench_product_loader [products]
+"""
+import os
+import sys
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from online_shopping_cart.product.product_catalog import ProductCatalog
+from online_shopping_cart.product.product_loader import load_catalog
+
+
+def timed(function) -> tuple[float, object]:
+    start = perf_counter()
+    result = function()
+    return perf_counter() - start, result
+
+
+def bench_loader(products: int = 10_000_000) -> None:
+    cores: int = os.cpu_count() or 1
+    with TemporaryDirectory() as directory:
+        csv_filename: str = os.path.join(directory, 'products.csv')
+        with open(csv_filename, 'w') as file:
+            file.write('Product,Price,Units\n')
+            for start in range(0, products, 100_000):
+                file.writelines(f'Product {i},{i % 100 + 0.5},{i % 50}\n'
+                                for i in range(start, min(start + 100_000, products)))
+        print(f'{products} products, {os.path.getsize(csv_filename) / 2**20:.0f} MiB, {cores} cores')
+
+        print(f'{"workers":>8} {"load (s)":>9} {"speedup":>8}')
+        serial_s: float = 0.0
+        workers: int = 1
+        while workers <= cores:
+            seconds, catalog = timed(lambda: load_catalog(csv_filename=csv_filename, workers=workers))
+            assert isinstance(catalog, ProductCatalog) and len(catalog) == products
+            serial_s = serial_s or seconds
+            print(f'{workers:>8} {seconds:>9.2f} {serial_s / seconds:>7.1f}x')
+            workers = workers * 2 if workers * 2 <= cores or workers == cores else cores
+
+
+if __name__ == '__main__':
+    bench_loader(products=int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -0,0 +1,44 @@
+"""
+Cost of showing the products when the shopper presses d: the whole catalog versus one page.
+
+Run from the Assignment_1 directory:
+    python -m benchmarks.bench_product_pager [max_products]
+"""
+import os
+import sys
+from contextlib import redirect_stdout
+from itertools import chain
+from timeit import repeat
+
+from online_shopping_cart.product.product_catalog import ProductCatalog
+from online_shopping_cart.product.product_pager import ProductPager
+from online_shopping_cart.user.user_interface import UserInterface
+
+
+def display_all(catalog: ProductCatalog) -> None:
+    # The display before pagination
+    UserInterface.write_lines(chain(
+        ('\nAvailable products for purchase:',),
+        (f'{i + 1}. {str(product)}' for i, product in enumerate(catalog))
+    ))
+
+
+def bench_pager(max_products: int = 1_000_000) -> None:
+    print(f'{"products":>10} {"whole catalog (ms)":>20} {"first page (us)":>16} {"last page (us)":>16}')
+    count: int = 1_000
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        while count <= max_products:
+            catalog: ProductCatalog = ProductCatalog(
+                names=[f'Product {i}' for i in range(count)], prices=[1.5] * count, units=[10] * count
+            )
+            pager: ProductPager = ProductPager(products=catalog)
+            all_s: float = min(repeat(lambda: display_all(catalog), number=1, repeat=3))
+            first_s: float = min(repeat(lambda: UserInterface.write_lines(pager.lines()), number=100, repeat=5)) / 100
+            pager.jump(pager.page_count)
+            last_s: float = min(repeat(lambda: UserInterface.write_lines(pager.lines()), number=100, repeat=5)) / 100
+            print(f'{count:>10} {all_s * 1e3:>20.1f} {first_s * 1e6:>16.1f} {last_s * 1e6:>16.1f}', file=sys.__stdout__)
+            count *= 10
+
+
+if __name__ == '__main__':
+    bench_pager(max_products=int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,64 @@
+"""
+Product search latency: the original per-row regex scan against ProductSearchIndex lookups and fuzzy search.
+
+Run from the Assignment_1 directory:
+    python -m benchmarks.bench_product_search [products]
+"""
+import random
+import sys
+from re import search, IGNORECASE
+from time import perf_counter
+
+from online_shopping_cart.product.product_search import ProductSearchIndex
+
+WORDS: list[str] = ['apple', 'banana', 'orange', 'grape', 'mango', 'cherry', 'melon', 'peach', 'lemon', 'kiwi',
+                    'juice', 'organic', 'fresh', 'dried', 'frozen', 'large', 'small', 'premium', 'green', 'red']
+
+REGEX_SAMPLE: int = 20_000
+
+
+def make_names(count: int) -> list[str]:
+    rng = random.Random(0)
+    return [f'{" ".join(rng.sample(WORDS, 3)).title()} {i}' for i in range(count)]
+
+
+def timed(function, repeat: int = 5) -> float:
+    best: float = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        best = min(best, perf_counter() - start)
+    return best * 1e3
+
+
+def regex_scan(names: list[str], query: str) -> list[int]:
+    # The matching display_filtered_table did before the index: one regex per row
+    return [i for i, name in enumerate(names) if search(pattern=name, string=query.capitalize(), flags=IGNORECASE)]
+
+
+def bench_search(count: int = 1_000_000) -> None:
+    names: list[str] = make_names(count)
+    start = perf_counter()
+    index: ProductSearchIndex = ProductSearchIndex(names=names)
+    index.fuzzy('warm up')
+    print(f'{count} products, index built in {(perf_counter() - start):.1f} s')
+
+    query: str = names[count // 2]
+    print(f'{"search":>28} {"latency (ms)":>14}')
+    sample: int = min(count, REGEX_SAMPLE)  # The regex scan is linear and slow, so time a sample and scale it up
+    regex_ms: float = timed(lambda: regex_scan(names[:sample], query), repeat=1) * count / sample
+    print(f'{"regex scan":>28} {regex_ms:>14.2f}')
+    print(f'{"index within":>28} {timed(lambda: index.within(query)):>14.3f}')
+    print(f'{"index prefix":>28} {timed(lambda: index.prefix(query[:8])):>14.3f}')
+    print(f'{"index containing":>28} {timed(lambda: index.containing(query.split()[1])):>14.3f}')
+    typo: str = query[:3] + query[4:]
+    # A fast answer missing the intended row is no answer, so check the results before timing them
+    assert count // 2 in index.fuzzy(typo, k=10), f'fuzzy({typo!r}) misses row {count // 2}'
+    for common_query in ('aple', 'bananna', 'Premium Mango Kiwi'):
+        assert index.fuzzy(common_query, k=10), f'fuzzy({common_query!r}) finds nothing'
+    print(f'{"index fuzzy (top 10, typo)":>28} {timed(lambda: index.fuzzy(typo, k=10)):>14.3f}')
+    print(f'{"index fuzzy (top 10, aple)":>28} {timed(lambda: index.fuzzy("aple", k=10)):>14.3f}')
+
+
+if __name__ == '__main__':
+    bench_search(count=int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,51 @@
+"""
+Catalog load time: parsing products.csv versus opening a compiled snapshot.
+
+Run from the Assignment_1 directory:
+    python -m benchmarks.bench_product_snapshot [max_products]
+"""
+import os
+import sys
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from online_shopping_cart.product.product_data import get_product_catalog, get_products, invalidate_csv_cache
+from online_shopping_cart.product.product_snapshot import SnapshotCatalog, write_snapshot
+
+
+def timed(function) -> tuple[float, object]:
+    start = perf_counter()
+    result = function()
+    return perf_counter() - start, result
+
+
+def bench_snapshot(max_products: int = 1_000_000) -> None:
+    print(f'{"products":>10} {"csv list (ms)":>14} {"csv catalog (ms)":>17} {"compile (ms)":>13} '
+          f'{"snapshot open (us)":>19} {"snapshot scan (ms)":>19}')
+    count: int = 1_000
+    with TemporaryDirectory() as directory:
+        while count <= max_products:
+            csv_filename: str = os.path.join(directory, f'products_{count}.csv')
+            snapshot_filename: str = os.path.join(directory, f'products_{count}.pcat')
+            with open(csv_filename, 'w') as file:
+                file.write('Product,Price,Units\n')
+                file.writelines(f'Product {i},{i % 100 + 0.5},{i % 50}\n' for i in range(count))
+
+            invalidate_csv_cache()
+            list_s, _ = timed(lambda: get_products(file_name=csv_filename))
+            invalidate_csv_cache()
+            catalog_s, _ = timed(lambda: get_product_catalog(file_name=csv_filename))
+            compile_s, _ = timed(lambda: write_snapshot(csv_filename=csv_filename, snapshot_filename=snapshot_filename))
+            open_s, snapshot = timed(lambda: get_products(file_name=snapshot_filename))
+            scan_s, _ = timed(snapshot.total_value)  # Touches every price and unit page once
+            assert isinstance(snapshot, SnapshotCatalog) and len(snapshot) == count
+            snapshot.close()
+
+            print(f'{count:>10} {list_s * 1e3:>14.1f} {catalog_s * 1e3:>17.1f} {compile_s * 1e3:>13.1f} '
+                  f'{open_s * 1e6:>19.1f} {scan_s * 1e3:>19.1f}')
+            count *= 10
+        invalidate_csv_cache()
+
+
+if __name__ == '__main__':
+    bench_snapshot(max_products=int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,66 @@
+"""
+Memory held by 1M catalog entries, users and cart lines, measured with tracemalloc.
+
+Run from the Assignment_1 directory:
+    python -m benchmarks.bench_record_memory [count]
+"""
+import sys
+import tracemalloc
+
+from online_shopping_cart.checkout.shopping_cart import CartItem
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_catalog import ProductCatalog
+from online_shopping_cart.user.user import User
+
+
+class DictProduct:
+    # Product as it was before __slots__
+    def __init__(self, name: str, price: float, units: int) -> None:
+        self.name: str = name
+        self.price: float = price
+        self.units: int = units
+
+
+class DictUser:
+    # User as it was before __slots__
+    def __init__(self, name, wallet, cards=None) -> None:
+        self.name: str = name
+        self.wallet: float = wallet
+        self.cards: list = cards if cards is not None else []
+
+
+def measure(build) -> float:
+    """
+    MiB still allocated by the object that build returns
+    """
+    tracemalloc.start()
+    kept = build()
+    size: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size / 2**20
+
+
+def bench_memory(count: int = 1_000_000) -> None:
+    names: list[str] = [f'Product {i}' for i in range(count)]  # Shared by every layout, so not measured
+    products: list[Product] = [Product(name=name, price=1.5, units=10) for name in names]
+    cards: list = []
+
+    print(f'{count} entries')
+    print(f'{"layout":>28} {"MiB":>10} {"bytes/entry":>12}')
+    runs = (
+        ('product with __dict__', lambda: [DictProduct(name=name, price=1.5, units=10) for name in names]),
+        ('product with __slots__', lambda: [Product(name=name, price=1.5, units=10) for name in names]),
+        ('columnar ProductCatalog', lambda: ProductCatalog(names=names, prices=[1.5] * count, units=[10] * count)),
+        ('user with __dict__', lambda: [DictUser(name=name, wallet=1.5, cards=cards) for name in names]),
+        ('user with __slots__', lambda: [User(name=name, wallet=1.5, cards=cards) for name in names]),
+        ('cart line cloning product', lambda: [DictProduct(name=p.name, price=p.price, units=1) for p in products]),
+        ('cart line CartItem', lambda: [CartItem(product=p, units=1) for p in products]),
+    )
+    for name, build in runs:
+        mib: float = measure(build)
+        print(f'{name:>28} {mib:>10.1f} {mib * 2**20 / count:>12.1f}')
+
+
+if __name__ == '__main__':
+    bench_memory(count=int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,41 @@
+"""
+Headless end-to-end shopping sessions per second, against a temporary users.json.
+
+Run from the Assignment_1 directory:
+    python -m benchmarks.bench_session_driver [sessions]
+"""
+import json
+import os
+import sys
+from tempfile import TemporaryDirectory
+
+from online_shopping_cart.shop.shop_session_driver import SessionReport, run_sessions
+from online_shopping_cart.user.user_data import UserDataManager
+
+USERS: int = 100
+
+SCRIPTS: dict[str, list[str]] = {
+    # Log in, search, then log out
+    'browse': ['User0', 'Password1!', 'all', 'y', 'd', 'l', 'y'],
+    # Log in, search, add two products, check out by wallet, then log out
+    'purchase': ['User0', 'Password1!', 'apple', 'y', '1', '2', 'c', 'y', '1', 'l', 'y'],
+}
+
+
+def bench_sessions(sessions: int = 2_000) -> None:
+    with TemporaryDirectory() as directory:
+        UserDataManager.USER_FILE_PATHNAME = os.path.join(directory, 'users.json')
+        with open(UserDataManager.USER_FILE_PATHNAME, 'w') as file:
+            json.dump([{'username': f'User{i}', 'password': 'Password1!', 'cards': [], 'wallet': 1e9}
+                       for i in range(USERS)], file)
+
+        print(f'{sessions} sessions, {USERS} users')
+        print(f'{"script":>10} {"total (ms)":>12} {"sessions/s":>12}')
+        for name, script in SCRIPTS.items():
+            report: SessionReport = run_sessions([script] * sessions)
+            assert report.completed == sessions, report.summary()
+            print(f'{name:>10} {report.seconds * 1e3:>12.1f} {report.sessions_per_second:>12.0f}')
+
+
+if __name__ == '__main__':
+    bench_sessions(sessions=int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
@@ -0,0 +1,68 @@
+"""
+Cart operations on a cart with many distinct lines, and large-quantity orders unit by unit versus in bulk.
+
+Run from the Assignment_1 directory:
+    python -m benchmarks.bench_shopping_cart [lines]
+"""
+import sys
+from time import perf_counter
+
+from online_shopping_cart.checkout.shopping_cart import ShoppingCart
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_inventory import Inventory
+
+
+def bench_cart(lines: int = 10_000) -> None:
+    products: list[Product] = [Product(name=f'Product {i}', price=1.0, units=1) for i in range(lines)]
+    cart: ShoppingCart = ShoppingCart()
+
+    start = perf_counter()
+    for product in products:
+        cart.add_item(product=product)
+    add_s: float = perf_counter() - start
+
+    start = perf_counter()
+    for product in products:
+        cart.add_item(product=Product(name=product.name, price=product.price, units=1))
+    increment_s: float = perf_counter() - start
+
+    start = perf_counter()
+    for product in products:
+        cart.remove_item(product=product)
+        cart.remove_item(product=product)
+    remove_s: float = perf_counter() - start
+
+    print(f'{lines} distinct lines')
+    print(f'{"operation":>12} {"per op (us)":>12}')
+    print(f'{"add new":>12} {add_s / lines * 1e6:>12.2f}')
+    print(f'{"add again":>12} {increment_s / lines * 1e6:>12.2f}')
+    print(f'{"remove":>12} {remove_s / (2 * lines) * 1e6:>12.2f}')
+
+
+def bench_quantity(quantity: int = 100_000) -> None:
+    apple: Product = Product(name='Apple', price=1.0, units=quantity)
+    inventory: Inventory = Inventory(products=[apple])
+    cart: ShoppingCart = ShoppingCart()
+
+    start = perf_counter()
+    for _ in range(quantity):
+        inventory.reserve(product=apple)
+        cart.add_item(product=apple, units=1)
+    unit_s: float = perf_counter() - start
+    for _ in range(quantity):
+        cart.remove_item(product=apple)
+        inventory.release(name=apple.name)
+
+    start = perf_counter()
+    inventory.reserve(product=apple, units=quantity)
+    cart.add_item(product=apple, units=quantity)
+    bulk_s: float = perf_counter() - start
+
+    print(f'\nadding {quantity} units of one product')
+    print(f'{"unit by unit (ms)":>18} {"bulk (us)":>10}')
+    print(f'{unit_s * 1e3:>18.1f} {bulk_s * 1e6:>10.1f}')
+
+
+if __name__ == '__main__':
+    bench_cart(lines=int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
+    bench_quantity()
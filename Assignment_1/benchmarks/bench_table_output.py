@@ -0,0 +1,71 @@
+"""
+Displaying a large catalog: one print per row versus the buffered table writer.
+
+Run from the Assignment_1 directory:
+    python -m benchmarks.bench_table_output [rows]
+"""
+import os
+import sys
+from contextlib import redirect_stdout
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from online_shopping_cart.product.product_search import display_csv_as_table
+from online_shopping_cart.user.user_interface import UserInterface, format_columns, format_rows
+
+
+def print_per_row(csv_filename: str) -> None:
+    # The display before the buffered writer
+    from online_shopping_cart.product.product_data import get_csv_data
+    header, csv_reader = get_csv_data(csv_filename=csv_filename)
+    print(f'\n{list(header)}')
+    for row in csv_reader:
+        print(list(row))
+
+
+class CountingSink:
+    """
+    Sink counting write calls, standing in for a terminal or a remote session
+    """
+
+    def __init__(self, stream) -> None:
+        self.stream = stream
+        self.writes: int = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return self.stream.write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+def bench_output(rows: int = 100_000) -> None:
+    with TemporaryDirectory() as directory:
+        csv_filename: str = os.path.join(directory, 'products.csv')
+        with open(csv_filename, 'w') as file:
+            file.write('Product,Price,Units\n')
+            file.writelines(f'Product {i},{i % 100 + 0.5},{i % 50}\n' for i in range(rows))
+        print(f'{rows} rows, written line-buffered to {os.devnull}')
+        print(f'{"display":>16} {"writes":>10} {"total (ms)":>12}')
+        with open(os.devnull, 'w', buffering=1) as devnull:
+            with redirect_stdout(devnull):
+                display_csv_as_table(csv_filename=csv_filename)  # Warm the CSV cache outside the timings
+            runs = (
+                ('print per row', lambda: print_per_row(csv_filename)),
+                ('buffered', lambda: display_csv_as_table(csv_filename=csv_filename)),
+                ('buffered columns', lambda: display_csv_as_table(csv_filename=csv_filename)),
+            )
+            for name, display in runs:
+                UserInterface.table_formatter = staticmethod(format_columns if 'columns' in name else format_rows)
+                sink: CountingSink = CountingSink(devnull)
+                start = perf_counter()
+                with redirect_stdout(sink):
+                    display()
+                elapsed: float = perf_counter() - start
+                print(f'{name:>16} {sink.writes:>10} {elapsed * 1e3:>12.1f}')
+        UserInterface.table_formatter = staticmethod(format_rows)
+
+
+if __name__ == '__main__':
+    bench_output(rows=int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
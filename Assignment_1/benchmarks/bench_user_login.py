@@ -0,0 +1,79 @@
+"""
+Login latency of the real paths for a growing number of users. The file-backed login loads the whole users.json
+and is O(n) in the number of users: the index makes lookups on the loaded records cheap, but not the load itself.
+The store-backed login fetches the one record it needs from a SqliteUserStore and stays flat.
+
+Run from the Assignment_1 directory:
+    python -m benchmarks.bench_user_login [max_users]
+"""
+import json
+import os
+import sys
+from contextlib import redirect_stdout
+from io import StringIO
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from online_shopping_cart.user.user_authentication import UserAuthenticator
+from online_shopping_cart.user.user_data import UserDataManager
+from online_shopping_cart.user.user_login import LoginSession
+from online_shopping_cart.user.user_store import SqliteUserStore
+
+
+def timed(function) -> tuple[float, object]:
+    start = perf_counter()
+    result = function()
+    return perf_counter() - start, result
+
+
+def time_login(target: str, password: str) -> tuple[float, float, float]:
+    """
+    Time the path user_login takes, one load per login session and then lookups on the loaded records,
+    returning the seconds spent loading, on the first login and on the next one
+    """
+    session: LoginSession = LoginSession()
+    load_s, users = timed(lambda: session.load(target))
+
+    def login() -> dict | None:
+        return UserAuthenticator.login(username=target, password=password, data=users)
+
+    with redirect_stdout(StringIO()):
+        first_s, user = timed(login)  # Builds the username index of the loaded records
+        next_s, _ = timed(login)
+    assert user is not None and session.reads == 1
+    return load_s, first_s, next_s
+
+
+def bench_login(max_users: int = 1_000_000) -> None:
+    print(f'{"users":>10} {"load (ms)":>10} {"first login (ms)":>17} {"next login (us)":>16} {"file total (ms)":>16} '
+          f'{"store total (ms)":>17}')
+    previous_pathname: str = UserDataManager.USER_FILE_PATHNAME
+    count: int = 1_000
+    with TemporaryDirectory() as directory:
+        UserDataManager.USER_FILE_PATHNAME = os.path.join(directory, 'users.json')
+        try:
+            while count <= max_users:
+                users: list[dict] = [{'username': f'User{i}', 'password': f'Password{i}!', 'cards': [], 'wallet': 0.0}
+                                     for i in range(count)]
+                with open(UserDataManager.USER_FILE_PATHNAME, 'w') as file:
+                    json.dump(users, file)
+                target: str = f'user{count - 1}'
+                password: str = f'Password{count - 1}!'
+                load_s, first_s, next_s = time_login(target, password)
+
+                store: SqliteUserStore = SqliteUserStore(db_pathname=os.path.join(directory, f'users{count}.db'))
+                store.save_users(users)
+                UserDataManager.use_store(store)
+                try:
+                    store_s: float = sum(time_login(target, password)[:2])
+                finally:
+                    UserDataManager.use_store(None)
+                print(f'{count:>10} {load_s * 1e3:>10.1f} {first_s * 1e3:>17.2f} {next_s * 1e6:>16.1f} '
+                      f'{(load_s + first_s) * 1e3:>16.1f} {store_s * 1e3:>17.2f}')
+                count *= 10
+        finally:
+            UserDataManager.USER_FILE_PATHNAME = previous_pathname
+
+
+if __name__ == '__main__':
+    bench_login(max_users=int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,210 @@
+import sys
+from collections.abc import Iterable, Iterator
+from csv import writer
+from itertools import islice
+from time import perf_counter
+
+from online_shopping_cart.checkout.checkout_async import wallet_lock
+from online_shopping_cart.checkout.shopping_cart import ShoppingCart
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_data import get_products, iter_csv_data
+from online_shopping_cart.product.product_inventory import Inventory
+from online_shopping_cart.user.user_data import UserDataManager, UserRecords
+
+############################
+# BATCH CHECKOUT CONSTANTS #
+############################
+
+
+BATCH_SIZE: int = 10_000
+BATCH_WALLET_PAYMENT: str = 'wallet'
+BATCH_CARD_PAYMENT: str = 'card'
+RESULT_HEADER: list[str] = ['Username', 'Product', 'Quantity', 'Payment', 'Status', 'Reason']
+
+
+##########################
+# BATCH CHECKOUT CLASSES #
+##########################
+
+
+class BatchOrder:
+    """
+    One order line of an order file: a quantity of a product bought by a user with a payment method
+    """
+
+    def __init__(self, username: str, product: str, quantity: int, payment: str) -> None:
+        self.username: str = username
+        self.product: str = product
+        self.quantity: int = quantity
+        self.payment: str = payment
+
+
+class BatchResult:
+    """
+    Outcome of the orders of one or more batches, each kept in order-file order
+    """
+
+    def __init__(self) -> None:
+        self.accepted: list[BatchOrder] = []
+        self.rejected: list[tuple[BatchOrder, str]] = []
+        self.outcomes: list[tuple[BatchOrder, str | None]] = []  # Every order with its rejection reason, if any
+        self.batches: int = 0
+        self.seconds: float = 0.0
+
+    @property
+    def orders(self) -> int:
+        return len(self.accepted) + len(self.rejected)
+
+    @property
+    def orders_per_second(self) -> float:
+        return self.orders / self.seconds if self.seconds else 0.0
+
+    def merge(self, other: 'BatchResult') -> None:
+        self.accepted.extend(other.accepted)
+        self.rejected.extend(other.rejected)
+        self.outcomes.extend(other.outcomes)
+        self.batches += other.batches
+        self.seconds += other.seconds
+
+    def summary(self) -> str:
+        return (f'{self.orders} orders in {self.batches} batches: {len(self.accepted)} accepted, '
+                f'{len(self.rejected)} rejected, {self.orders_per_second:.0f} orders/s')
+
+
+############################
+# BATCH CHECKOUT FUNCTIONS #
+############################
+
+
+def read_orders(csv_filename: str) -> Iterator[BatchOrder]:
+    """
+    Lazily read orders from a CSV file with Username, Product, Quantity and Payment columns.
+    A quantity that is not a number is read as 0, so the order is rejected instead of stopping the import.
+    """
+    for row in iter_csv_data(csv_filename=csv_filename, is_dict=True):
+        quantity: str = row['Quantity'].strip()
+        yield BatchOrder(
+            username=row['Username'],
+            product=row['Product'],
+            quantity=int(quantity) if quantity.isdigit() else 0,
+            payment=row['Payment'].strip().lower()
+        )
+
+
+def apply_order(order: BatchOrder, user: dict | None, inventory: Inventory) -> str | None:
+    """
+    Apply an order of the given user, taking its stock and debiting the user's wallet record for a wallet payment,
+    and return why the order is rejected, or None if it is accepted
+    """
+    product: Product | None = inventory.get(order.product)
+    if user is None:
+        return 'User is not registered.'
+    if product is None:
+        return 'Unknown product.'
+    if order.quantity <= 0:
+        return 'Invalid quantity.'
+    if order.payment not in (BATCH_WALLET_PAYMENT, BATCH_CARD_PAYMENT):
+        return 'Invalid payment method.'
+    if order.payment == BATCH_CARD_PAYMENT and not user.get('cards'):
+        return 'No credit cards available.'
+    total_price: float = float(ShoppingCart.exact_price(product) * order.quantity)
+    if order.payment == BATCH_WALLET_PAYMENT and total_price > user['wallet']:
+        return 'Not enough money in the wallet.'
+    if inventory.reserve(product=product, units=order.quantity) is None:
+        return 'Out of stock.'
+    if order.payment == BATCH_WALLET_PAYMENT:
+        user['wallet'] -= total_price
+    return None
+
+
+def process_batch(orders: list[BatchOrder], inventory: Inventory) -> BatchResult:
+    """
+    Apply a batch of orders grouped by user; orders are taken in file order for each user, and an order that
+    cannot be fulfilled is rejected on its own. Without a user store the users are loaded and saved once for the
+    whole batch, holding the lock from load to save so wallet updates made meanwhile by other sessions are not lost.
+    With a store each user is fetched on its own and each debit written with update_user, holding the user's
+    wallet lock so the debits serialize with those of asynchronous checkouts.
+    """
+    start: float = perf_counter()
+    result: BatchResult = BatchResult()
+    result.batches = 1
+
+    positions_by_user: dict[str, list[int]] = dict()
+    for position, order in enumerate(orders):
+        positions_by_user.setdefault(order.username.casefold(), []).append(position)
+
+    reasons: list[str | None] = [None] * len(orders)
+    if UserDataManager.store is None:
+        with UserDataManager.lock:
+            users: UserRecords = UserRecords.of(UserDataManager.load_users())
+            debited: bool = False
+            for positions in positions_by_user.values():
+                user = users.find(orders[positions[0]].username)
+                for position in positions:
+                    reasons[position] = apply_order(order=orders[position], user=user, inventory=inventory)
+                    debited |= reasons[position] is None and orders[position].payment == BATCH_WALLET_PAYMENT
+            if debited:
+                UserDataManager.save_users(users)
+    else:
+        for positions in positions_by_user.values():
+            username: str = orders[positions[0]].username
+            with wallet_lock(username):
+                user = UserDataManager.get_user(username)
+                for position in positions:
+                    reasons[position] = apply_order(order=orders[position], user=user, inventory=inventory)
+                    if reasons[position] is None and orders[position].payment == BATCH_WALLET_PAYMENT:
+                        UserDataManager.update_user(user['username'], wallet=user['wallet'])
+
+    for order, reason in zip(orders, reasons):
+        result.outcomes.append((order, reason))
+        if reason is None:
+            result.accepted.append(order)
+        else:
+            result.rejected.append((order, reason))
+    result.seconds = perf_counter() - start
+    return result
+
+
+def write_results(results_filename: str, result: BatchResult) -> None:
+    """
+    Append the outcome of every order of a batch to a CSV file in a single write, in order-file order,
+    starting with the header if new
+    """
+    lines: list[list] = [
+        [order.username, order.product, order.quantity, order.payment,
+         'accepted' if reason is None else 'rejected', reason or '']
+        for order, reason in result.outcomes
+    ]
+    with open(file=results_filename, mode='a', newline='') as results_file:
+        csv_writer = writer(results_file)
+        if results_file.tell() == 0:
+            csv_writer.writerow(RESULT_HEADER)
+        csv_writer.writerows(lines)
+
+
+def run_batches(orders: Iterable[BatchOrder], inventory: Inventory, batch_size: int = BATCH_SIZE,
+                results_filename: str | None = None) -> BatchResult:
+    """
+    Process a stream of orders batch_size orders at a time, writing each batch's results once
+    """
+    total: BatchResult = BatchResult()
+    orders = iter(orders)
+    while batch := list(islice(orders, batch_size)):
+        result: BatchResult = process_batch(orders=batch, inventory=inventory)
+        if results_filename is not None:
+            write_results(results_filename=results_filename, result=result)
+        total.merge(result)
+    return total
+
+
+if __name__ == '__main__':
+    # Usage: python -m online_shopping_cart.checkout.batch_checkout ORDERS_CSV [RESULTS_CSV]
+    if len(sys.argv) < 2:
+        print('Usage: python -m online_shopping_cart.checkout.batch_checkout ORDERS_CSV [RESULTS_CSV]')
+        exit(1)
+    batch_result: BatchResult = run_batches(
+        orders=read_orders(csv_filename=sys.argv[1]),
+        inventory=Inventory(products=get_products()),
+        results_filename=sys.argv[2] if len(sys.argv) > 2 else None
+    )
+    print(batch_result.summary())
@@ -0,0 +1,93 @@
+import asyncio
+from concurrent.futures import Executor
+from threading import Lock
+
+from online_shopping_cart.checkout.checkout_process import has_items, print_receipt, validate_payment
+from online_shopping_cart.checkout.shopping_cart import ShoppingCart
+from online_shopping_cart.user.user import User
+from online_shopping_cart.user.user_data import UserDataManager
+
+####################################
+# ASYNC CHECKOUT PROCESS CONSTANTS #
+####################################
+
+
+WALLET_LOCK_STRIPES: int = 64
+
+
+##################################
+# ASYNC CHECKOUT PROCESS GLOBALS #
+##################################
+
+
+# Serializes the wallet writes of each user, so a write never overtakes a later debit's write.
+# Users share a fixed set of locks by username hash, so the locks do not grow with the number of users.
+wallet_locks: tuple[Lock, ...] = tuple(Lock() for _ in range(WALLET_LOCK_STRIPES))
+
+
+####################################
+# ASYNC CHECKOUT PROCESS FUNCTIONS #
+####################################
+
+
+def wallet_lock(username: str) -> Lock:
+    return wallet_locks[hash(username.casefold()) % WALLET_LOCK_STRIPES]
+
+
+async def persist_wallet(user: User, executor: Executor | None = None) -> None:
+    """
+    Write the user's wallet to the user store in an executor thread, so the event loop keeps serving other checkouts
+    """
+    def write() -> None:
+        # The wallet is read under the lock, so the last write to run stores the latest balance
+        with wallet_lock(user.name):
+            UserDataManager.update_user(user.name, wallet=user.wallet)
+
+    await asyncio.get_running_loop().run_in_executor(executor, write)
+
+
+async def debit_wallet(user: User, amount: float, executor: Executor | None = None) -> None:
+    """
+    Deduct amount from the user's wallet and persist it, restoring the wallet if the write fails
+    """
+    user.wallet -= amount
+    try:
+        await persist_wallet(user=user, executor=executor)
+    except BaseException:
+        user.wallet += amount
+        raise
+
+
+async def clear_cart(cart: ShoppingCart) -> None:
+    cart.clear_items()
+
+
+async def checkout_async(user: User, cart: ShoppingCart, payment_choice: str, card_choice: str | None = None,
+                         executor: Executor | None = None) -> bool:
+    """
+    Non-blocking counterpart of checkout: the payment choices are given upfront instead of prompted for,
+    and the wallet write runs in an executor. Returns whether the purchase went through.
+    """
+    if not has_items(cart):
+        return False
+    total_price: float = cart.get_total_price()
+    payment = validate_payment(user, total_price, payment_choice, choose_card=lambda: card_choice)
+    if payment is False:
+        return False
+
+    if payment is True:
+        await debit_wallet(user=user, amount=total_price, executor=executor)
+    await clear_cart(cart=cart)
+    print_receipt(user, total_price, card=None if payment is True else payment)
+    return True
+
+
+async def checkout_many(orders: list[tuple[User, ShoppingCart, str, str | None]],
+                        executor: Executor | None = None) -> list[bool]:
+    """
+    Run the checkouts of many (user, cart, payment choice, card choice) orders concurrently
+    """
+    return list(await asyncio.gather(*(
+        checkout_async(user=user, cart=cart, payment_choice=payment_choice, card_choice=card_choice, executor=executor)
+        for user, cart, payment_choice, card_choice in orders
+    )))
@@ -1,7 +1,10 @@
-from partd.utils import suffix
+from itertools import chain
+from threading import Lock
 
-from online_shopping_cart.checkout.shopping_cart import ShoppingCart
+from online_shopping_cart.checkout.shopping_cart import CartItem, ShoppingCart
 from online_shopping_cart.product.product_data import get_products
+from online_shopping_cart.product.product_inventory import Inventory
+from online_shopping_cart.product.product_pager import ProductPager
 from online_shopping_cart.user.user_data import UserDataManager
 from online_shopping_cart.user.user_interface import UserInterface
 from online_shopping_cart.product.product import Product
@@ -9,13 +12,25 @@ from online_shopping_cart.user.user_logout import logout
 from online_shopping_cart.user.user import User
 from online_shopping_cart.user.user_profile import manage_credit_cards
 
+##############################
+# CHECKOUT PROCESS CONSTANTS #
+##############################
+
+
+WALLET_PAYMENT: str = '1'
+CARD_PAYMENT: str = '2'
+
+
 ############################
 # CHECKOUT PROCESS GLOBALS #
 ############################
 
 
-global_products: list[Product] = get_products()  # Load products from CSV
+global_products: list[Product] | None = None  # Loaded from CSV on first use, see get_inventory
+global_inventory: Inventory | None = None
 global_cart: ShoppingCart = ShoppingCart()
+# Guards loading global_products and building global_inventory, so concurrent callers share one inventory
+global_inventory_lock: Lock = Lock()
 
 
 ##############################
@@ -23,15 +38,99 @@ global_cart: ShoppingCart = ShoppingCart()
 ##############################
 
 
+def split_quantity(choice: str) -> tuple[str, int | None]:
+    """
+    Split a choice such as '6x3' into the number '6' and the quantity 3. Without 'x' the quantity is 1,
+    and it is None if it is not a positive whole number.
+    """
+    number, separator, quantity = choice.partition('x')
+    if not separator:
+        return number, 1
+    return number, int(quantity) if quantity.isdigit() and int(quantity) > 0 else None
+
+
+def get_inventory() -> Inventory:
+    """
+    Return the inventory of global_products, loading the products on first use and rebuilding the inventory
+    if global_products has been replaced
+    """
+    global global_products, global_inventory
+
+    inventory: Inventory | None = global_inventory
+    if inventory is not None and global_products is not None and inventory.products is global_products:
+        return inventory
+    with global_inventory_lock:  # Checked again, as another caller may have loaded or rebuilt it meanwhile
+        if global_products is None:
+            global_products = get_products()  # Load products from CSV
+        if global_inventory is None or global_inventory.products is not global_products:
+            global_inventory = Inventory(products=global_products)
+        return global_inventory
+
+
+def has_items(cart) -> bool:
+    """
+    Check that the cart holds something to check out, telling the user if not
+    """
+    if cart.is_empty():
+        print('Your basket is empty. Please add items before checking out.')
+        return False
+    return True
+
+
+def prompt_card_choice(user) -> str:
+    """
+    List the user's cards and ask which one to pay with
+    """
+    print("\nSelect a card to pay with:")
+    for idx, card in enumerate(user.cards):
+        #show only last 4 digits for security
+        suffix = card.get('card_number')[-4:]
+        print(f"{idx + 1}. {card.get('name')} (Ends in {suffix})")
+    return UserInterface.get_user_input(prompt="Enter choice (e.g., 1): ")
+
+
+def validate_payment(user, total_price: float, payment_choice: str, choose_card) -> bool | dict[str, str]:
+    """
+    Check that total_price can be paid with the chosen method, telling the user why not. Returns True for a wallet
+    payment the wallet covers, the card to charge for a card payment, and False if the payment cannot go ahead.
+    choose_card is only called for the card choice once the user is known to have cards.
+    """
+    if payment_choice == WALLET_PAYMENT:
+        if total_price > user.wallet:
+            print(f"You don't have enough money in your wallet to complete the purchase. Please try again!")
+            return False
+        return True
+    if payment_choice == CARD_PAYMENT:
+        if not user.cards:
+            print("No credit cards available. Please add a credit card in your profile.")
+            return False
+        card_choice: str | None = choose_card()
+        if card_choice is None or not card_choice.isdigit() or not 1 <= int(card_choice) <= len(user.cards):
+            print("Invalid card selection. Payment cancelled.")
+            return False
+        return user.cards[int(card_choice) - 1]
+    print("Invalid payment method selected. Please try again.")
+    return False
+
+
+def print_receipt(user, total_price: float, card: dict[str, str] | None = None) -> None:
+    """
+    Confirm a completed purchase, paid from the wallet or, if given, with the card
+    """
+    if card is None:
+        print(f'Paid ${total_price} using Wallet. Remaining balance: ${user.wallet}')
+    else:
+        print(f'Paid ${total_price} using Credit Card ending in {card.get("card_number")[-4:]}.')
+        print("Payment successful!")
+    print(f'Thank you for your purchase, {user.name}! Your remaining balance is {user.wallet}')
+
+
 def checkout(user, cart) -> None:
     """
     Complete the checkout process
     [Task 1 Implementation 2] Added logic to choose between Wallet and Credit Card.
     """
-    global global_products
-
-    if not cart.items:
-        print('Your basket is empty. Please add items before checking out.')
+    if not has_items(cart):
         return
 
     total_price: float = cart.get_total_price()
@@ -42,55 +141,28 @@ def checkout(user, cart) -> None:
     print("1. Wallet Balance")
     print("2. Credit Card")
     payment_choice = UserInterface.get_user_input(prompt="Enter choice 1 or 2: ")
-    if payment_choice == '1':
-        if total_price > user.wallet:
-            print(f"You don't have enough money in your wallet to complete the purchase. Please try again!")
-            return
-        user.wallet -= total_price  # Deduct the total price from the user's wallet
-        all_users = UserDataManager.load_users()
-        for u in all_users:
-            if u['username'] == user.name:
-                u['wallet'] = user.wallet
-                break
-        UserDataManager.save_users(all_users)
-        print(f'Paid ${total_price} using Wallet. Remaining balance: ${user.wallet}')
-    elif payment_choice == '2':
-        if not user.cards:
-            print("No credit cards available. Please add a credit card in your profile.")
-            return
-        print("\nSelect a card to pay with:")
-        for idx, card in enumerate(user.cards):
-            #show only last 4 digits for security
-            suffix = card.get('card_number')[-4:]
-            print(f"{idx + 1}. {card.get('name')} (Ends in {suffix})")
-        card_idx = UserInterface.get_user_input(prompt="Enter choice (e.g., 1): ")
-        if card_idx.isdigit() and 1 <= int(card_idx) <= len(user.cards):
-            selected_card = user.cards[int(card_idx) - 1]
-            print(f'Paid ${total_price} using Credit Card ending in {selected_card.get("card_number")[-4:]}.')
-            print("Payment successful!")
-        else:
-            print("Invalid card selection. Payment cancelled.")
-            return
-    else:
-        print("Invalid payment method selected. Please try again.")
+    payment = validate_payment(user, total_price, payment_choice, choose_card=lambda: prompt_card_choice(user))
+    if payment is False:
         return
+    if payment is True:
+        user.wallet -= total_price  # Deduct the total price from the user's wallet
+        UserDataManager.update_user(user.name, wallet=user.wallet)
     # --- [Task 1] Implementation 2: Payment System End ---
     cart.clear_items()  # Clear the cart
-    print(f'Thank you for your purchase, {user.name}! Your remaining balance is {user.wallet}')
+    print_receipt(user, total_price, card=None if payment is True else payment)
 
 
 def display_cart_items(cart) -> None:
-    print('\nItems in the cart:')
-    for i, item in enumerate(cart.retrieve_items()):
-        print(f'{i + 1}. {str(item)}')
+    UserInterface.write_lines(chain(
+        ('\nItems in the cart:',),
+        (f'{i + 1}. {str(item)}' for i, item in enumerate(cart.retrieve_items()))
+    ))
 
 
 def check_cart(user, cart) -> None | bool:
     """
     Print the cart and prompt user for proceeding to checkout
     """
-    global global_products
-
     display_cart_items(cart)
 
     # Iteratively ask the user if they want to check out or remove an item from the cart, and if neither break from loop
@@ -106,50 +178,71 @@ def check_cart(user, cart) -> None | bool:
             user_input: str = UserInterface.get_user_input(
                 prompt='\nEnter item number to remove from cart (or c to display cart): '
             ).lower()
+            number, quantity = split_quantity(user_input)  # e.g. 2x3 removes 3 units of item 2
             if user_input.startswith('c'):
                 display_cart_items(cart)
-            elif user_input.isdigit() and 1 <= int(user_input) <= len(cart.retrieve_items()):
-                selected_item: Product = cart.retrieve_items()[int(user_input) - 1]
-                cart.remove_item(product=selected_item)
-                [product.add_product_unit() for product in global_products if product.name == selected_item.name]
+            elif number.isdigit() and 1 <= int(number) <= len(cart.retrieve_items()) and quantity is not None \
+                    and quantity <= cart.retrieve_items()[int(number) - 1].units:
+                selected_item: CartItem = cart.retrieve_items()[int(number) - 1]
+                cart.remove_item(product=selected_item, units=quantity)
+                get_inventory().release(name=selected_item.name, units=quantity)
             else:
                 print('Invalid input. Please try again.')
         else:
             return False
 
 
-def display_products_available_for_purchase() -> None:
+def display_products_available_for_purchase(pager: ProductPager | None = None) -> None:
     """
-    Display available products in the global_products list
+    Display the current page of available products, by default the first page of the global_products list
     """
-    global global_products
+    if pager is None:
+        pager = ProductPager(products=get_inventory())
+    UserInterface.write_lines(pager.lines())
 
-    print('\nAvailable products for purchase:')
-    for i, product in enumerate(global_products):
-        print(f'{i + 1}. {str(product)}')
 
-
-def checkout_and_payment(login_info) -> None:
+def checkout_and_payment(login_info, cart: ShoppingCart | None = None) -> None:
     """
-    Main function for the shopping and checkout process
+    Main function for the shopping and checkout process; each shopping session may bring its own cart
     """
     global global_products, global_cart
 
+    if cart is None:
+        cart = global_cart  # The single shopper of the interactive app
+
     user: User = User(
         name=login_info['username'],
         wallet=login_info['wallet'],
         cards = login_info.get('cards', [])
     )
 
+    # Product numbers refer to the current page of the catalog, or of the search results
+    pager: ProductPager = ProductPager(products=get_inventory())
+
     # Get user input for either selecting a product by its number, checking their cart or logging out
     while True:
         choice: str = UserInterface.get_user_input(
-            prompt='\nEnter product number or (d to display products, c to check cart, p to profile/cards, l to logout): '
+            prompt='\nEnter product number, e.g. 6 or 6x3 for 3 units, or (d to display products, > or < to change page, '
+                   'g<n> to go to page n, /name to search, c to check cart, p to profile/cards, l to logout): '
         ).lower()
         if choice.startswith('d'):
-            display_products_available_for_purchase()
+            display_products_available_for_purchase(pager=pager)
+        elif choice in ('>', '<') or (choice.startswith('g') and choice[1:].isdigit()):
+            if choice == '>':
+                moved: bool = pager.next_page()
+            elif choice == '<':
+                moved = pager.previous_page()
+            else:
+                moved = pager.jump(int(choice[1:]))
+            if moved:
+                display_products_available_for_purchase(pager=pager)
+            else:
+                print(f'No such page. There are {pager.page_count} pages.')
+        elif choice.startswith('/'):
+            pager.search(choice[1:].strip() or None)
+            display_products_available_for_purchase(pager=pager)
         elif choice.startswith('c'):
-            if check_cart(user=user, cart=global_cart) is False:
+            if check_cart(user=user, cart=cart) is False:
                 continue  # The user has selected not to check out their cart
             else:
                 pass
@@ -168,24 +261,30 @@ def checkout_and_payment(login_info) -> None:
 # [Task 1 Implementation] Implement the entry point for managing credit cards
         elif choice.startswith('p') :
             manage_credit_cards(user.name)
-            latest_data = UserDataManager.load_users()
-            for u in latest_data:
-                if u['username'] == user.name:
-                    user.cards = u.get('cards', [])
-                    print(f"\n[System] Profile synced. Local cards updated: {len(user.cards)}")
-                    break
+            latest_user = UserDataManager.get_user(user.name)
+            if latest_user is not None:
+                user.cards = latest_user.get('cards', [])
+                print(f"\n[System] Profile synced. Local cards updated: {len(user.cards)}")
         elif choice.startswith('l'):
-            if logout(cart=global_cart):
+            if logout(cart=cart):
                 exit(0)  # The user has logged out
-        elif choice.isdigit() and 1 <= int(choice) <= len(global_products):
-            selected_product: Product = global_products[int(choice) - 1]
-            if selected_product.units > 0:
-                global_cart.add_item(product=selected_product.get_product_unit())  # Add selected product to the cart
-                print(f'{selected_product.name} added to your cart.')
-            else:
-                print(f'Sorry, {selected_product.name} is out of stock.')
         else:
-            print('Invalid input. Please try again.')
+            number, quantity = split_quantity(choice)
+            selected_product: Product | None = None
+            if number.isdigit() and quantity is not None:
+                selected_product = pager.select(int(number))
+            if selected_product is None:
+                print('Invalid input. Please try again.')
+            elif get_inventory().reserve(product=selected_product, units=quantity) is not None:
+                cart.add_item(product=selected_product, units=quantity)  # Add the selected units to the cart
+                if quantity == 1:
+                    print(f'{selected_product.name} added to your cart.')
+                else:
+                    print(f'{quantity} units of {selected_product.name} added to your cart.')
+            elif quantity == 1 or selected_product.units == 0:
+                print(f'Sorry, {selected_product.name} is out of stock.')
+            else:
+                print(f'Sorry, only {selected_product.units} units of {selected_product.name} are in stock.')
 # manual for testing
 if __name__ == "__main__":
     fake_login_info = {
@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 from online_shopping_cart.product.product import Product
 
 ##################################
@@ -5,37 +7,83 @@ from online_shopping_cart.product.product import Product
 ##################################
 
 
+class CartItem:
+    """
+    Cart line referencing a catalog product, with the number of units in the cart instead of a copy of the product.
+    The price is fixed when the line is added, so the line and the cart total always agree.
+    """
+
+    __slots__ = ('product', 'units', 'price')
+
+    def __init__(self, product: Product, units: int) -> None:
+        self.product: Product = product
+        self.units: int = units
+        self.price: float = product.price
+
+    @property
+    def name(self) -> str:
+        return self.product.name
+
+    def __str__(self) -> str:
+        return f'{self.name} - ${self.price} - Units: {self.units}'
+
+
 class ShoppingCart:
     """
     ShoppingCart class to represent the user's shopping cart
     """
 
     def __init__(self) -> None:
-        self.items: list[Product] = list()
+        self.__items: dict[str, CartItem] = dict()  # Insertion-ordered, keyed on product name
+        self.__total: Decimal = Decimal(0)  # Exact running total, kept in step with every change of the items
+
+    @staticmethod
+    def exact_price(product: Product | CartItem) -> Decimal:
+        """
+        Price as the decimal it is written as, e.g. Decimal('0.1') rather than the binary float value
+        """
+        return Decimal(str(product.price))
 
-    def __get_product_by_name(self, product_search: Product) -> list[Product]:
-        return [product_i for product_i in self.items if product_i.name == product_search.name]
+    @property
+    def items(self) -> list[CartItem]:
+        return list(self.__items.values())
 
-    def add_item(self, product) -> None:
+    def add_item(self, product, units: int = 1) -> None:
         """
-        Add a product to the cart if not already there, otherwise increment the number of units
+        Add units of a product to the cart, starting a line referencing the product if not already there
         """
-        product_in_items: list[Product] = self.__get_product_by_name(product)
-        if not product_in_items:
-            self.items.append(product)
+        if units <= 0:
+            raise ValueError('Units must be a positive number.')
+        item: CartItem | None = self.__items.get(product.name)
+        if item is None:
+            item = CartItem(product=product, units=units)
+            self.__items[product.name] = item
+            self.__total += self.exact_price(item) * units
         else:
-            product_in_items[0].units += 1
+            item.units += units
+            self.__total += self.exact_price(item) * units
+
+    def remove_item(self, product, units: int = 1) -> None:
+        """
+        Remove units of a product from the cart, dropping its line when none are left
+        """
+        if units <= 0:
+            raise ValueError('Units must be a positive number.')
+        item: CartItem = self.__items[product.name]
+        if units > item.units:
+            raise ValueError('Cannot remove more units than are in the cart.')
+        item.units -= units
+        self.__total -= self.exact_price(item) * units
+        if item.units == 0:
+            del self.__items[product.name]
 
-    def remove_item(self, product: Product) -> None:
+    def get_item(self, name: str) -> CartItem | None:
         """
-        Remove a product from the cart
+        Retrieve the cart item of the given product name, if any
         """
-        product_in_items: list[Product] = self.__get_product_by_name(product)
-        product_in_items[0].units -= 1
-        if product_in_items[0].units == 0:
-            self.items.remove(product)
+        return self.__items.get(name)
 
-    def retrieve_items(self) -> list[Product]:
+    def retrieve_items(self) -> list[CartItem]:
         """
         Retrieve the items in the cart
         """
@@ -45,16 +93,17 @@ class ShoppingCart:
         """
         Clear all items from the cart
         """
-        self.items = list()
+        self.__items = dict()
+        self.__total = Decimal(0)
 
     def is_empty(self) -> bool:
         """
         Checks if the cart is empty
         """
-        return self.items == []
+        return not self.__items
 
     def get_total_price(self) -> float:
         """
-        Calculate the total price of items in the cart
+        Return the total price of items in the cart, maintained as items are added and removed
         """
-        return sum(item.price * item.units for item in self.items)
+        return float(self.__total)
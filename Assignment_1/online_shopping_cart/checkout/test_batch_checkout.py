@@ -0,0 +1,150 @@
+import csv
+import pytest
+from threading import Thread
+from unittest.mock import MagicMock
+from online_shopping_cart.checkout.batch_checkout import BatchOrder, process_batch, read_orders, run_batches
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_inventory import Inventory
+from online_shopping_cart.user.user_data import UserDataManager
+from online_shopping_cart.user.user_store import SqliteUserStore
+
+
+@pytest.fixture
+def users(monkeypatch):
+    # Every load hands out the same list and every save is recorded
+    data = [
+        {"username": "Alice", "password": "Password1!", "cards": [], "wallet": 10.0},
+        {"username": "Bob", "password": "Password2!", "cards": [{"card_number": "1234"}], "wallet": 0.0},
+    ]
+    saves = []
+    monkeypatch.setattr(UserDataManager, 'load_users', lambda: data)
+    monkeypatch.setattr(UserDataManager, 'save_users', lambda users: saves.append(users))
+    return data, saves
+
+
+@pytest.fixture
+def inventory():
+    return Inventory(products=[Product(name="Apple", price=2.0, units=3), Product(name="Pear", price=0.1, units=10)])
+
+
+#test case 1 orders debit wallets, take stock and save the users once per batch
+def test_process_batch_applies_orders(users, inventory):
+    data, saves = users
+    result = process_batch([
+        BatchOrder("alice", "Apple", 2, "wallet"),
+        BatchOrder("Bob", "Apple", 1, "card"),
+        BatchOrder("Alice", "Pear", 3, "wallet"),
+    ], inventory=inventory)
+
+    assert len(result.accepted) == 3 and result.rejected == []
+    assert data[0]['wallet'] == pytest.approx(5.7)
+    assert data[1]['wallet'] == 0.0
+    assert inventory.get("Apple").units == 0
+    assert inventory.get("Pear").units == 7
+    assert len(saves) == 1
+
+
+#test case 2 unfulfillable orders are rejected one by one without side effects
+def test_process_batch_rejects_orders(users, inventory):
+    data, saves = users
+    result = process_batch([
+        BatchOrder("Nobody", "Apple", 1, "wallet"),
+        BatchOrder("Alice", "Mango", 1, "wallet"),
+        BatchOrder("Alice", "Apple", 0, "wallet"),
+        BatchOrder("Alice", "Apple", 1, "cash"),
+        BatchOrder("Alice", "Apple", 1, "card"),
+        BatchOrder("Alice", "Pear", 5, "wallet"),
+        BatchOrder("Bob", "Apple", 4, "card"),
+        BatchOrder("Bob", "Apple", 3, "card"),
+    ], inventory=inventory)
+
+    assert [reason for _, reason in result.rejected] == [
+        'User is not registered.', 'Unknown product.', 'Invalid quantity.', 'Invalid payment method.',
+        'No credit cards available.', 'Out of stock.',
+    ]
+    assert [order.quantity for order in result.accepted] == [5, 3]
+    assert inventory.get("Apple").units == 0
+    assert data[0]['wallet'] == pytest.approx(9.5)
+
+
+#test case 3 a wallet that cannot cover the order rejects it and keeps the stock
+def test_process_batch_insufficient_wallet(users, inventory):
+    data, saves = users
+    data[0]['wallet'] = 5.0
+    result = process_batch([BatchOrder("Alice", "Apple", 3, "wallet"), BatchOrder("Bob", "Pear", 1, "wallet")],
+                           inventory=inventory)
+
+    assert [reason for _, reason in result.rejected] == ['Not enough money in the wallet.'] * 2
+    assert inventory.get("Apple").units == 3
+    assert data[0]['wallet'] == 5.0
+    assert saves == []
+
+
+#test case 4 an order file is read lazily and processed in batches, with the results written per batch
+def test_run_batches_from_file(users, inventory, tmp_path):
+    data, saves = users
+    orders_file = tmp_path / 'orders.csv'
+    orders_file.write_text(
+        'Username,Product,Quantity,Payment\n'
+        'Alice,Pear,1,Wallet\n'
+        'Bob,Apple,1,card\n'
+        'Alice,Pear,x,wallet\n'
+        'Alice,Apple,1,wallet\n'
+        'Bob,Pear,2,card\n'
+    )
+    results_file = tmp_path / 'results.csv'
+
+    result = run_batches(read_orders(str(orders_file)), inventory=inventory, batch_size=2,
+                         results_filename=str(results_file))
+
+    assert result.batches == 3
+    assert result.orders == 5 and len(result.accepted) == 4
+    assert len(saves) == 2  # The batch of Bob's card order alone debits no wallet
+    with open(results_file, newline='') as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ['Username', 'Product', 'Quantity', 'Payment', 'Status', 'Reason']
+    assert len(rows) == 6
+    assert ['Alice', 'Pear', '0', 'wallet', 'rejected', 'Invalid quantity.'] in rows
+    # Results follow the order file, a rejected order keeping its place among the accepted ones
+    assert [row[:3] for row in rows[1:]] == [
+        ['Alice', 'Pear', '1'], ['Bob', 'Apple', '1'], ['Alice', 'Pear', '0'], ['Alice', 'Apple', '1'], ['Bob', 'Pear', '2']
+    ]
+
+
+#test case 5 a batch waits for a session holding the users lock before loading the users
+def test_process_batch_takes_lock(users, inventory):
+    data, saves = users
+    batch = Thread(target=process_batch, args=([BatchOrder("Alice", "Pear", 1, "wallet")], inventory))
+    with UserDataManager.lock:
+        batch.start()
+        batch.join(timeout=0.1)
+        assert batch.is_alive()
+        data[0]['wallet'] = 1.0  # A concurrent session's update, made while it holds the lock
+    batch.join()
+
+    assert data[0]['wallet'] == pytest.approx(0.9)
+    assert len(saves) == 1
+
+
+#test case 6 with a store each debit updates its user's record instead of saving every user
+def test_process_batch_with_store(inventory, tmp_path, monkeypatch):
+    store = SqliteUserStore(db_pathname=str(tmp_path / 'users.db'))
+    store.save_users([
+        {"username": "Alice", "password": "Password1!", "cards": [], "wallet": 10.0},
+        {"username": "Bob", "password": "Password2!", "cards": [{"card_number": "1234"}], "wallet": 0.0},
+    ])
+    monkeypatch.setattr(UserDataManager, 'store', store)
+    monkeypatch.setattr(store, 'load_users', MagicMock(side_effect=AssertionError("whole store loaded")))
+    monkeypatch.setattr(store, 'save_users', MagicMock(side_effect=AssertionError("whole store saved")))
+
+    result = process_batch([
+        BatchOrder("alice", "Apple", 2, "wallet"),
+        BatchOrder("Bob", "Apple", 1, "card"),
+        BatchOrder("Alice", "Pear", 3, "wallet"),
+        BatchOrder("Carol", "Pear", 1, "wallet"),
+    ], inventory=inventory)
+
+    assert len(result.accepted) == 3
+    assert result.rejected[0][1] == 'User is not registered.'
+    assert store.get_user("Alice")['wallet'] == pytest.approx(5.7)
+    assert store.get_user("Bob")['wallet'] == 0.0
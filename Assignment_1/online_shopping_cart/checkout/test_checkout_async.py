@@ -0,0 +1,126 @@
+import asyncio
+import json
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from online_shopping_cart.checkout.checkout_async import (
+    WALLET_LOCK_STRIPES, checkout_async, checkout_many, wallet_lock, wallet_locks
+)
+from online_shopping_cart.checkout.checkout_process import checkout
+from online_shopping_cart.checkout.shopping_cart import ShoppingCart
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.user.user import User
+from online_shopping_cart.user.user_data import UserDataManager
+from online_shopping_cart.user.user_interface import UserInterface
+from online_shopping_cart.user.user_writer import GroupCommitWriter
+
+
+def make_cart(*prices):
+    cart = ShoppingCart()
+    for i, price in enumerate(prices):
+        cart.add_item(Product(name=f"Product{i}", price=price, units=1))
+    return cart
+
+
+@pytest.fixture
+def users_file(tmp_path, monkeypatch):
+    pathname = tmp_path / 'users.json'
+    pathname.write_text(json.dumps(
+        [{"username": f"User{i}", "password": "Password1!", "cards": [], "wallet": 100.0} for i in range(20)]
+    ))
+    monkeypatch.setattr(UserDataManager, 'USER_FILE_PATHNAME', str(pathname))
+    return pathname
+
+
+#test case 1 a wallet checkout debits, persists and clears the cart
+def test_checkout_async_wallet(monkeypatch):
+    updates = []
+    monkeypatch.setattr(UserDataManager, 'update_user', lambda username, **fields: updates.append((username, fields)))
+    user = User(name="TestUser", wallet=10.0)
+    cart = make_cart(1.5, 2.5)
+
+    assert asyncio.run(checkout_async(user=user, cart=cart, payment_choice='1')) is True
+    assert user.wallet == 6.0
+    assert updates == [("TestUser", {"wallet": 6.0})]
+    assert cart.is_empty()
+
+
+#test case 2 failed validation changes nothing
+def test_checkout_async_rejected(monkeypatch):
+    monkeypatch.setattr(UserDataManager, 'update_user', lambda username, **fields: pytest.fail("must not persist"))
+    user = User(name="TestUser", wallet=1.0, cards=[{"card_number": "12345678", "name": "Test"}])
+    cart = make_cart(5.0)
+
+    assert asyncio.run(checkout_async(user=user, cart=cart, payment_choice='1')) is False
+    assert asyncio.run(checkout_async(user=user, cart=cart, payment_choice='2', card_choice='2')) is False
+    assert asyncio.run(checkout_async(user=user, cart=cart, payment_choice='3')) is False
+    assert asyncio.run(checkout_async(user=user, cart=ShoppingCart(), payment_choice='1')) is False
+    assert user.wallet == 1.0
+    assert not cart.is_empty()
+
+
+#test case 3 a card checkout clears the cart without touching the wallet
+def test_checkout_async_card(monkeypatch):
+    monkeypatch.setattr(UserDataManager, 'update_user', lambda username, **fields: pytest.fail("must not persist"))
+    user = User(name="TestUser", wallet=1.0, cards=[{"card_number": "12345678", "name": "Test"}])
+    cart = make_cart(5.0)
+
+    assert asyncio.run(checkout_async(user=user, cart=cart, payment_choice='2', card_choice='1')) is True
+    assert user.wallet == 1.0
+    assert cart.is_empty()
+
+
+#test case 4 a failed write restores the wallet and keeps the cart
+def test_checkout_async_write_failure(monkeypatch):
+    def failing_update(username, **fields):
+        raise OSError("disk full")
+    monkeypatch.setattr(UserDataManager, 'update_user', failing_update)
+    user = User(name="TestUser", wallet=10.0)
+    cart = make_cart(4.0)
+
+    with pytest.raises(OSError):
+        asyncio.run(checkout_async(user=user, cart=cart, payment_choice='1'))
+    assert user.wallet == 10.0
+    assert not cart.is_empty()
+
+
+#test case 5 concurrent checkouts of many users, and of one user twice, are all persisted
+def test_checkout_many_persists_every_wallet(users_file, monkeypatch):
+    monkeypatch.setattr(UserDataManager, 'writer', GroupCommitWriter(pathname=str(users_file), fsync=False))
+    users = [User(name=f"User{i}", wallet=100.0) for i in range(20)]
+    orders = [(user, make_cart(float(i)), '1', None) for i, user in enumerate(users)]
+    orders.append((users[0], make_cart(30.0), '1', None))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = asyncio.run(checkout_many(orders, executor=executor))
+    UserDataManager.writer.flush()
+
+    assert all(results)
+    saved = json.loads(users_file.read_text())
+    assert [user['wallet'] for user in saved] == [70.0] + [100.0 - i for i in range(1, 20)]
+
+
+#test case 6 the async and interactive checkouts print the same messages for the same choices
+@pytest.mark.parametrize('choices', [['1'], ['2', '1'], ['2', '9'], ['3']])
+def test_checkout_async_matches_checkout(monkeypatch, capsys, choices):
+    monkeypatch.setattr(UserDataManager, 'update_user', lambda username, **fields: True)
+    cards = [{"name": "Visa", "card_number": "4111111111111111"}]
+
+    answers = iter(choices)
+    monkeypatch.setattr(UserInterface, 'get_user_input', lambda prompt="": next(answers))
+    checkout(User(name="TestUser", wallet=10.0, cards=cards), make_cart(1.5, 2.5))
+    interactive = capsys.readouterr().out
+
+    card_choice = choices[1] if len(choices) > 1 else None
+    asyncio.run(checkout_async(user=User(name="TestUser", wallet=10.0, cards=cards), cart=make_cart(1.5, 2.5),
+                               payment_choice=choices[0], card_choice=card_choice))
+    headless = capsys.readouterr().out
+
+    # The interactive checkout also shows the payment menu and the card list before the shared messages
+    assert interactive.endswith(headless)
+
+
+#test case 7 wallet writes of any number of users share a fixed set of locks
+def test_wallet_locks_are_striped():
+    assert wallet_lock("Alice") is wallet_lock("alice")
+    assert {id(wallet_lock(f"User{i}")) for i in range(1000)} <= {id(lock) for lock in wallet_locks}
+    assert len(wallet_locks) == WALLET_LOCK_STRIPES
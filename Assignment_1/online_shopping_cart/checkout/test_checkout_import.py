@@ -0,0 +1,61 @@
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
+from online_shopping_cart.checkout import checkout_process
+from online_shopping_cart.product.product_data import get_products
+
+
+#test case 1 importing the checkout module neither reads the catalog nor pulls in partd
+def test_import_is_lazy():
+    script = (
+        'import builtins, io, sys\n'
+        'opened = []\n'
+        'real_open = io.open\n'
+        'def tracing_open(file, *args, **kwargs):\n'
+        '    opened.append(str(file))\n'
+        '    return real_open(file, *args, **kwargs)\n'
+        'builtins.open = io.open = tracing_open\n'
+        'import online_shopping_cart.checkout.checkout_process as checkout_process\n'
+        'assert checkout_process.global_products is None\n'
+        'assert not any(name.endswith("products.csv") for name in opened), opened\n'
+        'assert "partd" not in sys.modules\n'
+    )
+    subprocess.run([sys.executable, '-c', script], check=True)
+
+
+#test case 2 the products are loaded on first use of the inventory
+def test_get_inventory_loads_products(monkeypatch):
+    monkeypatch.setattr(checkout_process, 'global_products', None)
+    monkeypatch.setattr(checkout_process, 'global_inventory', None)
+
+    inventory = checkout_process.get_inventory()
+    assert [product.name for product in inventory.products] == [product.name for product in get_products()]
+    assert checkout_process.get_inventory() is inventory
+
+
+#test case 3 replacing global_products rebuilds the inventory
+def test_get_inventory_follows_replaced_products(monkeypatch):
+    monkeypatch.setattr(checkout_process, 'global_products', get_products())
+    first = checkout_process.get_inventory()
+    monkeypatch.setattr(checkout_process, 'global_products', get_products())
+    assert checkout_process.get_inventory() is not first
+
+
+#test case 4 concurrent first callers load the products once and share one inventory
+def test_get_inventory_concurrent_first_use(monkeypatch):
+    loads = []
+
+    def slow_get_products():
+        loads.append(1)
+        sleep(0.05)  # Widens the window in which other callers would load the products again
+        return get_products()
+
+    monkeypatch.setattr(checkout_process, 'global_products', None)
+    monkeypatch.setattr(checkout_process, 'global_inventory', None)
+    monkeypatch.setattr(checkout_process, 'get_products', slow_get_products)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        inventories = list(executor.map(lambda _: checkout_process.get_inventory(), range(16)))
+    assert len(loads) == 1
+    assert all(inventory is inventories[0] for inventory in inventories)
@@ -0,0 +1,67 @@
+import pytest
+from online_shopping_cart.checkout import checkout_process
+from online_shopping_cart.checkout.shopping_cart import ShoppingCart
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.user.user_interface import UserInterface
+
+login_info = {"username": "ExistingUser", "wallet": 10.0}
+
+
+@pytest.fixture
+def cart(monkeypatch):
+    monkeypatch.setattr(checkout_process, 'global_products',
+                        [Product(name=f"Product {i}", price=1.0, units=5) for i in range(45)])
+    return ShoppingCart()
+
+
+def run(inputs, cart, monkeypatch):
+    answers = iter(inputs + ["l", "y"])
+    monkeypatch.setattr(UserInterface, 'get_user_input', lambda prompt="": next(answers))
+    with pytest.raises(SystemExit):
+        checkout_process.checkout_and_payment(login_info, cart=cart)
+
+
+#test case 1 product numbers refer to the page being shown
+def test_select_on_later_page(cart, monkeypatch, capsys):
+    run([">", "1", "g3", "5", "<", "2"], cart, monkeypatch)
+
+    assert [item.name for item in cart.items] == ["Product 20", "Product 44", "Product 21"]
+    assert "Page 3 of 3" in capsys.readouterr().out
+
+
+#test case 2 numbers past the end of the page and unknown pages are rejected
+def test_invalid_page_and_number(cart, monkeypatch, capsys):
+    run(["g3", "6", "g4"], cart, monkeypatch)
+
+    out = capsys.readouterr().out
+    assert "Invalid input. Please try again." in out
+    assert "No such page. There are 3 pages." in out
+    assert cart.is_empty()
+
+
+#test case 3 a search narrows the pages to the matching products
+def test_search_then_select(cart, monkeypatch, capsys):
+    run(["/product 4", "2", "/", "2"], cart, monkeypatch)
+
+    assert [item.name for item in cart.items] == ["Product 40", "Product 1"]
+    assert "Products matching 'product 4':" in capsys.readouterr().out
+
+
+#test case 4 NxQ adds Q units at once, and is refused as a whole if stock is short
+def test_add_quantity(cart, monkeypatch, capsys):
+    run(["3x4", "3x2", "4x0", "4xx"], cart, monkeypatch)
+
+    out = capsys.readouterr().out
+    assert "4 units of Product 2 added to your cart." in out
+    assert "Sorry, only 1 units of Product 2 are in stock." in out
+    assert out.count("Invalid input. Please try again.") == 2
+    assert cart.get_item("Product 2").units == 4
+    assert checkout_process.get_inventory().get("Product 2").units == 1
+
+
+#test case 5 removing NxQ from the cart puts Q units back into stock
+def test_remove_quantity(cart, monkeypatch):
+    run(["1x5", "c", "n", "y", "1x3", "n", "n"], cart, monkeypatch)
+
+    assert cart.get_item("Product 0").units == 2
+    assert checkout_process.get_inventory().get("Product 0").units == 3
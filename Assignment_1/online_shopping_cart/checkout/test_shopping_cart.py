@@ -0,0 +1,113 @@
+import pytest
+
+from online_shopping_cart.checkout.shopping_cart import CartItem, ShoppingCart
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.user.user import User
+
+
+@pytest.fixture
+def cart():
+    cart = ShoppingCart()
+    for name in ["Kiwi", "Apple", "Banana"]:
+        cart.add_item(Product(name=name, price=1.0, units=1))
+    return cart
+
+
+#test case 1 items keep the order in which they were first added
+def test_cart_keeps_insertion_order(cart):
+    cart.add_item(Product(name="Kiwi", price=1.0, units=1))
+    assert [item.name for item in cart.retrieve_items()] == ["Kiwi", "Apple", "Banana"]
+    assert cart.get_item("Kiwi").units == 2
+
+
+#test case 2 removing the last unit drops the line, other lines keep their order
+def test_cart_remove_item(cart):
+    cart.remove_item(cart.get_item("Apple"))
+    assert [item.name for item in cart.items] == ["Kiwi", "Banana"]
+    assert cart.get_item("Apple") is None
+
+
+#test case 3 clearing empties the cart
+def test_cart_clear(cart):
+    cart.clear_items()
+    assert cart.is_empty()
+    assert cart.retrieve_items() == []
+
+
+#test case 4 the running total follows adds, removes and clears without float drift
+def test_cart_running_total(cart):
+    assert cart.get_total_price() == 3.0
+    for _ in range(3):
+        cart.add_item(Product(name="Candy", price=0.1, units=1))
+    assert cart.get_total_price() == 3.3
+    cart.remove_item(cart.get_item("Candy"))
+    cart.remove_item(cart.get_item("Kiwi"))
+    assert cart.get_total_price() == 2.2
+    cart.clear_items()
+    assert cart.get_total_price() == 0.0
+
+
+#test case 5 a cart line references the catalog product and counts its own units
+def test_cart_line_references_product():
+    catalog_apple = Product(name="Apple", price=2.0, units=10)
+    cart = ShoppingCart()
+    cart.add_item(catalog_apple, units=1)
+    cart.add_item(catalog_apple, units=1)
+
+    item = cart.get_item("Apple")
+    assert item.product is catalog_apple
+    assert (item.name, item.price, item.units) == ("Apple", 2.0, 2)
+    assert str(item) == "Apple - $2.0 - Units: 2"
+    assert catalog_apple.units == 10
+    assert cart.get_total_price() == 4.0
+
+
+#test case 6 records are slotted, without a per-instance __dict__
+def test_records_are_slotted():
+    apple = Product(name="Apple", price=2.0, units=1)
+    for record in (apple, CartItem(product=apple, units=1), User(name="Alice", wallet=1.0)):
+        assert not hasattr(record, '__dict__')
+
+
+#test case 7 units are added and removed in bulk, one operation for any quantity
+def test_cart_bulk_quantities():
+    apple = Product(name="Apple", price=0.1, units=1000)
+    cart = ShoppingCart()
+    cart.add_item(apple, units=700)
+    cart.add_item(apple, units=300)
+    cart.remove_item(apple, units=999)
+
+    assert cart.get_item("Apple").units == 1
+    assert cart.get_total_price() == 0.1
+    with pytest.raises(ValueError):
+        cart.remove_item(apple, units=2)
+    cart.remove_item(apple, units=1)
+    assert cart.is_empty() and cart.get_total_price() == 0.0
+
+
+#test case 8 zero or negative units are rejected, leaving the line and the total unchanged
+@pytest.mark.parametrize('units', [0, -3])
+def test_cart_invalid_units(units):
+    apple = Product(name="Apple", price=2.0, units=10)
+    cart = ShoppingCart()
+    cart.add_item(apple, units=2)
+
+    with pytest.raises(ValueError):
+        cart.remove_item(apple, units=units)
+    with pytest.raises(ValueError):
+        cart.add_item(apple, units=units)
+    assert cart.get_item("Apple").units == 2
+    assert cart.get_total_price() == 4.0
+
+
+#test case 9 a catalog product added without units adds one unit, at the price it had when added
+def test_cart_add_default_unit_and_fixed_price():
+    catalog_apple = Product(name="Apple", price=2.0, units=50)
+    cart = ShoppingCart()
+    cart.add_item(catalog_apple)
+    catalog_apple.price = 3.0
+
+    item = cart.get_item("Apple")
+    assert item.units == 1
+    assert item.price == 2.0
+    assert cart.get_total_price() == 2.0
@@ -8,6 +8,8 @@ class Product:
     Product class to represent product information
     """
 
+    __slots__ = ('name', 'price', 'units')
+
     def __init__(self, name: str, price: float, units: int) -> None:
         self.name: str = name
         self.price: float = price
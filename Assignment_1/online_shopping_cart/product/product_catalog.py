@@ -0,0 +1,136 @@
+from array import array
+from itertools import accumulate, chain, compress, islice, repeat
+from operator import lt, mul
+
+from online_shopping_cart.product.product import Product
+
+###########################
+# PRODUCT CATALOG CLASSES #
+###########################
+
+
+class ProductView:
+    """
+    Product-compatible view of one entry of a ProductCatalog
+    """
+
+    __slots__ = ('catalog', 'index')
+
+    def __init__(self, catalog, index: int) -> None:
+        self.catalog: ProductCatalog = catalog
+        self.index: int = index
+
+    @property
+    def name(self) -> str:
+        return self.catalog.name_at(self.index)
+
+    @property
+    def price(self) -> float:
+        return self.catalog.prices[self.index]
+
+    @price.setter
+    def price(self, price: float) -> None:
+        self.catalog.prices[self.index] = price
+
+    @property
+    def units(self) -> int:
+        return self.catalog.units[self.index]
+
+    @units.setter
+    def units(self, units: int) -> None:
+        self.catalog.units[self.index] = units
+
+    def __str__(self) -> str:
+        return f'{self.name} - ${self.price} - Units: {self.units}'
+
+    def get_product_unit(self) -> Product:
+        self.catalog.units[self.index] -= 1
+        return Product(name=self.name, price=self.price, units=1)
+
+    def add_product_unit(self) -> None:
+        self.catalog.units[self.index] += 1
+
+
+class ProductCatalog:
+    """
+    Columnar product catalog: names in one string table, prices in an array('d') and units in an array('l')
+    """
+
+    def __init__(self, names: list[str] = (), prices=(), units=()) -> None:
+        self.name_table: str = ''.join(names)
+        self.name_offsets: array = array('q', chain((0,), accumulate(map(len, names))))
+        self.prices: array = prices if isinstance(prices, array) else array('d', prices)
+        self.units: array = units if isinstance(units, array) else array('l', units)
+        if not len(self.prices) == len(self.units) == len(self.name_offsets) - 1:
+            raise ValueError('Catalog columns must have the same length.')
+
+    @staticmethod
+    def from_rows(rows) -> 'ProductCatalog':
+        """
+        Build a catalog from CSV rows with Product, Price and Units columns
+        """
+        names: list[str] = []
+        prices: array = array('d')
+        units: array = array('l')
+        for row in rows:
+            names.append(row['Product'])
+            prices.append(float(row['Price']))
+            units.append(int(row['Units']))
+        return ProductCatalog(names=names, prices=prices, units=units)
+
+    @staticmethod
+    def concat(catalogs) -> 'ProductCatalog':
+        """
+        Join catalogs end to end into one, shifting each part's name offsets past the names before it
+        """
+        catalog: ProductCatalog = ProductCatalog()
+        name_tables: list[str] = []
+        base: int = 0
+        for part in catalogs:
+            name_tables.append(part.name_table)
+            catalog.name_offsets.extend(map(base.__add__, islice(part.name_offsets, 1, None)))
+            catalog.prices.extend(part.prices)
+            catalog.units.extend(part.units)
+            base += len(part.name_table)
+        catalog.name_table = ''.join(name_tables)
+        return catalog
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def __getitem__(self, index: int) -> ProductView:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Catalog index out of range.')
+        return ProductView(catalog=self, index=index)
+
+    def __iter__(self):
+        return map(self.__getitem__, range(len(self)))
+
+    def name_at(self, index: int) -> str:
+        return self.name_table[self.name_offsets[index]:self.name_offsets[index + 1]]
+
+    def names(self) -> list[str]:
+        return [self.name_at(i) for i in range(len(self))]
+
+    def total_value(self) -> float:
+        """
+        Value of the whole stock, i.e. the sum of price * units
+        """
+        return sum(map(mul, self.prices, self.units))
+
+    def total_units(self) -> int:
+        return sum(self.units)
+
+    def in_stock(self) -> list[int]:
+        """
+        Indices of the products with at least one unit left
+        """
+        return list(compress(range(len(self)), map(lt, repeat(0), self.units)))
+
+    def filter_by_price(self, min_price: float = float('-inf'), max_price: float = float('inf')) -> list[int]:
+        """
+        Indices of the products priced between min_price and max_price, inclusive
+        """
+        return [i for i, price in enumerate(self.prices) if min_price <= price <= max_price]
@@ -1,5 +1,12 @@
 from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_catalog import ProductCatalog
+from online_shopping_cart.product.product_loader import load_catalog
+from online_shopping_cart.product.product_snapshot import SnapshotCatalog, is_snapshot, open_snapshot
+from collections.abc import Iterator
 from csv import DictReader, reader
+from os import stat
+from os.path import abspath
+from types import MappingProxyType
 
 ##########################
 # PRODUCT DATA CONSTANTS #
@@ -7,6 +14,19 @@ from csv import DictReader, reader
 
 
 PRODUCTS_FILE_PATHNAME: str = './files/products.csv'
+# Files larger than this are streamed row by row instead of being read whole into the cache
+STREAMING_THRESHOLD_BYTES: int = 64 * 2**20
+# Catalogs of files larger than this are parsed in chunks by a pool of processes
+PARALLEL_LOAD_THRESHOLD_BYTES: int = 256 * 2**20
+
+
+#######################
+# PRODUCT DATA CACHES #
+#######################
+
+
+# Parsed CSV files keyed on (absolute path, is_dict), each stored with the file's (mtime, size) when it was read
+csv_cache: dict[tuple[str, bool], tuple[tuple[int, int], tuple]] = dict()
 
 
 ##########################
@@ -14,19 +34,61 @@ PRODUCTS_FILE_PATHNAME: str = './files/products.csv'
 ##########################
 
 
-def get_csv_data(csv_filename=PRODUCTS_FILE_PATHNAME, is_dict=False) -> (list[dict[str, str | float]] |
-                                                                         tuple[list[str], list[reader]]):
+def invalidate_csv_cache(csv_filename=None) -> None:
+    """
+    Drop the cached data of one CSV file, or of every file if no filename is given
+    """
+    if csv_filename is None:
+        csv_cache.clear()
+        return
+    for is_dict in (True, False):
+        csv_cache.pop((abspath(csv_filename), is_dict), None)
+
+
+def iter_csv_data(csv_filename=PRODUCTS_FILE_PATHNAME, is_dict=False) -> Iterator[list[str] | dict[str, str]]:
+    """
+    Lazily yield the rows of a CSV file, starting with the header unless rows are yielded as dicts
+    """
+    with open(file=csv_filename, mode='r', newline='') as csv_file:
+        yield from DictReader(csv_file) if is_dict else reader(csv_file)
+
+
+def get_csv_data(csv_filename=PRODUCTS_FILE_PATHNAME, is_dict=False, stream=None) -> (
+        tuple[MappingProxyType, ...] | tuple[tuple[str, ...], tuple[tuple[str, ...], ...]] |
+        Iterator[dict[str, str]] | tuple[list[str], Iterator[list[str]]]):
+    """
+    Read a CSV file once and serve immutable shared rows until the file's mtime or size changes.
+    With stream, or by default for files over STREAMING_THRESHOLD_BYTES, rows are instead read lazily on iteration.
+    """
+    file_stat = stat(csv_filename)
+    if stream is None:
+        stream = file_stat.st_size > STREAMING_THRESHOLD_BYTES
+    if stream:
+        rows: Iterator = iter_csv_data(csv_filename=csv_filename, is_dict=is_dict)
+        return rows if is_dict else (next(rows), rows)
+
+    key: tuple[str, bool] = (abspath(csv_filename), is_dict)
+    version: tuple[int, int] = (file_stat.st_mtime_ns, file_stat.st_size)
+    cached = csv_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
     with open(file=csv_filename, mode='r', newline='') as csv_file:
         if is_dict:
-            return list(DictReader(csv_file))
-        csv_reader: reader = reader(csv_file)
-        return next(csv_reader), list(csv_reader)
+            data = tuple(MappingProxyType(row) for row in DictReader(csv_file))
+        else:
+            csv_reader: reader = reader(csv_file)
+            data = tuple(next(csv_reader)), tuple(tuple(row) for row in csv_reader)
+    csv_cache[key] = (version, data)
+    return data
 
 
-def get_products(file_name=PRODUCTS_FILE_PATHNAME) -> list[Product]:
+def get_products(file_name=PRODUCTS_FILE_PATHNAME) -> list[Product] | SnapshotCatalog:
     """
-    Load products from a CSV file
+    Load products from a CSV file, or open a compiled catalog snapshot in constant time
     """
+    if is_snapshot(file_name):
+        return open_snapshot(snapshot_filename=file_name)
     products: list[Product] = []
     for row in get_csv_data(csv_filename=file_name, is_dict=True):
         products.append(Product(
@@ -35,3 +97,16 @@ def get_products(file_name=PRODUCTS_FILE_PATHNAME) -> list[Product]:
             units=int(row['Units'])
         ))
     return products
+
+
+def get_product_catalog(file_name=PRODUCTS_FILE_PATHNAME) -> ProductCatalog:
+    """
+    Load products from a CSV file into a columnar catalog, streaming the rows, or open a catalog snapshot.
+    Files over PARALLEL_LOAD_THRESHOLD_BYTES are parsed on every core.
+    """
+    if is_snapshot(file_name):
+        return open_snapshot(snapshot_filename=file_name)
+    if stat(file_name).st_size > PARALLEL_LOAD_THRESHOLD_BYTES:
+        return load_catalog(csv_filename=file_name)
+    with open(file=file_name, mode='r', newline='') as csv_file:
+        return ProductCatalog.from_rows(DictReader(csv_file))
@@ -0,0 +1,61 @@
+from threading import Lock
+
+from online_shopping_cart.product.product import Product
+
+#############################
+# PRODUCT INVENTORY CLASSES #
+#############################
+
+
+class Inventory:
+    """
+    Stock of a product list, indexed by name so reserving and releasing units does not scan the catalog.
+    Each product name has its own lock, so concurrent shoppers can reserve units without overselling.
+    """
+
+    def __init__(self, products: list[Product]) -> None:
+        self.products: list[Product] = products
+        self.__products_by_name: dict[str, Product] = dict()
+        for product in products:
+            self.__products_by_name.setdefault(product.name, product)
+        self.__locks: dict[str, Lock] = {name: Lock() for name in self.__products_by_name}
+        self.__fallback_lock: Lock = Lock()  # For products not in this inventory
+
+    def __lock_for(self, name: str) -> Lock:
+        return self.__locks.get(name, self.__fallback_lock)
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    def __getitem__(self, index: int) -> Product:
+        return self.products[index]
+
+    def get(self, name: str) -> Product | None:
+        """
+        Retrieve the catalog product of the given name, if any
+        """
+        return self.__products_by_name.get(name)
+
+    def reserve(self, product: Product, units: int = 1) -> Product | None:
+        """
+        Take units of a catalog product out of stock in one step, returning the catalog product itself for the cart
+        to reference, or None if fewer units are in stock, in which case none are taken
+        """
+        if units <= 0:
+            raise ValueError('Units must be a positive number.')
+        with self.__lock_for(product.name):
+            if product.units < units:
+                return None
+            product.units -= units
+            return product
+
+    def release(self, name: str, units: int = 1) -> None:
+        """
+        Put units of the named product back into stock
+        """
+        if units <= 0:
+            raise ValueError('Units must be a positive number.')
+        product: Product | None = self.__products_by_name.get(name)
+        if product is not None:
+            with self.__lock_for(name):
+                product.units += units
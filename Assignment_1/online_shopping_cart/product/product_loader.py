@@ -0,0 +1,108 @@
+import os
+from array import array
+from csv import reader
+from io import StringIO
+
+from online_shopping_cart.product.product_catalog import ProductCatalog
+
+############################
+# PRODUCT LOADER CONSTANTS #
+############################
+
+
+# More chunks than workers, so a worker that finishes early picks up another chunk instead of idling
+CHUNKS_PER_WORKER: int = 4
+
+
+############################
+# PRODUCT LOADER FUNCTIONS #
+############################
+
+
+def read_header(csv_filename: str) -> tuple[list[str], int]:
+    """
+    Parse the header line of a CSV file, returning it with the byte offset of the first row
+    """
+    with open(file=csv_filename, mode='rb') as csv_file:
+        header_line: bytes = csv_file.readline()
+        return next(reader([header_line.decode()])), csv_file.tell()
+
+
+def split_lines(csv_filename: str, start: int, chunks: int) -> list[tuple[int, int]]:
+    """
+    Split the bytes of a file from start to its end into at most the given number of (start, end) ranges
+    of about equal size, each beginning at the start of a line
+    """
+    size: int = os.stat(csv_filename).st_size
+    bounds: list[int] = [start]
+    with open(file=csv_filename, mode='rb') as csv_file:
+        for chunk in range(1, chunks):
+            # Reading on from the byte before the target keeps a target that already starts a line
+            csv_file.seek(max(start + (size - start) * chunk // chunks, bounds[-1]) - 1)
+            csv_file.readline()
+            bounds.append(min(csv_file.tell(), size))
+    bounds.append(size)
+    return [(chunk_start, chunk_end) for chunk_start, chunk_end in zip(bounds, bounds[1:]) if chunk_start < chunk_end]
+
+
+def read_range(csv_filename: str, start: int, end: int) -> bytes:
+    with open(file=csv_filename, mode='rb') as csv_file:
+        csv_file.seek(start)
+        return csv_file.read(end - start)
+
+
+def parse_rows(data: bytes, name_index: int, price_index: int, units_index: int) -> ProductCatalog:
+    """
+    Parse CSV rows of products into a catalog
+    """
+    names: list[str] = []
+    prices: array = array('d')
+    units: array = array('l')
+    for row in reader(StringIO(data.decode(), newline='')):
+        if row:  # Blank lines hold no product, as DictReader skips them
+            names.append(row[name_index])
+            prices.append(float(row[price_index]))
+            units.append(int(row[units_index]))
+    return ProductCatalog(names=names, prices=prices, units=units)
+
+
+def parse_chunk(csv_filename: str, start: int, end: int, name_index: int, price_index: int,
+                units_index: int) -> ProductCatalog | None:
+    """
+    Parse the rows between two byte offsets of a products CSV file into a catalog, or return None when the chunk
+    cannot be parsed on its own. An odd number of quotes means one of its ends falls inside a quoted field
+    spanning lines; a chunk with both ends inside such fields fails to parse instead, or leaves another chunk odd.
+    """
+    data: bytes = read_range(csv_filename=csv_filename, start=start, end=end)
+    if data.count(b'"') % 2 == 1:
+        return None
+    try:
+        return parse_rows(data, name_index, price_index, units_index)
+    except (IndexError, ValueError):
+        return None  # Parsing the file whole tells a split quoted field from a malformed row
+
+
+def load_catalog(csv_filename: str, workers: int | None = None, chunks: int | None = None) -> ProductCatalog:
+    """
+    Load a products CSV file into a columnar catalog by parsing chunks of whole lines in a pool of processes,
+    then joining the chunks in file order. With one worker the chunks are parsed in this process.
+    Falls back to parsing the file in one piece when a chunk cannot be parsed on its own, such as when
+    a chunk boundary splits a quoted field.
+    """
+    workers = workers or os.cpu_count() or 1
+    header, start = read_header(csv_filename=csv_filename)
+    indices: tuple[int, int, int] = header.index('Product'), header.index('Price'), header.index('Units')
+    ranges: list[tuple[int, int]] = split_lines(
+        csv_filename=csv_filename, start=start, chunks=chunks or workers * CHUNKS_PER_WORKER
+    )
+    arguments = ([csv_filename] * len(ranges), *zip(*ranges), *([index] * len(ranges) for index in indices))
+    if workers == 1 or len(ranges) <= 1:
+        parts: list[ProductCatalog | None] = list(map(parse_chunk, *arguments))
+    else:
+        from concurrent.futures import ProcessPoolExecutor  # Imports multiprocessing, so only when it is used
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+            parts = list(executor.map(parse_chunk, *arguments))
+
+    if any(part is None for part in parts):
+        return parse_rows(read_range(csv_filename, start, os.stat(csv_filename).st_size), *indices)
+    return ProductCatalog.concat(parts)
@@ -0,0 +1,106 @@
+from collections.abc import Iterator
+
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_search import ProductSearchIndex
+
+###########################
+# PRODUCT PAGER CONSTANTS #
+###########################
+
+
+PAGE_SIZE: int = 20
+
+
+#########################
+# PRODUCT PAGER CLASSES #
+#########################
+
+
+class ProductPager:
+    """
+    Cursor over the pages of a product sequence, or of the products matching a search, one page at a time.
+    Products are numbered from 1 on every page, and only the products of the current page are ever visited.
+    """
+
+    def __init__(self, products, page_size: int = PAGE_SIZE) -> None:
+        self.products = products  # Any sequence of products, e.g. a list, an Inventory or a ProductCatalog
+        self.page_size: int = page_size
+        self.page: int = 0  # Zero-based
+        self.query: str | None = None
+        self.positions: list[int] | None = None  # Positions of the search results; None pages the whole sequence
+        self.__search_index: ProductSearchIndex | None = None  # Built on the first search
+
+    def __len__(self) -> int:
+        return len(self.positions) if self.positions is not None else len(self.products)
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-len(self) // self.page_size))
+
+    def jump(self, page_number: int) -> bool:
+        """
+        Move to the given one-based page, returning False if there is no such page
+        """
+        if not 1 <= page_number <= self.page_count:
+            return False
+        self.page = page_number - 1
+        return True
+
+    def next_page(self) -> bool:
+        return self.jump(self.page + 2)
+
+    def previous_page(self) -> bool:
+        return self.jump(self.page)
+
+    def window(self) -> list[Product]:
+        """
+        Products of the current page
+        """
+        start: int = self.page * self.page_size
+        positions = range(start, min(start + self.page_size, len(self)))
+        if self.positions is not None:
+            positions = (self.positions[i] for i in positions)
+        return [self.products[i] for i in positions]
+
+    def select(self, number: int) -> Product | None:
+        """
+        Product shown with the given number on the current page, if any
+        """
+        if not 1 <= number <= self.page_size:
+            return None
+        position: int = self.page * self.page_size + number - 1
+        if position >= len(self):
+            return None
+        return self.products[self.positions[position] if self.positions is not None else position]
+
+    def search(self, query: str | None) -> int:
+        """
+        Page through the products whose name contains the query, or through all of them again if query is None.
+        Returns the number of products to page through.
+        """
+        self.page = 0
+        self.query = query
+        if query is None:
+            self.positions = None
+        else:
+            if self.__search_index is None:
+                self.__search_index = ProductSearchIndex(
+                    names=(self.products[i].name for i in range(len(self.products)))
+                )
+            self.positions = self.__search_index.containing(query)
+        return len(self)
+
+    def lines(self) -> Iterator[str]:
+        """
+        Render the current page, numbered for selection, followed by the page position if there are several pages
+        """
+        if self.query is None:
+            yield '\nAvailable products for purchase:'
+        else:
+            yield f"\nProducts matching '{self.query}':"
+        if not len(self):
+            yield 'No products found.'
+        for number, product in enumerate(self.window(), start=1):
+            yield f'{number}. {str(product)}'
+        if self.page_count > 1:
+            yield f'Page {self.page + 1} of {self.page_count} (> next page, < previous page, g<n> go to page n)'
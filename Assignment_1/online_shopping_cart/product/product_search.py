@@ -1,5 +1,13 @@
 from online_shopping_cart.product.product_data import get_csv_data, PRODUCTS_FILE_PATHNAME
-from re import search, IGNORECASE
+from online_shopping_cart.user.user_interface import UserInterface
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from heapq import nlargest
+from mmap import ACCESS_READ, mmap
+from os.path import abspath, getsize
 
 ############################
 # PRODUCT SEARCH CONSTANTS #
@@ -7,6 +15,148 @@ from re import search, IGNORECASE
 
 
 PRODUCT_HEADER_INDEX: str = 'Product'
+TRIGRAM_LENGTH: int = 3
+# Fuzzy search reads at most this many rows of trigram postings, bounding its latency on very large catalogs
+FUZZY_POSTINGS_BUDGET: int = 200_000
+# Share of the query's trigrams a name must hold to match, so long names still match a short query
+FUZZY_MIN_SIMILARITY: float = 0.2
+FUZZY_RERANK_FACTOR: int = 4
+# Longer queries are matched by parsing every row, as the scan's set of query substrings grows quadratically
+MMAP_SCAN_MAX_QUERY: int = 256
+# Files holding any of these bytes are parsed instead of scanned: quotes, which the scan does not unquote, and
+# non-ASCII bytes, as some non-ASCII names casefold to ASCII (e.g. 'ß' to 'ss') while the scan lowercases ASCII only
+MMAP_SCAN_UNSUPPORTED_BYTES = re.compile(rb'["\x80-\xff]')
+
+
+##########################
+# PRODUCT SEARCH CLASSES #
+##########################
+
+
+class ProductSearchIndex:
+    """
+    Case-folded index over product names, answering searches with the row indices of the matching products
+    """
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self.names: list[str] = [name.casefold() for name in names]
+        self.__rows_by_name: dict[str, list[int]] = dict()
+        for i, name in enumerate(self.names):
+            self.__rows_by_name.setdefault(name, []).append(i)
+        self.__name_lengths: list[int] = sorted({len(name) for name in self.__rows_by_name})
+        # Built on first use, as only prefix, containing and fuzzy searches need them
+        self.__sorted_names: list[tuple[str, int]] | None = None
+        self.__trigrams: dict[str, list[int]] | None = None
+        self.__trigram_counts: array | None = None
+
+    @staticmethod
+    def padded_trigrams(text: str) -> set[str]:
+        padded: str = f' {text} '
+        return {padded[j:j + TRIGRAM_LENGTH] for j in range(len(padded) - TRIGRAM_LENGTH + 1)}
+
+    def __build_trigrams(self) -> None:
+        self.__trigrams = dict()
+        self.__trigram_counts = array('l')
+        for i, name in enumerate(self.names):
+            trigrams: set[str] = self.padded_trigrams(name)
+            self.__trigram_counts.append(len(trigrams))
+            for trigram in trigrams:
+                self.__trigrams.setdefault(trigram, []).append(i)
+
+    def within(self, query: str) -> list[int]:
+        """
+        Rows whose product name occurs in the query, e.g. 'App' for 'Apple'; costs O(len(query)) probes per name length
+        """
+        query = query.casefold()
+        rows: set[int] = set()
+        for length in self.__name_lengths:
+            if length > len(query):
+                break
+            for start in range(len(query) - length + 1):
+                rows.update(self.__rows_by_name.get(query[start:start + length], ()))
+        return sorted(rows)
+
+    def prefix(self, query: str) -> list[int]:
+        """
+        Rows whose product name starts with the query
+        """
+        if self.__sorted_names is None:
+            self.__sorted_names = sorted((name, i) for i, name in enumerate(self.names))
+        query = query.casefold()
+        rows: list[int] = []
+        position: int = bisect_left(self.__sorted_names, (query, -1))
+        while position < len(self.__sorted_names) and self.__sorted_names[position][0].startswith(query):
+            rows.append(self.__sorted_names[position][1])
+            position += 1
+        return sorted(rows)
+
+    def containing(self, query: str) -> list[int]:
+        """
+        Rows whose product name contains the query, narrowed down by the query's trigrams
+        """
+        query = query.casefold()
+        if len(query) < TRIGRAM_LENGTH:
+            return [i for i, name in enumerate(self.names) if query in name]
+        if self.__trigrams is None:
+            self.__build_trigrams()
+        postings: list[list[int]] = sorted(
+            (self.__trigrams.get(query[j:j + TRIGRAM_LENGTH], []) for j in range(len(query) - TRIGRAM_LENGTH + 1)),
+            key=len
+        )
+        candidates: set[int] = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(posting)
+        return sorted(i for i in candidates if query in self.names[i])
+
+    def fuzzy(self, query: str, k: int = 10, min_similarity: float = FUZZY_MIN_SIMILARITY) -> list[int]:
+        """
+        Up to k rows ranked by closeness to the query, tolerating typos, among rows holding at least min_similarity
+        of the query's trigrams. Candidates come from the query's trigram postings, rarest first, reading at most
+        FUZZY_POSTINGS_BUDGET rows: a posting longer than its share of the budget left is read as an evenly strided
+        sample. The rows sharing the most trigrams, counted over the whole postings and over all of them, are
+        rescored exactly and reranked by edit distance.
+        """
+        if self.__trigrams is None:
+            self.__build_trigrams()
+        query = query.casefold()
+        query_trigrams: set[str] = self.padded_trigrams(query)
+
+        whole_overlaps: Counter = Counter()  # Exact for the postings read whole, which a sample cannot crowd out
+        overlaps: Counter = Counter()
+        budget: int = FUZZY_POSTINGS_BUDGET
+        postings: list[list[int]] = sorted((self.__trigrams.get(trigram, []) for trigram in query_trigrams), key=len)
+        for remaining, posting in zip(range(len(postings), 0, -1), postings):
+            share: int = max(budget // remaining, 1)
+            if len(posting) > share:
+                posting = posting[::-(-len(posting) // share)]
+            else:
+                whole_overlaps.update(posting)
+            budget -= len(posting)
+            overlaps.update(posting)
+
+        def jaccard(i: int, overlap: int) -> float:
+            return overlap / (len(query_trigrams) + self.__trigram_counts[i] - overlap)
+
+        rescored: dict[int, int] = {
+            i: len(query_trigrams & self.padded_trigrams(self.names[i]))
+            for counts in (whole_overlaps, overlaps)
+            for i in nlargest(k * FUZZY_RERANK_FACTOR, counts, key=lambda i: jaccard(i, counts[i]))
+        }
+        candidates: list[int] = [
+            i for i, overlap in rescored.items() if overlap >= min_similarity * len(query_trigrams)
+        ]
+        return sorted(candidates, key=lambda i: (edit_distance(query, self.names[i]), -jaccard(i, rescored[i]), i))[:k]
+
+
+#########################
+# PRODUCT SEARCH CACHES #
+#########################
+
+
+# Search index of the rows last searched per file, reused while get_csv_data keeps serving the same cached rows
+search_index_cache: dict[tuple[str, int], tuple[tuple | list, ProductSearchIndex]] = dict()
 
 
 ############################
@@ -14,14 +164,77 @@ PRODUCT_HEADER_INDEX: str = 'Product'
 ############################
 
 
+def edit_distance(a: str, b: str) -> int:
+    """
+    Levenshtein distance between two strings
+    """
+    previous: list[int] = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current: list[int] = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def get_search_index(csv_filename, rows, name_index: int) -> ProductSearchIndex:
+    """
+    Return the search index of the given in-memory rows, building it only when the rows changed
+    """
+    key: tuple[str, int] = (abspath(csv_filename), name_index)
+    cached = search_index_cache.get(key)
+    if cached is not None and cached[0] is rows:
+        return cached[1]
+    index: ProductSearchIndex = ProductSearchIndex(names=(row[name_index] for row in rows))
+    search_index_cache[key] = (rows, index)
+    return index
+
+
+def scan_csv_within(csv_filename, name_index: int, query: str) -> Iterator[list[str]] | None:
+    """
+    Rows whose product name occurs in the query, found by searching the memory-mapped bytes of the file and
+    decoding only the matching rows. Returns None when the rows must be parsed instead: for quoted fields or
+    non-ASCII bytes in the file, for a non-ASCII or overlong query, or for an empty file.
+    In ASCII text lowercasing equals casefolding, so both ways find the same rows.
+    """
+    if not query.isascii() or len(query) > MMAP_SCAN_MAX_QUERY or getsize(csv_filename) == 0:
+        return None
+    with open(file=csv_filename, mode='rb') as csv_file, mmap(csv_file.fileno(), 0, access=ACCESS_READ) as csv_map:
+        if MMAP_SCAN_UNSUPPORTED_BYTES.search(csv_map) is not None:
+            return None
+    return iter_matching_rows(csv_filename=csv_filename, name_index=name_index, query=query.lower().encode())
+
+
+def iter_matching_rows(csv_filename, name_index: int, query: bytes) -> Iterator[list[str]]:
+    """
+    Decoded rows of an ASCII CSV file without quoted fields whose name occurs in the lowercase query.
+    The file is mapped once iteration starts and unmapped when the generator is exhausted or closed.
+    """
+    # A name can only occur in the query if it is made of the query's characters and is no longer than it,
+    # which the regex checks in C; the few candidates left are then looked up among the query's substrings
+    substrings: set[bytes] = {query[i:j] for i in range(len(query) + 1) for j in range(i, len(query) + 1)}
+    characters: bytes = b''.join(re.escape(bytes([c])) for c in sorted(set(query) - set(b',\r\n')))
+    name_pattern = re.compile(
+        rb'(?i)\n(?:[^,\n]*,){%d}([%s]{0,%d})(?=[,\r\n]|\Z)' % (name_index, characters, len(query))
+        if characters else rb'\n(?:[^,\n]*,){%d}()(?=[,\r\n]|\Z)' % name_index
+    )
+    with open(file=csv_filename, mode='rb') as csv_file, mmap(csv_file.fileno(), 0, access=ACCESS_READ) as csv_map:
+        for match in name_pattern.finditer(csv_map):
+            if match.group(1).lower() in substrings:
+                line_end: int = csv_map.find(b'\n', match.end())
+                if line_end == -1:
+                    line_end = len(csv_map)
+                line: str = csv_map[match.start() + 1:line_end].decode().rstrip('\r')
+                if line:  # Blank lines, such as after the last newline, hold no row
+                    yield line.split(',')
+
+
 def display_csv_as_table(csv_filename=PRODUCTS_FILE_PATHNAME) -> None:
     """
     Display all the products row by row, starting with the header
     """
     header, csv_reader = get_csv_data(csv_filename=csv_filename)
-    print(f'\n{header}')
-    for row in csv_reader:
-        print(row)
+    UserInterface.write_lines(UserInterface.table_formatter(header, csv_reader))
 
 
 def display_filtered_table(csv_filename=PRODUCTS_FILE_PATHNAME, search_target=None) -> None:
@@ -32,9 +245,28 @@ def display_filtered_table(csv_filename=PRODUCTS_FILE_PATHNAME, search_target=No
         display_csv_as_table(csv_filename=csv_filename)
     else:
         header, csv_reader = get_csv_data(csv_filename=csv_filename)
-        print(f'\n{header}')
 
         condition_index: int = header.index(PRODUCT_HEADER_INDEX)
-        for i, row in enumerate(csv_reader):
-            if search(pattern=row[condition_index], string=search_target.capitalize(), flags=IGNORECASE):
-                print(row)
+        if isinstance(csv_reader, (tuple, list)):
+            indices: list[int] = get_search_index(csv_filename, csv_reader, condition_index).within(search_target)
+            rows = (csv_reader[i] for i in indices)
+        else:
+            # Files too large to cache are searched in their raw bytes where possible, decoding only matching rows
+            rows = scan_csv_within(csv_filename, condition_index, search_target)
+            if rows is None:
+                query: str = search_target.casefold()
+                rows = (row for row in csv_reader if row[condition_index].casefold() in query)
+            else:
+                csv_reader.close()
+        UserInterface.write_lines(UserInterface.table_formatter(header, rows))
+
+
+def display_fuzzy_table(csv_filename=PRODUCTS_FILE_PATHNAME, search_target='', k=10) -> None:
+    """
+    Display the products closest to a possibly misspelled name, best match first, starting with the header
+    """
+    header, csv_reader = get_csv_data(csv_filename=csv_filename, stream=False)
+
+    condition_index: int = header.index(PRODUCT_HEADER_INDEX)
+    indices: list[int] = get_search_index(csv_filename, csv_reader, condition_index).fuzzy(search_target, k=k)
+    UserInterface.write_lines(UserInterface.table_formatter(header, (csv_reader[i] for i in indices)))
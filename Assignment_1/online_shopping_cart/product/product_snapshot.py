@@ -0,0 +1,121 @@
+import os
+import struct
+import sys
+from array import array
+from csv import reader
+from mmap import ACCESS_COPY, mmap
+
+from online_shopping_cart.product.product_catalog import ProductCatalog
+
+##############################
+# PRODUCT SNAPSHOT CONSTANTS #
+##############################
+
+
+SNAPSHOT_SUFFIX: str = '.pcat'
+# Columns are stored in native byte order, which the magic records
+SNAPSHOT_MAGIC: bytes = b'PCAT1' + (b'LE' if sys.byteorder == 'little' else b'BE') + b'\x00'
+# Magic, number of products, size of the string table in bytes; followed by the 8-byte aligned columns
+SNAPSHOT_HEADER: struct.Struct = struct.Struct('<8sQQ')
+
+
+############################
+# PRODUCT SNAPSHOT CLASSES #
+############################
+
+
+class SnapshotCatalog(ProductCatalog):
+    """
+    Product catalog served straight from a memory-mapped snapshot file. Opening it reads only the header;
+    the columns are read lazily by the OS as they are accessed. Stock changes stay in memory, as with the CSV.
+    Snapshot layout after the header: name offsets (int64, count + 1), prices (float64), units (int64),
+    then the UTF-8 string table of all names.
+    """
+
+    def __init__(self, snapshot_filename: str) -> None:
+        with open(file=snapshot_filename, mode='rb') as file:
+            self.__map: mmap = mmap(file.fileno(), 0, access=ACCESS_COPY)
+        magic, count, names_size = SNAPSHOT_HEADER.unpack_from(self.__map, 0)
+        if magic != SNAPSHOT_MAGIC:
+            self.__map.close()
+            raise ValueError('Not a product snapshot, or one written on a machine of the other byte order.')
+
+        self.__view: memoryview = memoryview(self.__map)
+        view: memoryview = self.__view
+        start: int = SNAPSHOT_HEADER.size
+        self.name_offsets: memoryview = view[start:start + 8 * (count + 1)].cast('q')
+        start += 8 * (count + 1)
+        self.prices: memoryview = view[start:start + 8 * count].cast('d')
+        start += 8 * count
+        self.units: memoryview = view[start:start + 8 * count].cast('q')
+        start += 8 * count
+        self.name_bytes: memoryview = view[start:start + names_size]
+
+    @property
+    def name_table(self) -> str:
+        return bytes(self.name_bytes).decode()
+
+    def name_at(self, index: int) -> str:
+        return bytes(self.name_bytes[self.name_offsets[index]:self.name_offsets[index + 1]]).decode()
+
+    def close(self) -> None:
+        for view in (self.name_offsets, self.prices, self.units, self.name_bytes, self.__view):
+            view.release()
+        self.__map.close()
+
+
+##############################
+# PRODUCT SNAPSHOT FUNCTIONS #
+##############################
+
+
+def is_snapshot(file_name: str) -> bool:
+    return file_name.endswith(SNAPSHOT_SUFFIX)
+
+
+def write_snapshot(csv_filename: str, snapshot_filename: str) -> int:
+    """
+    Compile a products CSV file with Product, Price and Units columns into a snapshot, returning the product count.
+    The snapshot is written next to its final name and then renamed over it.
+    """
+    name_offsets: array = array('q', [0])
+    prices: array = array('d')
+    units: array = array('q')
+    names: list[bytes] = []
+    with open(file=csv_filename, mode='r', newline='') as csv_file:
+        csv_reader = reader(csv_file)
+        header: list[str] = next(csv_reader)
+        name_index, price_index, units_index = header.index('Product'), header.index('Price'), header.index('Units')
+        for row in csv_reader:
+            name: bytes = row[name_index].encode()
+            names.append(name)
+            name_offsets.append(name_offsets[-1] + len(name))
+            prices.append(float(row[price_index]))
+            units.append(int(row[units_index]))
+
+    temp_filename: str = f'{snapshot_filename}.{os.getpid()}.tmp'
+    try:
+        with open(file=temp_filename, mode='wb') as snapshot_file:
+            snapshot_file.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, len(prices), name_offsets[-1]))
+            for column in (name_offsets, prices, units):
+                column.tofile(snapshot_file)
+            snapshot_file.writelines(names)
+        os.replace(temp_filename, snapshot_filename)
+    except BaseException:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+        raise
+    return len(prices)
+
+
+def open_snapshot(snapshot_filename: str) -> SnapshotCatalog:
+    return SnapshotCatalog(snapshot_filename=snapshot_filename)
+
+
+if __name__ == '__main__':
+    # Usage: python -m online_shopping_cart.product.product_snapshot PRODUCTS_CSV [SNAPSHOT]
+    if len(sys.argv) < 2:
+        print('Usage: python -m online_shopping_cart.product.product_snapshot PRODUCTS_CSV [SNAPSHOT]')
+        exit(1)
+    target: str = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(sys.argv[1])[0] + SNAPSHOT_SUFFIX
+    print(f'Wrote {write_snapshot(csv_filename=sys.argv[1], snapshot_filename=target)} products to {target}')
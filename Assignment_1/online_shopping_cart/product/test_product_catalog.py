@@ -0,0 +1,50 @@
+import pytest
+
+from online_shopping_cart.product.product_catalog import ProductCatalog
+from online_shopping_cart.product.product_data import get_product_catalog, get_products
+
+
+@pytest.fixture
+def catalog():
+    return ProductCatalog(names=["Apple", "Banana", "Kiwi"], prices=[2.0, 1.0, 0.5], units=[10, 0, 4])
+
+
+#test case 1 entries behave like Product objects
+def test_catalog_product_view(catalog):
+    assert len(catalog) == 3
+    assert catalog[1].name == "Banana"
+    assert catalog[-1].price == 0.5
+    assert str(catalog[0]) == "Apple - $2.0 - Units: 10"
+    with pytest.raises(IndexError):
+        catalog[3]
+
+
+#test case 2 taking and returning units updates the units column
+def test_catalog_product_units(catalog):
+    unit = catalog[0].get_product_unit()
+    assert (unit.name, unit.price, unit.units) == ("Apple", 2.0, 1)
+    assert catalog.units[0] == 9
+    catalog[0].add_product_unit()
+    assert catalog[0].units == 10
+
+
+#test case 3 column scans
+def test_catalog_scans(catalog):
+    assert catalog.total_value() == 22.0
+    assert catalog.total_units() == 14
+    assert catalog.in_stock() == [0, 2]
+    assert catalog.filter_by_price(max_price=1.0) == [1, 2]
+
+
+#test case 4 mismatched columns are rejected
+def test_catalog_column_lengths():
+    with pytest.raises(ValueError):
+        ProductCatalog(names=["Apple"], prices=[1.0, 2.0], units=[1])
+
+
+#test case 5 loading the real product file matches get_products
+def test_get_product_catalog():
+    catalog = get_product_catalog()
+    products = get_products()
+    assert len(catalog) == len(products)
+    assert [str(view) for view in catalog] == [str(product) for product in products]
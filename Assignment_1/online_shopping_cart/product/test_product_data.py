@@ -0,0 +1,98 @@
+import pytest
+
+import online_shopping_cart.product.product_data as product_data
+from online_shopping_cart.product.product_data import get_csv_data, get_products, invalidate_csv_cache
+
+
+@pytest.fixture
+def products_csv(tmp_path):
+    pathname = tmp_path / 'products.csv'
+    pathname.write_text('Product,Price,Units\nApple,2,10\nBanana,1,15\n')
+    yield pathname
+    invalidate_csv_cache()
+
+
+def count_opens(monkeypatch):
+    calls = {"open": 0}
+    real_open = open
+
+    def counting_open(*args, **kwargs):
+        calls["open"] += 1
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(product_data, "open", counting_open, raising=False)
+    return calls
+
+
+#test case 1 repeated reads of an unchanged file are served from the cache
+def test_get_csv_data_cached(products_csv, monkeypatch):
+    calls = count_opens(monkeypatch)
+
+    first = get_csv_data(csv_filename=str(products_csv))
+    second = get_csv_data(csv_filename=str(products_csv))
+    get_products(file_name=str(products_csv))
+    get_products(file_name=str(products_csv))
+
+    assert first is second
+    assert first[0] == ('Product', 'Price', 'Units')
+    assert calls["open"] == 2  # One read per mode
+
+
+#test case 2 shared rows cannot be modified
+def test_get_csv_data_rows_immutable(products_csv):
+    header, rows = get_csv_data(csv_filename=str(products_csv))
+    with pytest.raises(TypeError):
+        rows[0][0] = 'Pear'
+    with pytest.raises(TypeError):
+        get_csv_data(csv_filename=str(products_csv), is_dict=True)[0]['Product'] = 'Pear'
+
+
+#test case 3 a changed file is read again
+def test_get_csv_data_revalidates(products_csv):
+    get_csv_data(csv_filename=str(products_csv))
+    products_csv.write_text('Product,Price,Units\nApple,2,10\nBanana,1,15\nOrange,1.5,8\n')
+
+    header, rows = get_csv_data(csv_filename=str(products_csv))
+    assert rows[-1] == ('Orange', '1.5', '8')
+
+
+#test case 4 explicit invalidation forces a new read
+def test_invalidate_csv_cache(products_csv, monkeypatch):
+    calls = count_opens(monkeypatch)
+    get_csv_data(csv_filename=str(products_csv))
+    invalidate_csv_cache(csv_filename=str(products_csv))
+    get_csv_data(csv_filename=str(products_csv))
+
+    assert calls["open"] == 2
+
+
+#test case 5 products built from cached rows are independent objects
+def test_get_products_fresh_objects(products_csv):
+    first = get_products(file_name=str(products_csv))
+    first[0].get_product_unit()
+
+    assert get_products(file_name=str(products_csv))[0].units == 10
+
+
+#test case 6 streaming mode reads rows lazily, header first
+def test_get_csv_data_stream(products_csv):
+    header, rows = get_csv_data(csv_filename=str(products_csv), stream=True)
+
+    assert header == ['Product', 'Price', 'Units']
+    assert not isinstance(rows, (list, tuple))
+    assert next(rows) == ['Apple', '2', '10']
+    assert list(rows) == [['Banana', '1', '15']]
+    assert [row['Product'] for row in get_csv_data(csv_filename=str(products_csv), is_dict=True, stream=True)] == \
+           ['Apple', 'Banana']
+    assert not [key for key in product_data.csv_cache if key[0] == str(products_csv)]
+
+
+#test case 7 files over the threshold are streamed by the table display
+def test_display_streams_large_files(products_csv, monkeypatch, capsys):
+    from online_shopping_cart.product.product_search import display_csv_as_table
+    monkeypatch.setattr(product_data, "STREAMING_THRESHOLD_BYTES", 0)
+
+    display_csv_as_table(csv_filename=str(products_csv))
+
+    assert capsys.readouterr().out == "\n['Product', 'Price', 'Units']\n['Apple', '2', '10']\n['Banana', '1', '15']\n"
+    assert not [key for key in product_data.csv_cache if key[0] == str(products_csv)]
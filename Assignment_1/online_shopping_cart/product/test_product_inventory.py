@@ -0,0 +1,85 @@
+import pytest
+from threading import Barrier, Thread
+
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_inventory import Inventory
+
+
+@pytest.fixture
+def inventory():
+    return Inventory(products=[Product(name="Apple", price=2.0, units=1), Product(name="Banana", price=1.0, units=0)])
+
+
+#test case 1 reserving takes a single unit out of stock and hands back the catalog product, not a copy
+def test_reserve(inventory):
+    assert inventory.reserve(inventory[0]) is inventory.get("Apple")
+    assert inventory.get("Apple").units == 0
+    assert inventory.reserve(inventory[0]) is None
+
+
+#test case 2 out-of-stock products cannot be reserved
+def test_reserve_out_of_stock(inventory):
+    assert inventory.reserve(inventory.get("Banana")) is None
+    assert inventory.get("Banana").units == 0
+
+
+#test case 3 releasing puts a unit back by name, unknown names are ignored
+def test_release(inventory):
+    inventory.release(name="Banana")
+    inventory.release(name="Kiwi")
+
+    assert inventory.get("Banana").units == 1
+    assert len(inventory) == 2
+
+
+#test case 4 several units are reserved and released at once, or none if too few are in stock
+def test_reserve_many_units():
+    inventory = Inventory(products=[Product(name="Apple", price=2.0, units=5)])
+    apple = inventory.get("Apple")
+
+    assert inventory.reserve(apple, units=6) is None
+    assert apple.units == 5
+    assert inventory.reserve(apple, units=5) is apple
+    assert apple.units == 0
+    inventory.release(name="Apple", units=3)
+    assert apple.units == 3
+
+
+#test case 5 thousands of concurrent shoppers never oversell
+def test_concurrent_reservations():
+    inventory = Inventory(products=[Product(name="Apple", price=2.0, units=500), Product(name="Kiwi", price=1.0, units=0)])
+    reserved = []
+    start = Barrier(2000)
+
+    def shopper(i):
+        start.wait()
+        product = inventory[i % 2]
+        unit = inventory.reserve(product)
+        if unit is not None:
+            reserved.append(unit)
+            if i % 4 == 0:
+                inventory.release(name=unit.name)  # Some shoppers put their unit back
+                reserved.remove(unit)
+
+    threads = [Thread(target=shopper, args=(i,)) for i in range(2000)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    apple, kiwi = inventory[0], inventory[1]
+    assert apple.units >= 0 and kiwi.units >= 0
+    assert len(reserved) + apple.units + kiwi.units == 500
+    assert all(unit.name == "Apple" for unit in reserved)
+
+
+#test case 6 zero or negative units are rejected instead of moving stock the wrong way
+@pytest.mark.parametrize('units', [0, -5])
+def test_reserve_release_invalid_units(inventory, units):
+    apple = inventory.get("Apple")
+
+    with pytest.raises(ValueError):
+        inventory.reserve(apple, units=units)
+    with pytest.raises(ValueError):
+        inventory.release(name="Apple", units=units)
+    assert apple.units == 1
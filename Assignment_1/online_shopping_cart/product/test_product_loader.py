@@ -0,0 +1,92 @@
+import pytest
+from online_shopping_cart.product import product_data
+from online_shopping_cart.product.product_catalog import ProductCatalog
+from online_shopping_cart.product.product_data import get_product_catalog
+from online_shopping_cart.product.product_loader import load_catalog, read_header, split_lines
+
+
+@pytest.fixture
+def products_csv(tmp_path):
+    csv_file = tmp_path / 'products.csv'
+    csv_file.write_text(
+        'Units,Product,Price\n' + ''.join(f'{i % 7},Product {i} é,{i % 10 + 0.5}\n' for i in range(200)),
+        encoding='utf-8'
+    )
+    return csv_file
+
+
+def columns(catalog: ProductCatalog) -> tuple[list[str], list[float], list[int]]:
+    return catalog.names(), list(catalog.prices), list(catalog.units)
+
+
+#test case 1 chunks start at line starts and cover every row exactly once
+def test_split_lines(products_csv):
+    header, start = read_header(str(products_csv))
+    ranges = split_lines(str(products_csv), start=start, chunks=7)
+    data = products_csv.read_bytes()
+
+    assert header == ['Units', 'Product', 'Price']
+    assert len(ranges) == 7
+    assert ranges[0][0] == start and ranges[-1][1] == len(data)
+    assert all(end == next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+    assert all(data[chunk_start - 1:chunk_start] == b'\n' for chunk_start, _ in ranges)
+
+
+#test case 2 parsing chunks in processes gives the same catalog as parsing the file whole
+@pytest.mark.parametrize('workers', [1, 2])
+def test_load_catalog_matches_serial(products_csv, workers):
+    expected = get_product_catalog(file_name=str(products_csv))
+    catalog = load_catalog(str(products_csv), workers=workers, chunks=5)
+
+    assert columns(catalog) == columns(expected)
+    assert catalog.name_at(199) == 'Product 199 é'
+    assert catalog.total_value() == expected.total_value()
+
+
+#test case 3 a quoted field spanning chunk boundaries falls back to parsing the file whole
+@pytest.mark.parametrize('chunks', [2, 35, 41])
+def test_load_catalog_quoted_lines(tmp_path, chunks):
+    csv_file = tmp_path / 'products.csv'
+    csv_file.write_text('Product,Price,Units\n' + 'Kiwi,1,1\n' * 20 + '"A\nB, c",1,2\n' + 'Kiwi,1,1\n' * 20)
+    _, start = read_header(str(csv_file))
+    data = csv_file.read_bytes()
+    quote = data.index(b'"')
+    # With enough chunks a boundary really falls inside the quoted field
+    assert chunks < 35 or any(quote < chunk_start <= data.index(b'"', quote + 1)
+               for chunk_start, _ in split_lines(str(csv_file), start=start, chunks=chunks))
+
+    catalog = load_catalog(str(csv_file), workers=1, chunks=chunks)
+
+    assert len(catalog) == 41
+    assert catalog.name_at(20) == 'A\nB, c'
+    assert catalog.units[20] == 2
+
+
+#test case 4 chunks starting or ending inside a quoted field are not parsed on their own
+def test_load_catalog_split_quote(tmp_path):
+    csv_file = tmp_path / 'products.csv'
+    csv_file.write_text('Product,Price,Units\nKiwi,1,1\n"A\nB",1,2\n' + 'Kiwi,1,1\n' * 3)
+
+    catalog = load_catalog(str(csv_file), workers=1, chunks=4)
+
+    assert catalog.names() == ['Kiwi', 'A\nB', 'Kiwi', 'Kiwi', 'Kiwi']
+
+
+#test case 5 a malformed row still fails when the file is parsed whole
+def test_load_catalog_malformed_row(tmp_path):
+    csv_file = tmp_path / 'products.csv'
+    csv_file.write_text('Product,Price,Units\n' + 'Kiwi,1,1\n' * 10 + 'Kiwi,cheap,1\n')
+
+    with pytest.raises(ValueError):
+        load_catalog(str(csv_file), workers=1, chunks=3)
+
+
+#test case 6 empty files and large files through get_product_catalog
+def test_load_catalog_dispatch(products_csv, tmp_path, monkeypatch):
+    empty_csv = tmp_path / 'empty.csv'
+    empty_csv.write_text('Product,Price,Units\n')
+    assert len(load_catalog(str(empty_csv), workers=2)) == 0
+
+    monkeypatch.setattr(product_data, 'PARALLEL_LOAD_THRESHOLD_BYTES', 0)
+    monkeypatch.setattr(product_data, 'load_catalog', lambda csv_filename: ProductCatalog(names=['Loaded'], prices=[1.0], units=[1]))
+    assert get_product_catalog(file_name=str(products_csv)).names() == ['Loaded']
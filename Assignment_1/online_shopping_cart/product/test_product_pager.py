@@ -0,0 +1,61 @@
+from online_shopping_cart.product.product import Product
+from online_shopping_cart.product.product_pager import ProductPager
+
+
+def make_products(count):
+    return [Product(name=f"Product {i}", price=1.0, units=1) for i in range(count)]
+
+
+#test case 1 pages hold page_size products and the cursor moves between them
+def test_pager_navigation():
+    pager = ProductPager(products=make_products(25), page_size=10)
+
+    assert pager.page_count == 3
+    assert [product.name for product in pager.window()] == [f"Product {i}" for i in range(10)]
+    assert pager.next_page() and pager.next_page()
+    assert [product.name for product in pager.window()] == [f"Product {i}" for i in range(20, 25)]
+    assert pager.next_page() is False
+    assert pager.previous_page() and pager.page == 1
+    assert pager.jump(1) and pager.page == 0
+    assert pager.previous_page() is False
+    assert pager.jump(4) is False and pager.jump(0) is False
+
+
+#test case 2 numbers select products relative to the current page
+def test_pager_select():
+    pager = ProductPager(products=make_products(25), page_size=10)
+
+    assert pager.select(6).name == "Product 5"
+    pager.jump(3)
+    assert pager.select(1).name == "Product 20"
+    assert pager.select(6) is None
+    assert pager.select(0) is None and pager.select(11) is None
+
+
+#test case 3 a search pages through the matching products only, until it is cleared
+def test_pager_search():
+    products = make_products(30)
+    pager = ProductPager(products=products, page_size=2)
+    pager.jump(3)
+
+    assert pager.search("product 1") == 11
+    assert pager.page == 0
+    assert [product.name for product in pager.window()] == ["Product 1", "Product 10"]
+    pager.jump(6)
+    assert pager.select(1).name == "Product 19"
+    assert pager.search(None) == 30
+    assert pager.select(2).name == "Product 1"
+
+
+#test case 4 a page renders its numbered products and the page position
+def test_pager_lines():
+    pager = ProductPager(products=make_products(3), page_size=2)
+    pager.next_page()
+
+    assert list(pager.lines()) == [
+        "\nAvailable products for purchase:",
+        "1. Product 2 - $1.0 - Units: 1",
+        "Page 2 of 2 (> next page, < previous page, g<n> go to page n)",
+    ]
+    pager.search("missing")
+    assert list(pager.lines()) == ["\nProducts matching 'missing':", "No products found."]
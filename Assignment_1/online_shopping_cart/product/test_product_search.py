@@ -0,0 +1,172 @@
+import pytest
+from mmap import mmap
+
+import online_shopping_cart.product.product_data as product_data
+import online_shopping_cart.product.product_search as product_search
+from online_shopping_cart.product.product_search import ProductSearchIndex, display_filtered_table, scan_csv_within
+
+
+@pytest.fixture
+def search_index():
+    return ProductSearchIndex(names=["Apple", "Pineapple", "Apple Juice", "Banana", "apple"])
+
+
+#test case 1 names occurring in the query, as display_filtered_table matches them
+def test_within(search_index):
+    assert search_index.within("Green APPLE") == [0, 4]
+    assert search_index.within("Pineapple") == [0, 1, 4]
+    assert search_index.within("Ap") == []
+
+
+#test case 2 names starting with the query
+def test_prefix(search_index):
+    assert search_index.prefix("app") == [0, 2, 4]
+    assert search_index.prefix("apple j") == [2]
+    assert search_index.prefix("kiwi") == []
+
+
+#test case 3 names containing the query, short and long
+def test_containing(search_index):
+    assert search_index.containing("APPLE") == [0, 1, 2, 4]
+    assert search_index.containing("na") == [3]
+    assert search_index.containing("juice") == [2]
+    assert search_index.containing("grape") == []
+
+
+#test case 4 the index is built once while the same rows are served
+def test_display_filtered_table_reuses_index(monkeypatch, capsys):
+    header = ["Product", "Price"]
+    rows = (("Apple", "2"), ("Banana", "1"))
+    builds = []
+
+    class CountingIndex(ProductSearchIndex):
+        def __init__(self, names):
+            builds.append(1)
+            super().__init__(names)
+
+    monkeypatch.setattr(product_search, "get_csv_data", lambda csv_filename=None: (header, rows))
+    monkeypatch.setattr(product_search, "ProductSearchIndex", CountingIndex)
+
+    display_filtered_table(csv_filename="reused.csv", search_target="apple")
+    display_filtered_table(csv_filename="reused.csv", search_target="banana")
+
+    out = capsys.readouterr().out
+    assert "['Apple', '2']" in out and "['Banana', '1']" in out
+    assert len(builds) == 1
+
+
+#test case 5 regex characters in product names are matched literally
+def test_display_filtered_table_literal_names(monkeypatch, capsys):
+    header = ["Product", "Price"]
+    rows = (("C++ Book", "20"), ("A.ple", "1"))
+    monkeypatch.setattr(product_search, "get_csv_data", lambda csv_filename=None: (header, rows))
+
+    display_filtered_table(csv_filename="literal.csv", search_target="c++ book")
+
+    out = capsys.readouterr().out
+    assert "['C++ Book', '20']" in out
+    assert "A.ple" not in out
+
+
+#test case 6 fuzzy search ranks typo-tolerant matches
+def test_fuzzy(search_index):
+    assert search_index.fuzzy("aple", k=2) == [0, 4]
+    assert search_index.fuzzy("bananna") == [3]
+    assert search_index.fuzzy("xyz") == []
+
+
+#test case 7 fuzzy display on the real product file
+def test_display_fuzzy_table(capsys):
+    from online_shopping_cart.product.product_search import display_fuzzy_table
+
+    display_fuzzy_table(search_target="watermelln", k=1)
+
+    out = capsys.readouterr().out.splitlines()
+    assert out[1] == "['Product', 'Price', 'Units']"
+    assert out[2].startswith("['Watermelon'")
+
+
+@pytest.fixture
+def large_csv(tmp_path, monkeypatch):
+    # Every file counts as too large to cache, so filtered displays take the streaming path
+    monkeypatch.setattr(product_data, 'STREAMING_THRESHOLD_BYTES', 0)
+    csv_file = tmp_path / 'products.csv'
+    csv_file.write_text(
+        'Product,Price,Units\nApple,2,10\nPineapple,4,3\n,1,1\nPie,5,0\nApple pie,7,2\nAPPLE,2,1\n'
+    )
+    return csv_file
+
+
+#test case 9 the byte scan of a large file matches the in-memory search
+def test_filtered_table_scan_matches_parsing(large_csv, monkeypatch, capsys):
+    display_filtered_table(csv_filename=str(large_csv), search_target="Green Apple Pie")
+    scanned = capsys.readouterr().out
+
+    monkeypatch.setattr(product_data, 'STREAMING_THRESHOLD_BYTES', 2**40)
+    display_filtered_table(csv_filename=str(large_csv), search_target="Green Apple Pie")
+    assert scanned == capsys.readouterr().out
+    assert "['Apple', '2', '10']" in scanned and "['Apple pie', '7', '2']" in scanned
+    assert "['', '1', '1']" in scanned and "['APPLE', '2', '1']" in scanned
+    assert "Pineapple" not in scanned
+
+
+#test case 10 the scan finds names in any column and decodes only matching rows
+def test_scan_csv_within(tmp_path):
+    csv_file = tmp_path / 'products.csv'
+    csv_file.write_text('Price,Product,Units\n2,Kiwi,1\r\n3,Kiwis,2\r\n1,kiwi,3')
+
+    assert list(scan_csv_within(str(csv_file), 1, "KIWI")) == [['2', 'Kiwi', '1'], ['1', 'kiwi', '3']]
+
+
+#test case 11 quoted fields and non-ASCII queries fall back to parsing the rows
+def test_scan_csv_within_fallbacks(tmp_path):
+    csv_file = tmp_path / 'products.csv'
+    csv_file.write_text('Product,Price,Units\n"Kiwi, gold",2,1\n')
+
+    assert scan_csv_within(str(csv_file), 0, "Kiwi") is None
+    csv_file.write_text('Product,Price,Units\nKiwi,2,1\n')
+    assert scan_csv_within(str(csv_file), 0, "Kiwï") is None
+    assert list(scan_csv_within(str(csv_file), 0, "Kiwi")) == [['Kiwi', '2', '1']]
+
+
+#test case 12 names that casefold to ASCII are found as the in-memory search finds them
+# The second name starts with the Kelvin sign, which casefolds to 'k'
+@pytest.mark.parametrize('name, query', [("Straße", "strasse"), ("\u212aiwi", "kiwi")])
+def test_filtered_table_casefold_names(tmp_path, monkeypatch, capsys, name, query):
+    csv_file = tmp_path / 'products.csv'
+    csv_file.write_text(f'Product,Price,Units\n{name},2,1\nPear,1,1\n', encoding='utf-8')
+    assert scan_csv_within(str(csv_file), 0, query) is None
+
+    monkeypatch.setattr(product_data, 'STREAMING_THRESHOLD_BYTES', 0)
+    display_filtered_table(csv_filename=str(csv_file), search_target=query)
+    streamed = capsys.readouterr().out
+    monkeypatch.setattr(product_data, 'STREAMING_THRESHOLD_BYTES', 2**40)
+    display_filtered_table(csv_filename=str(csv_file), search_target=query)
+
+    assert streamed == capsys.readouterr().out
+    assert f"['{name}', '2', '1']" in streamed
+
+
+#test case 13 the file is only mapped once the rows are iterated, and unmapped when iteration stops
+def test_scan_csv_within_maps_lazily(tmp_path, monkeypatch):
+    csv_file = tmp_path / 'products.csv'
+    csv_file.write_text('Product,Price,Units\nKiwi,2,1\nKiwi,3,1\n')
+    maps = []
+    monkeypatch.setattr(product_search, 'mmap', lambda *args, **kwargs: maps.append(mmap(*args, **kwargs)) or maps[-1])
+
+    rows = scan_csv_within(str(csv_file), 0, "kiwi")
+    assert len(maps) == 1 and maps[0].closed  # Only the check of the file's bytes, already unmapped
+    assert next(rows) == ['Kiwi', '2', '1']
+    assert len(maps) == 2 and not maps[1].closed
+    rows.close()
+    assert maps[1].closed
+
+
+#test case 14 postings over the budget are sampled instead of dropped
+def test_fuzzy_samples_common_trigrams(monkeypatch):
+    monkeypatch.setattr(product_search, "FUZZY_POSTINGS_BUDGET", 40)
+    names = [f"Apple Juice {i}" for i in range(200)] + ["Green Apple 7"]
+    search_index = ProductSearchIndex(names=names)
+
+    assert search_index.fuzzy("aple juice", k=3)
+    assert search_index.fuzzy("gren aple 7", k=3)[0] == 200
@@ -0,0 +1,52 @@
+import pytest
+from online_shopping_cart.product.product_data import get_product_catalog, get_products
+from online_shopping_cart.product.product_inventory import Inventory
+from online_shopping_cart.product.product_snapshot import SnapshotCatalog, write_snapshot
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    csv_file = tmp_path / 'products.csv'
+    csv_file.write_text('Product,Price,Units\nApple,2,10\nCrème brûlée,3.5,0\nBanana,1,15\n', encoding='utf-8')
+    snapshot_file = tmp_path / 'products.pcat'
+    assert write_snapshot(str(csv_file), str(snapshot_file)) == 3
+    return snapshot_file
+
+
+#test case 1 a snapshot serves the same products as the CSV it was compiled from
+def test_snapshot_round_trip(snapshot):
+    catalog = get_products(file_name=str(snapshot))
+
+    assert isinstance(catalog, SnapshotCatalog)
+    assert len(catalog) == 3
+    assert [(p.name, p.price, p.units) for p in catalog] == [
+        ("Apple", 2.0, 10), ("Crème brûlée", 3.5, 0), ("Banana", 1.0, 15)
+    ]
+    assert catalog.names() == ["Apple", "Crème brûlée", "Banana"]
+    assert catalog.total_value() == 35.0
+    assert catalog.in_stock() == [0, 2]
+    catalog.close()
+
+
+#test case 2 stock changes stay in memory and never reach the snapshot file
+def test_snapshot_is_copy_on_write(snapshot):
+    before = snapshot.read_bytes()
+    catalog = get_product_catalog(file_name=str(snapshot))
+    inventory = Inventory(products=catalog)
+
+    assert inventory.reserve(inventory.get("Apple"), units=4) is not None
+    assert catalog[0].units == 6
+    inventory.release(name="Apple")
+    assert catalog[0].units == 7
+    catalog.close()
+    assert snapshot.read_bytes() == before
+    assert get_products(file_name=str(snapshot))[0].units == 10
+
+
+#test case 3 files that are not snapshots are refused
+def test_snapshot_bad_magic(tmp_path):
+    bogus = tmp_path / 'bogus.pcat'
+    bogus.write_bytes(b'\x00' * 64)
+
+    with pytest.raises(ValueError):
+        get_products(file_name=str(bogus))
@@ -1,4 +1,4 @@
-from online_shopping_cart.product.product_search import display_csv_as_table, display_filtered_table
+from online_shopping_cart.product.product_search import display_csv_as_table, display_filtered_table, display_fuzzy_table
 from online_shopping_cart.checkout.checkout_process import checkout_and_payment
 from online_shopping_cart.user.user_interface import UserInterface
 from online_shopping_cart.user.user_login import login
@@ -20,10 +20,12 @@ def search_and_purchase_product() -> None:
     # Search for products then begin to shop
     while True:
         search_target: str = UserInterface.get_user_input(
-            prompt="Search for products in inventory (type 'all' for the whole inventory): "
+            prompt="Search for products in inventory (type 'all' for the whole inventory, ~name for a fuzzy search): "
         ).lower()
         if search_target == 'all':
             display_csv_as_table()
+        elif search_target.startswith('~'):
+            display_fuzzy_table(search_target=search_target[1:])
         else:
             display_filtered_table(search_target=search_target)
 
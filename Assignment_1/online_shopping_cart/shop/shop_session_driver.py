@@ -0,0 +1,93 @@
+from collections.abc import Iterable
+from contextlib import redirect_stdout
+from time import perf_counter
+
+from online_shopping_cart.checkout import checkout_process
+from online_shopping_cart.checkout.shopping_cart import ShoppingCart
+from online_shopping_cart.shop.shop_search_and_purchase import search_and_purchase_product
+from online_shopping_cart.user.user_interface import InterfaceBackend, ScriptedBackend, UserInterface
+
+###############################
+# SHOP SESSION DRIVER CLASSES #
+###############################
+
+
+class SessionReport:
+    """
+    Outcome counts of a run of headless sessions
+    """
+
+    def __init__(self) -> None:
+        self.completed: int = 0  # Sessions that quit or logged out
+        self.aborted: int = 0  # Sessions whose input ran out before they ended
+        self.failed: int = 0  # Sessions that raised an error or exited with a nonzero status
+        self.seconds: float = 0.0
+
+    @property
+    def sessions(self) -> int:
+        return self.completed + self.aborted + self.failed
+
+    @property
+    def sessions_per_second(self) -> float:
+        return self.sessions / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        return (f'{self.sessions} sessions: {self.completed} completed, {self.aborted} aborted, '
+                f'{self.failed} failed, {self.sessions_per_second:.0f} sessions/s')
+
+
+#################################
+# SHOP SESSION DRIVER FUNCTIONS #
+#################################
+
+
+def run_session(backend: InterfaceBackend) -> bool:
+    """
+    Run one shopping session end to end with its own cart, reading input from and writing output to the backend.
+    Returns True if the session ended by quitting or logging out, False if its input ran out first.
+    Raises RuntimeError if the session exited with a nonzero status, such as when the users file is missing.
+    """
+    previous_backend: InterfaceBackend | None = UserInterface.backend
+    previous_cart: ShoppingCart = checkout_process.global_cart
+    UserInterface.use_backend(backend)
+    checkout_process.global_cart = ShoppingCart()
+    try:
+        with redirect_stdout(backend):
+            search_and_purchase_product()
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            raise RuntimeError(f'Session exited with status {e.code}.') from e
+        return True
+    except EOFError:
+        return False
+    finally:
+        UserInterface.use_backend(previous_backend)
+        checkout_process.global_cart = previous_cart
+    return True
+
+
+def run_sessions(scripts: Iterable[Iterable[str]], reset_stock: bool = True) -> SessionReport:
+    """
+    Run one scripted session per sequence of answers, one after the other, timing the whole run.
+    With reset_stock every session starts from the stock of the products file instead of what the previous left.
+    """
+    report: SessionReport = SessionReport()
+    previous_products = checkout_process.global_products
+    previous_inventory = checkout_process.global_inventory
+    start: float = perf_counter()
+    try:
+        for answers in scripts:
+            if reset_stock:
+                checkout_process.global_products = None
+            try:
+                if run_session(backend=ScriptedBackend(answers=answers)):
+                    report.completed += 1
+                else:
+                    report.aborted += 1
+            except Exception:
+                report.failed += 1
+    finally:
+        checkout_process.global_products = previous_products
+        checkout_process.global_inventory = previous_inventory
+    report.seconds = perf_counter() - start
+    return report
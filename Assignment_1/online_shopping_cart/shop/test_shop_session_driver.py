@@ -0,0 +1,61 @@
+import pytest
+from online_shopping_cart.checkout import checkout_process
+from online_shopping_cart.shop.shop_session_driver import run_session, run_sessions
+from online_shopping_cart.user.user_data import UserDataManager
+from online_shopping_cart.user.user_interface import ScriptedBackend, UserInterface
+
+
+@pytest.fixture
+def shopper(monkeypatch):
+    users = [{"username": "Alice", "password": "Password1!", "cards": [], "wallet": 100.0}]
+    monkeypatch.setattr(UserDataManager, 'load_users', lambda: users)
+    monkeypatch.setattr(UserDataManager, 'update_user', lambda username, **fields: users[0].update(fields) or True)
+    monkeypatch.setattr(checkout_process, 'global_products', None)
+    return users[0]
+
+
+# Log in, search, add Apple twice, check out by wallet, then log out
+PURCHASE = ["Alice", "Password1!", "apple", "y", "1", "1", "c", "y", "1", "l", "y"]
+
+
+#test case 1 a scripted session runs end to end, with its own cart and its output captured
+def test_run_session_purchase(shopper):
+    global_cart = checkout_process.global_cart
+    backend = ScriptedBackend(answers=PURCHASE, record=True)
+
+    assert run_session(backend=backend) is True
+    assert shopper['wallet'] == 96.0
+    assert checkout_process.global_cart is global_cart
+    assert UserInterface.backend is None
+    assert any('Thank you for your purchase, Alice!' in text for text in backend.transcript)
+
+
+#test case 2 a session whose input runs out is reported as aborted
+def test_run_session_input_runs_out(shopper):
+    assert run_session(backend=ScriptedBackend(answers=["Alice", "Password1!"])) is False
+
+
+#test case 3 many sessions are counted by outcome
+def test_run_sessions(shopper):
+    report = run_sessions([PURCHASE, ["q"], ["Alice"]] * 5)
+
+    assert (report.completed, report.aborted, report.failed) == (10, 5, 0)
+    assert report.sessions == 15
+    assert shopper['wallet'] == 80.0
+
+
+#test case 4 a session exiting with an error status fails, and the products are restored after the run
+def test_run_sessions_exit_status(shopper, monkeypatch):
+    def missing_users():
+        print('File not found.')
+        exit(1)
+
+    products = checkout_process.get_inventory().products
+    monkeypatch.setattr(UserDataManager, 'load_users', missing_users)
+
+    with pytest.raises(RuntimeError):
+        run_session(backend=ScriptedBackend(answers=PURCHASE))
+    report = run_sessions([PURCHASE, ["q"]])
+
+    assert (report.completed, report.aborted, report.failed) == (1, 0, 1)
+    assert checkout_process.global_products is products
@@ -0,0 +1,66 @@
+import json
+import pytest
+from online_shopping_cart.user.user_data import UserDataManager, UserRecords
+from online_shopping_cart.user.user_authentication import UserAuthenticator
+
+
+@pytest.fixture
+def user_records():
+    return UserRecords([
+        {"username": "Alice", "password": "Password1!", "wallet": 50.0},
+        {"username": "ALICE", "password": "Other1!", "wallet": 0.0},
+        {"username": "Bob", "password": "Password2!", "wallet": 10.0},
+    ])
+
+
+#test case 1 lookup is case-insensitive and the first matching record wins
+def test_find_is_case_insensitive(user_records):
+    assert user_records.find("alice")['wallet'] == 50.0
+    assert user_records.find("BOB")['username'] == "Bob"
+    assert user_records.find("Carol") is None
+
+
+#test case 2 register keeps the index in sync
+def test_register_updates_index(user_records, monkeypatch):
+    monkeypatch.setattr('online_shopping_cart.user.user_data.UserDataManager.load_users', lambda: [])
+    monkeypatch.setattr('online_shopping_cart.user.user_data.UserDataManager.save_users', lambda data: None)
+    assert user_records.find("Carol") is None
+
+    UserAuthenticator.register("Carol", "Password3!", user_records)
+
+    assert user_records.find("carol")['username'] == "Carol"
+
+
+#test case 3 other mutations rebuild the index
+def test_mutation_invalidates_index(user_records):
+    assert user_records.find("alice")['wallet'] == 50.0
+    del user_records[0]
+    assert user_records.find("alice")['password'] == "Other1!"
+
+
+#test case 4 authentication against a plain list still works
+def test_login_with_plain_list(capsys):
+    data = [{"username": "Alice", "password": "Password1!", "wallet": 50.0}]
+
+    assert UserAuthenticator.login(username="ALICE", password="Password1!", data=data)['username'] == "Alice"
+    assert UserAuthenticator.login(username="Alice", password="wrong", data=data) is None
+    assert UserAuthenticator.login(username="Bob", password="Password1!", data=data) is None
+
+    out = capsys.readouterr().out
+    assert "Login failed." in out
+    assert "User is not registered." in out
+
+
+#test case 5 registering with a stale snapshot keeps the updates saved since it was loaded
+def test_register_keeps_concurrent_updates(tmp_path, monkeypatch):
+    users_file = tmp_path / 'users.json'
+    users_file.write_text(json.dumps([{"username": "Alice", "password": "Password1!", "cards": [], "wallet": 50.0}]))
+    monkeypatch.setattr(UserDataManager, 'USER_FILE_PATHNAME', str(users_file))
+    snapshot = UserDataManager.load_users()
+
+    UserDataManager.update_user("Alice", wallet=20.0)
+    UserAuthenticator.register("Carol", "Password3!", snapshot)
+
+    saved = json.loads(users_file.read_text())
+    assert [(user['username'], user['wallet']) for user in saved] == [("Alice", 20.0), ("Carol", 0.0)]
+    assert snapshot.find("carol")['username'] == "Carol"
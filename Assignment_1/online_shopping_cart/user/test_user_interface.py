@@ -0,0 +1,137 @@
+import pytest
+from contextlib import redirect_stdout
+from queue import Queue
+from threading import Thread
+from time import sleep
+from online_shopping_cart.user import user_interface
+from online_shopping_cart.user.user_interface import (
+    FileBackend, InterfaceBackend, QueueBackend, ScriptedBackend, UserInterface, format_columns, format_rows
+)
+
+
+#test case 1 a scripted backend answers prompts in order and raises EOFError when exhausted
+def test_scripted_backend(monkeypatch):
+    backend = ScriptedBackend(answers=["alice", "y"], record=True)
+    monkeypatch.setattr(UserInterface, 'backend', backend)
+
+    assert UserInterface.get_user_input(prompt="Name: ") == "alice"
+    assert UserInterface.get_user_input(prompt="Sure? ") == "y"
+    with pytest.raises(EOFError):
+        UserInterface.get_user_input(prompt="More: ")
+    assert backend.transcript == ["Name: ", "Sure? ", "More: "]
+
+
+#test case 2 a file backend answers with the lines of a file
+def test_file_backend(tmp_path):
+    script = tmp_path / 'session.txt'
+    script.write_text("bob\nPassword1!\n")
+    backend = FileBackend(pathname=str(script))
+
+    assert [backend.read(prompt=""), backend.read(prompt="")] == ["bob", "Password1!"]
+    with pytest.raises(EOFError):
+        backend.read(prompt="")
+
+
+#test case 3 a queue backend is fed by another thread until it is closed with None
+def test_queue_backend():
+    inputs, outputs = Queue(), Queue()
+    backend = QueueBackend(inputs=inputs, outputs=outputs, timeout=5)
+    feeder = Thread(target=lambda: [inputs.put(answer) for answer in ("1", "2", None)])
+    feeder.start()
+
+    assert backend.read(prompt="First: ") == "1"
+    assert backend.read(prompt="Second: ") == "2"
+    with pytest.raises(EOFError):
+        backend.read(prompt="Third: ")
+    feeder.join()
+    assert [outputs.get() for _ in range(3)] == ["First: ", "Second: ", "Third: "]
+
+
+#test case 4 an idle queue ends the input when the timeout passes, and backends must implement read and write
+def test_queue_backend_timeout():
+    backend = QueueBackend(inputs=Queue(), timeout=0.01)
+
+    with pytest.raises(EOFError):
+        backend.read(prompt="")
+    with pytest.raises(TypeError):
+        InterfaceBackend()
+
+
+class CountingStream:
+    def __init__(self):
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append(text)
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+#test case 5 a whole table goes out in a single write, in the same format as one print per row
+def test_write_lines_single_write():
+    stream = CountingStream()
+    with redirect_stdout(stream):
+        UserInterface.write_lines(format_rows(['Product', 'Price'], [('Apple', '2'), ('Kiwi', '1.5')]))
+
+    assert stream.writes == ["\n['Product', 'Price']\n['Apple', '2']\n['Kiwi', '1.5']\n"]
+
+
+#test case 6 pagination writes one page per write and stops when the user answers q
+def test_write_lines_pagination(monkeypatch):
+    answers = iter(["", "q"])
+    monkeypatch.setattr(UserInterface, 'get_user_input', lambda prompt="": next(answers))
+    stream = CountingStream()
+    with redirect_stdout(stream):
+        UserInterface.write_lines((str(i) for i in range(10)), page_size=3)
+
+    assert stream.writes == ["0\n1\n2\n", "3\n4\n5\n"]
+
+
+#test case 7 no page prompt after the last page
+def test_write_lines_pagination_last_page(monkeypatch):
+    monkeypatch.setattr(UserInterface, 'get_user_input', lambda prompt="": pytest.fail("unexpected prompt"))
+    stream = CountingStream()
+    with redirect_stdout(stream):
+        UserInterface.write_lines((str(i) for i in range(3)), page_size=3)
+
+    assert stream.writes == ["0\n1\n2\n"]
+
+
+#test case 8 rows produced slowly, such as matches of a streamed search, are written as they come
+def test_write_lines_flushes_slow_rows():
+    stream = CountingStream()
+    writes_before_next_row = []
+
+    def slow_rows():
+        yield "first"
+        sleep(user_interface.OUTPUT_FLUSH_SECONDS * 1.5)  # The buffered first row has waited long enough to be written
+        yield "second"
+        writes_before_next_row.append(list(stream.writes))
+        sleep(user_interface.OUTPUT_FLUSH_SECONDS * 1.5)  # A row found after a quiet period is written at once
+        yield "third"
+        writes_before_next_row.append(list(stream.writes))
+
+    with redirect_stdout(stream):
+        UserInterface.write_lines(slow_rows())
+
+    assert writes_before_next_row == [["first\nsecond\n"], ["first\nsecond\n", "third\n"]]
+    assert stream.writes == ["first\nsecond\n", "third\n"]
+
+
+#test case 9 a large table is written in chunks of the buffer size
+def test_write_lines_chunks(monkeypatch):
+    monkeypatch.setattr(user_interface, 'OUTPUT_BUFFER_CHARS', 4)
+    stream = CountingStream()
+    with redirect_stdout(stream):
+        UserInterface.write_lines(["ab", "cd", "ef"])
+
+    assert stream.writes == ["ab\ncd\n", "ef\n"]
+
+
+#test case 10 the column formatter pads columns and aligns numbers right
+def test_format_columns():
+    lines = list(format_columns(['Product', 'Price'], [('Apple', '2'), ('Watermelon', '10.5')]))
+
+    assert lines == ['', 'Product     Price', '----------  -----', 'Apple           2', 'Watermelon   10.5']
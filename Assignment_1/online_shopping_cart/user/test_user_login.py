@@ -0,0 +1,81 @@
+import pytest
+from unittest.mock import MagicMock
+from online_shopping_cart.user import user_login
+from online_shopping_cart.user.user_data import UserDataManager, UserRecords
+from online_shopping_cart.user.user_interface import UserInterface
+from online_shopping_cart.user.user_store import SqliteUserStore
+
+
+@pytest.fixture
+def counted_user_data(monkeypatch):
+    # Count how often the users file is read during a login; load_users hands out indexed records
+    fake_users = UserRecords([{"username": "ExistingUser", "password": "Password1!", "wallet": 100.0}])
+    calls = {"load": 0}
+
+    def fake_load_users():
+        calls["load"] += 1
+        return fake_users
+
+    monkeypatch.setattr(UserDataManager, 'load_users', fake_load_users)
+    mock_save = MagicMock()
+    monkeypatch.setattr(UserDataManager, 'save_users', mock_save)
+    return calls, mock_save, fake_users
+
+
+def mock_inputs(inputs, monkeypatch):
+    input_iterator = iter(inputs)
+    monkeypatch.setattr(UserInterface, 'get_user_input', lambda prompt="": next(input_iterator))
+
+
+#test case 1 existing user login reads the users file once
+def test_login_reads_users_once(counted_user_data, monkeypatch):
+    mock_inputs(["existinguser", "Password1!"], monkeypatch)
+    session = user_login.LoginSession()
+
+    user = user_login.login(session=session)
+
+    calls, _, _ = counted_user_data
+    assert user['username'] == "ExistingUser"
+    assert session.reads == 1
+    assert calls["load"] == 1
+
+
+#test case 2 registration reads the users once for the login and reloads them only to save the new record
+def test_register_reads_users_once(counted_user_data, monkeypatch):
+    mock_inputs(["NewUser", "y", "StrongP@ss1", "n"], monkeypatch)
+    session = user_login.LoginSession()
+
+    user = user_login.login(session=session)
+
+    calls, mock_save, fake_users = counted_user_data
+    assert user['username'] == "NewUser"
+    assert session.reads == 1
+    assert calls["load"] == 2
+    mock_save.assert_called_once_with(fake_users)
+    assert fake_users[-1]['username'] == "NewUser"
+
+
+#test case 3 with a store only the user's own record is fetched
+def test_login_with_store_fetches_single_record(tmp_path, monkeypatch):
+    store = SqliteUserStore(db_pathname=str(tmp_path / 'users.db'))
+    store.save_users([{"username": "ExistingUser", "password": "Password1!", "cards": [], "wallet": 5.0}])
+    monkeypatch.setattr(UserDataManager, 'store', store)
+    monkeypatch.setattr(store, 'load_users', MagicMock(side_effect=AssertionError("whole store loaded")))
+    mock_inputs(["ExistingUser", "Password1!"], monkeypatch)
+    session = user_login.LoginSession()
+
+    user = user_login.login(session=session)
+
+    assert user['wallet'] == 5.0
+    assert session.reads == 1
+
+
+#test case 4 a login indexes the loaded users once, without copying them for each lookup
+def test_login_indexes_users_once(counted_user_data, monkeypatch):
+    mock_inputs(["existinguser", "Password1!"], monkeypatch)
+    copies = []
+    original_init = UserRecords.__init__
+    monkeypatch.setattr(UserRecords, '__init__', lambda self, users=(): copies.append(1) or original_init(self, users))
+
+    assert user_login.login()['username'] == "ExistingUser"
+    assert copies == []
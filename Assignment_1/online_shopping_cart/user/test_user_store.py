@@ -0,0 +1,149 @@
+import json
+import pytest
+from online_shopping_cart.user.user_data import UserDataManager
+from online_shopping_cart.user.user_store import SqliteUserStore, JournalUserStore, UserStore
+from online_shopping_cart.user.user_authentication import UserAuthenticator
+
+
+@pytest.fixture
+def sqlite_store(tmp_path, monkeypatch):
+    # Route UserDataManager to a throwaway SQLite database instead of files/users.json
+    store = SqliteUserStore(db_pathname=str(tmp_path / 'users.db'))
+    store.save_users([
+        {"username": "Alice", "password": "Password1!", "cards": [], "wallet": 50.0},
+        {"username": "Bob", "password": "Password2!", "cards": [], "wallet": 10.0},
+    ])
+    monkeypatch.setattr(UserDataManager, 'store', store)
+    return store
+
+
+#test case 1 load_users keeps the saved order
+def test_sqlite_store_round_trip(sqlite_store):
+    users = UserDataManager.load_users()
+    assert [user['username'] for user in users] == ["Alice", "Bob"]
+
+
+#test case 2 get_user fetches a single record case-insensitively
+def test_sqlite_store_get_user(sqlite_store):
+    assert UserDataManager.get_user("alice")['wallet'] == 50.0
+    assert UserDataManager.get_user("Nobody") is None
+
+
+#test case 3 update_user only changes the given fields of one user
+def test_sqlite_store_update_user(sqlite_store):
+    assert UserDataManager.update_user("Bob", wallet=2.5) is True
+    assert UserDataManager.update_user("Nobody", wallet=1.0) is False
+
+    bob = UserDataManager.get_user("Bob")
+    assert bob['wallet'] == 2.5
+    assert bob['password'] == "Password2!"
+    assert UserDataManager.get_user("Alice")['wallet'] == 50.0
+
+
+#test case 4 register and login go through the store without a loaded user list
+def test_sqlite_store_register_and_login(sqlite_store):
+    UserAuthenticator.register("Carol", "Password3!", cards=[{"card_number": "1234"}])
+
+    assert len(UserDataManager.load_users()) == 3
+    login_info = UserAuthenticator.login(username="carol", password="Password3!")
+    assert login_info['username'] == "Carol"
+    assert login_info['cards'] == [{"card_number": "1234"}]
+
+
+#test case 5 without a store, update_user rewrites the JSON file
+def test_update_user_without_store(monkeypatch):
+    fake_users = [{"username": "ExistingUser", "password": "Password1!", "wallet": 10.0}]
+    saved = []
+    monkeypatch.setattr(UserDataManager, 'load_users', lambda: fake_users)
+    monkeypatch.setattr(UserDataManager, 'save_users', lambda data: saved.append(data))
+
+    assert UserDataManager.update_user("ExistingUser", wallet=4.0) is True
+    assert saved == [fake_users]
+    assert fake_users[0]['wallet'] == 4.0
+
+
+@pytest.fixture
+def journal_paths(tmp_path):
+    snapshot = tmp_path / 'users.json'
+    snapshot.write_text(json.dumps([{"username": "Alice", "password": "Password1!", "cards": [], "wallet": 50.0}]))
+    return snapshot, tmp_path / 'users.json.journal'
+
+
+#test case 6 mutations are appended to the journal and replayed on reopen
+def test_journal_store_replays_mutations(journal_paths):
+    snapshot, journal = journal_paths
+    store = JournalUserStore(snapshot_pathname=str(snapshot), fsync=False)
+    store.add_user({"username": "Bob", "password": "Password2!", "cards": [], "wallet": 0.0})
+    store.update_user("alice", wallet=45.0)
+    store.update_user("Bob", cards=[{"card_number": "1234"}])
+
+    assert len(journal.read_text().splitlines()) == 3
+    assert json.loads(snapshot.read_text())[0]['wallet'] == 50.0  # Snapshot untouched until compaction
+
+    reopened = JournalUserStore(snapshot_pathname=str(snapshot), fsync=False)
+    assert reopened.get_user("Alice")['wallet'] == 45.0
+    assert reopened.get_user("bob")['cards'] == [{"card_number": "1234"}]
+
+
+#test case 7 a torn last record from a crash is dropped
+def test_journal_store_ignores_torn_record(journal_paths):
+    snapshot, journal = journal_paths
+    store = JournalUserStore(snapshot_pathname=str(snapshot), fsync=False)
+    store.update_user("Alice", wallet=40.0)
+    with open(journal, 'a') as file:
+        file.write('{"op":"update","username":"Alice","fie')
+
+    reopened = JournalUserStore(snapshot_pathname=str(snapshot), fsync=False)
+    assert reopened.get_user("Alice")['wallet'] == 40.0
+    reopened.update_user("Alice", wallet=30.0)
+    assert JournalUserStore(snapshot_pathname=str(snapshot), fsync=False).get_user("Alice")['wallet'] == 30.0
+
+
+#test case 8 compaction folds the journal into the snapshot
+def test_journal_store_compacts(journal_paths):
+    snapshot, journal = journal_paths
+    store = JournalUserStore(snapshot_pathname=str(snapshot), compact_every=2, fsync=False)
+    store.update_user("Alice", wallet=49.0)
+    store.add_user({"username": "Bob", "password": "Password2!", "cards": [], "wallet": 0.0})
+
+    assert journal.read_text() == ''
+    assert [user['username'] for user in json.loads(snapshot.read_text())] == ["Alice", "Bob"]
+
+
+#test case 9 replaying a journal already folded into the snapshot does not duplicate users
+def test_journal_store_interrupted_compaction(journal_paths):
+    snapshot, journal = journal_paths
+    store = JournalUserStore(snapshot_pathname=str(snapshot), fsync=False)
+    store.add_user({"username": "Bob", "password": "Password2!", "cards": [], "wallet": 0.0})
+    store.update_user("Bob", wallet=5.0)
+    journal_before = journal.read_text()
+    store.compact()
+    journal.write_text(journal_before)  # Crash after replacing the snapshot but before clearing the journal
+
+    users = JournalUserStore(snapshot_pathname=str(snapshot), fsync=False).load_users()
+    assert [user['username'] for user in users] == ["Alice", "Bob"]
+    assert users[1]['wallet'] == 5.0
+
+
+#test case 10 the SQLite store rejects a username that is already taken, in any case
+def test_sqlite_store_rejects_duplicates(sqlite_store):
+    with pytest.raises(ValueError):
+        sqlite_store.add_user({"username": "ALICE", "password": "Password3!", "cards": [], "wallet": 0.0})
+    with pytest.raises(ValueError):
+        sqlite_store.save_users([{"username": "Carol"}, {"username": "carol"}])
+
+    assert [user['username'] for user in sqlite_store.load_users()] == ["Alice", "Bob"]
+    index = sqlite_store.connection.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'users'"
+    ).fetchall()
+    assert index == [('CREATE UNIQUE INDEX users_username_unique ON users (username_key)',)]
+
+
+#test case 11 a backend missing an operation fails when it is created
+def test_incomplete_store():
+    class LoadOnlyStore(UserStore):
+        def load_users(self):
+            return []
+
+    with pytest.raises(TypeError):
+        LoadOnlyStore()
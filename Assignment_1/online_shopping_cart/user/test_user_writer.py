@@ -0,0 +1,111 @@
+import json
+import os
+import pytest
+from threading import Thread
+from online_shopping_cart.user.user_data import UserDataManager
+from online_shopping_cart.user.user_writer import GroupCommitWriter, atomic_write_json
+
+
+@pytest.fixture
+def users_file(tmp_path, monkeypatch):
+    # Point UserDataManager at a temporary users.json with many users
+    pathname = tmp_path / 'users.json'
+    pathname.write_text(json.dumps(
+        [{"username": f"User{i}", "password": "Password1!", "cards": [], "wallet": 100.0} for i in range(50)]
+    ))
+    monkeypatch.setattr(UserDataManager, 'USER_FILE_PATHNAME', str(pathname))
+    return pathname
+
+
+#test case 1 atomic write replaces the file and leaves no temporary file behind
+def test_atomic_write_json(tmp_path):
+    pathname = tmp_path / 'users.json'
+    pathname.write_text('[]')
+
+    atomic_write_json(pathname=str(pathname), data=[{"username": "A"}])
+
+    assert json.loads(pathname.read_text()) == [{"username": "A"}]
+    assert os.listdir(tmp_path) == ['users.json']
+
+
+#test case 2 concurrent wallet updates are all kept and written in fewer batches
+def test_group_commit_concurrent_updates(users_file, monkeypatch):
+    writer = GroupCommitWriter(pathname=str(users_file), flush_interval=0.02, fsync=False)
+    monkeypatch.setattr(UserDataManager, 'writer', writer)
+
+    threads = [
+        Thread(target=UserDataManager.update_user, args=(f"User{i}",), kwargs={"wallet": float(i)}) for i in range(50)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    users = json.loads(users_file.read_text())
+    assert [user['wallet'] for user in users] == [float(i) for i in range(50)]
+    metrics = writer.metrics()
+    assert metrics['saves'] == 50
+    assert metrics['batches'] < 50
+    assert metrics['max_batch_size'] > 1
+
+
+#test case 3 loads see saved data that is still waiting to be written
+def test_group_commit_read_your_writes(users_file, monkeypatch):
+    writer = GroupCommitWriter(pathname=str(users_file), flush_interval=0.5, fsync=False)
+    monkeypatch.setattr(UserDataManager, 'writer', writer)
+
+    writer.submit([{"username": "Pending", "password": "Password1!", "cards": [], "wallet": 1.0}])
+
+    assert UserDataManager.get_user("pending")['wallet'] == 1.0
+    writer.flush()
+    assert json.loads(users_file.read_text())[0]['username'] == "Pending"
+
+
+#test case 4 a write that cannot serialize fails only its own batch and the writer keeps working
+def test_group_commit_failed_batch(users_file):
+    writer = GroupCommitWriter(pathname=str(users_file), flush_interval=0.01, fsync=False)
+
+    with pytest.raises(TypeError):
+        writer.save([{"username": "Broken", "wallet": object()}])
+    writer.save([{"username": "Fixed", "wallet": 1.0}])
+
+    assert json.loads(users_file.read_text()) == [{"username": "Fixed", "wallet": 1.0}]
+    assert sorted(os.listdir(users_file.parent)) == ['users.json']
+
+
+#test case 5 submit writes the data as it was, not as the caller changes it afterwards
+def test_group_commit_submit_snapshot(users_file):
+    writer = GroupCommitWriter(pathname=str(users_file), flush_interval=0.05, fsync=False)
+    users = [{"username": "A", "wallet": 1.0}]
+
+    writer.submit(users)
+    users[0]['wallet'] = 2.0
+    users.append({"username": "B", "wallet": 3.0})
+    writer.flush()
+
+    assert json.loads(users_file.read_text()) == [{"username": "A", "wallet": 1.0}]
+
+
+#test case 6 save_users waits for an update holding the lock instead of overwriting it
+def test_save_users_takes_lock(users_file):
+    saver = Thread(target=UserDataManager.save_users, args=([{"username": "Saved"}],))
+    with UserDataManager.lock:
+        saver.start()
+        saver.join(timeout=0.1)
+        assert saver.is_alive()
+        assert len(json.loads(users_file.read_text())) == 50
+    saver.join()
+
+    assert json.loads(users_file.read_text()) == [{"username": "Saved"}]
+
+
+#test case 7 a failed write leaves the previous file and no temporary file behind
+def test_atomic_write_json_failure(tmp_path):
+    pathname = tmp_path / 'users.json'
+    pathname.write_text('[]')
+
+    with pytest.raises(TypeError):
+        atomic_write_json(pathname=str(pathname), data=[object()])
+
+    assert pathname.read_text() == '[]'
+    assert os.listdir(tmp_path) == ['users.json']
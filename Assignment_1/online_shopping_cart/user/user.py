@@ -8,6 +8,8 @@ class User:
     User class to represent user information
     """
 
+    __slots__ = ('name', 'wallet', 'cards')
+
     def __init__(self, name, wallet,cards = None) -> None:
         self.name: str = name
         self.wallet: float = wallet
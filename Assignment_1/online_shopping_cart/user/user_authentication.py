@@ -1,7 +1,7 @@
 ###############################
 # USER AUTHENTICATION CLASSES #
 ###############################
-from online_shopping_cart.user.user_data import UserDataManager
+from online_shopping_cart.user.user_data import UserDataManager, UserRecords
 import string
 
 class PasswordValidator:
@@ -22,30 +22,32 @@ class PasswordValidator:
 class UserAuthenticator:
 
     @staticmethod
-    def login(username, password, data) -> dict[str, str | float] | None:
-        is_user_registered: bool = False
-
-        for entry in data:
-            if entry['username'].lower() == username.lower():
-                is_user_registered = True
-            if is_user_registered:
-                if entry['password'].lower() == password.lower():
-                    print('Successfully logged in.')
-                    return {
-                        'username': entry['username'],
-                        'wallet': entry['wallet'],
-                        'cards': entry.get('cards', [])
-                    }
-                break
-
-        if not is_user_registered:
-            print('User is not registered.')
+    def login(username, password, data=None) -> dict[str, str | float] | None:
+        """
+        Authenticate against data, the loaded users, or the user store when no data is given. Pass the
+        UserRecords returned by load_users so its index is reused; a plain list is indexed on every call.
+        """
+        if data is None:
+            # Fetch the single matching record instead of scanning a loaded user list
+            entry = UserDataManager.get_user(username)
         else:
-            print('Login failed.')
+            entry = UserRecords.of(data).find(username)
+
+        if entry is None:
+            print('User is not registered.')
+            return None
+        if entry['password'].lower() == password.lower():
+            print('Successfully logged in.')
+            return {
+                'username': entry['username'],
+                'wallet': entry['wallet'],
+                'cards': entry.get('cards', [])
+            }
+        print('Login failed.')
         return None
 
     @staticmethod
-    def register(username, password, data, cards = None) -> None:
+    def register(username, password, data=None, cards = None) -> None:
         if cards is None: cards = []
         new_user = {
              "username": username,
@@ -53,5 +55,4 @@ class UserAuthenticator:
              "cards": cards,
              "wallet": 0.0
          }
-        data.append(new_user)
-        UserDataManager.save_users(data)
+        UserDataManager.add_user(new_user, data=data)
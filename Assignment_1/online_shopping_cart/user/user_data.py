@@ -1,24 +1,199 @@
 import json
+from copy import deepcopy
+from threading import RLock
+
+from online_shopping_cart.user.user_store import UserStore
+from online_shopping_cart.user.user_writer import GroupCommitWriter, atomic_write_json
 
 ################################
 # USER DATA MANAGEMENT CLASSES #
 ################################
 
 
+class UserRecords(list):
+    """
+    List of user records with a case-folded username index, built on first lookup and kept in sync on append
+    """
+
+    def __init__(self, users=()) -> None:
+        super().__init__(users)
+        self.__index: dict[str, dict[str, str | float]] | None = None
+
+    @staticmethod
+    def of(users: list[dict[str, str | float]]) -> 'UserRecords':
+        """
+        Reuse an indexed list as is, otherwise index a copy of a plain one
+        """
+        return users if isinstance(users, UserRecords) else UserRecords(users)
+
+    def find(self, username: str) -> dict[str, str | float] | None:
+        """
+        Return the first user record whose username matches case-insensitively
+        """
+        if self.__index is None:
+            self.__index = dict()
+            for user in self:
+                self.__index.setdefault(user['username'].casefold(), user)
+        return self.__index.get(username.casefold())
+
+    def append(self, user: dict[str, str | float]) -> None:
+        super().append(user)
+        if self.__index is not None:
+            self.__index.setdefault(user['username'].casefold(), user)
+
+    def __invalidate(self) -> None:
+        self.__index = None
+
+    # Any other mutation may change which record comes first for a username, so the index is rebuilt lazily
+
+    def extend(self, users) -> None:
+        super().extend(users)
+        self.__invalidate()
+
+    def insert(self, i, user) -> None:
+        super().insert(i, user)
+        self.__invalidate()
+
+    def remove(self, user) -> None:
+        super().remove(user)
+        self.__invalidate()
+
+    def pop(self, i=-1):
+        self.__invalidate()
+        return super().pop(i)
+
+    def clear(self) -> None:
+        super().clear()
+        self.__invalidate()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self.__invalidate()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.__invalidate()
+
+    def __setitem__(self, i, user) -> None:
+        super().__setitem__(i, user)
+        self.__invalidate()
+
+    def __delitem__(self, i) -> None:
+        super().__delitem__(i)
+        self.__invalidate()
+
+    def __iadd__(self, users):
+        self.__invalidate()
+        return super().__iadd__(users)
+
+
 class UserDataManager:
 
     USER_FILE_PATHNAME: str = './files/users.json'
 
+    # Optional user-store backend; None keeps every operation on the whole USER_FILE_PATHNAME file
+    store: UserStore | None = None
+    # Optional group-commit writer batching the saves of USER_FILE_PATHNAME; None writes every save immediately
+    writer: GroupCommitWriter | None = None
+    # Serializes read-modify-write updates of USER_FILE_PATHNAME so concurrent updates are not lost
+    lock: RLock = RLock()
+
+    @staticmethod
+    def use_store(store: UserStore | None) -> None:
+        UserDataManager.store = store
+
     @staticmethod
-    def load_users() -> list[dict[str, str | float]]:
+    def use_writer(writer: GroupCommitWriter | None) -> None:
+        if UserDataManager.writer is not None:
+            UserDataManager.writer.flush()
+        UserDataManager.writer = writer
+
+    @staticmethod
+    def load_users() -> UserRecords:
+        if UserDataManager.store is not None:
+            return UserRecords(UserDataManager.store.load_users())
+        if UserDataManager.writer is not None:
+            pending = UserDataManager.writer.latest()
+            if pending is not None:
+                return UserRecords(deepcopy(pending))  # Saved but not yet written to the file
         try:
             with open(file=UserDataManager.USER_FILE_PATHNAME, mode='r') as file:
-                return json.load(fp=file)
+                return UserRecords(json.load(fp=file))
         except FileNotFoundError:
             print('File not found.')
             exit(1)
 
     @staticmethod
     def save_users(data: list[dict[str, str | float]]) -> None:
-        with open(file=UserDataManager.USER_FILE_PATHNAME, mode='w') as file:
-            json.dump(obj=data, fp=file, indent=2)
+        """
+        Replace the saved users, holding the lock so the save cannot interleave with an update
+        """
+        if UserDataManager.store is not None:
+            UserDataManager.store.save_users(data)
+            return
+        with UserDataManager.lock:
+            writer: GroupCommitWriter | None = UserDataManager.writer
+            if writer is None:
+                atomic_write_json(pathname=UserDataManager.USER_FILE_PATHNAME, data=data)
+                return
+            ticket: int = writer.submit(data)
+        writer.wait(ticket)
+
+    @staticmethod
+    def get_user(username: str) -> dict[str, str | float] | None:
+        """
+        Fetch a single user record by case-insensitive username
+        """
+        if UserDataManager.store is not None:
+            return UserDataManager.store.get_user(username)
+        return UserRecords.of(UserDataManager.load_users()).find(username)
+
+    @staticmethod
+    def add_user(user: dict[str, str | float], data: list[dict[str, str | float]] | None = None) -> None:
+        """
+        Persist a new user record, also appending it to data, the caller's already loaded users, if given.
+        Without a store the users are reloaded under the lock, so updates saved since data was loaded are kept.
+        """
+        if data is not None and all(record is not user for record in data):
+            data.append(user)
+        if UserDataManager.store is not None:
+            UserDataManager.store.add_user(user)
+            return
+        with UserDataManager.lock:
+            all_users = UserDataManager.load_users()
+            if all(record is not user for record in all_users):  # The reload may be the caller's own list
+                all_users.append(user)
+            ticket: int | None = UserDataManager.__save_locked(all_users)
+        UserDataManager.__wait(ticket)
+
+    @staticmethod
+    def update_user(username: str, **fields) -> bool:
+        """
+        Update the given fields of a single user record, returning False if the user does not exist
+        """
+        if UserDataManager.store is not None:
+            return UserDataManager.store.update_user(username, **fields)
+        with UserDataManager.lock:
+            all_users = UserDataManager.load_users()
+            user = UserRecords.of(all_users).find(username)
+            if user is None:
+                return False
+            user.update(fields)
+            ticket: int | None = UserDataManager.__save_locked(all_users)
+        UserDataManager.__wait(ticket)
+        return True
+
+    @staticmethod
+    def __save_locked(data: list[dict[str, str | float]]) -> int | None:
+        """
+        Save while holding the lock; with a group-commit writer only queue the write so other updates can join it
+        """
+        if UserDataManager.writer is None:
+            UserDataManager.save_users(data)
+            return None
+        return UserDataManager.writer.submit(data)
+
+    @staticmethod
+    def __wait(ticket: int | None) -> None:
+        if ticket is not None:
+            UserDataManager.writer.wait(ticket)
@@ -1,10 +1,199 @@
+import sys
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from queue import Empty, Queue
+from time import perf_counter
+
+############################
+# USER-INTERFACE CONSTANTS #
+############################
+
+
+# Tables are written in chunks of about this many characters, so even a streamed catalog takes few writes
+OUTPUT_BUFFER_CHARS: int = 64 * 2**10
+# Buffered lines are written after at most this many seconds, so slowly produced rows, such as the matches of
+# a large file being searched, show up as they are found instead of when the buffer fills
+OUTPUT_FLUSH_SECONDS: float = 0.1
+PAGE_PROMPT: str = '-- More: Enter to continue, q to stop -- '
+
+
+############################
+# USER-INTERFACE FUNCTIONS #
+############################
+
+
+def format_rows(header, rows) -> Iterator[str]:
+    """
+    Render a table as its header then one row per line, each as a Python list
+    """
+    yield f'\n{list(header)}'
+    for row in rows:
+        yield str(list(row))
+
+
+def format_columns(header, rows) -> Iterator[str]:
+    """
+    Render a table with every column padded to its widest value, numbers aligned right
+    """
+    rows = [[str(value) for value in row] for row in rows]
+    widths: list[int] = [max([len(str(name))] + [len(row[i]) for row in rows if i < len(row)])
+                         for i, name in enumerate(header)]
+    numeric: list[bool] = [bool(rows) and all(row[i].replace('.', '', 1).isdigit() for row in rows if i < len(row))
+                           for i in range(len(widths))]
+
+    def line(values) -> str:
+        return '  '.join(value.rjust(width) if is_numeric else value.ljust(width)
+                         for value, width, is_numeric in zip(values, widths, numeric)).rstrip()
+
+    yield ''
+    yield line([str(name) for name in header])
+    yield '  '.join('-' * width for width in widths)
+    for row in rows:
+        yield line(row)
+
+
 ##########################
 # USER-INTERFACE CLASSES #
 ##########################
 
 
+class InterfaceBackend(ABC):
+    """
+    Source of user input and sink of program output for UserInterface; also usable as a stream for redirect_stdout
+    """
+
+    @abstractmethod
+    def read(self, prompt: str) -> str:
+        """
+        Return the next line of input after showing the prompt, raising EOFError when there is no more input
+        """
+
+    @abstractmethod
+    def write(self, text: str) -> int:
+        """
+        Show text to the user, returning the number of characters written
+        """
+
+    def flush(self) -> None:
+        pass
+
+
+class ScriptedBackend(InterfaceBackend):
+    """
+    Answers prompts from a sequence of lines; output is kept in transcript if record is set, otherwise discarded
+    """
+
+    def __init__(self, answers: Iterable[str], record: bool = False) -> None:
+        self.answers = iter(answers)
+        self.transcript: list[str] | None = [] if record else None
+
+    def read(self, prompt: str) -> str:
+        self.write(prompt)
+        try:
+            return next(self.answers)
+        except StopIteration:
+            raise EOFError('No more scripted input.') from None
+
+    def write(self, text: str) -> int:
+        if self.transcript is not None:
+            self.transcript.append(text)
+        return len(text)
+
+
+class FileBackend(ScriptedBackend):
+    """
+    Answers prompts with the lines of a text file, one line per prompt
+    """
+
+    def __init__(self, pathname: str, record: bool = False) -> None:
+        with open(file=pathname, mode='r') as file:
+            super().__init__(answers=file.read().splitlines(), record=record)
+
+
+class QueueBackend(InterfaceBackend):
+    """
+    Answers prompts from an in-memory queue fed by another thread; None in the input queue, or no input
+    within timeout seconds, ends the input. Output goes to the output queue if one is given.
+    """
+
+    def __init__(self, inputs: Queue, outputs: Queue | None = None, timeout: float | None = None) -> None:
+        self.inputs: Queue = inputs
+        self.outputs: Queue | None = outputs
+        self.timeout: float | None = timeout
+
+    def read(self, prompt: str) -> str:
+        self.write(prompt)
+        try:
+            answer: str | None = self.inputs.get(timeout=self.timeout)
+        except Empty:
+            raise EOFError('No input before the timeout.') from None
+        if answer is None:
+            raise EOFError('Input queue closed.')
+        return answer
+
+    def write(self, text: str) -> int:
+        if self.outputs is not None:
+            self.outputs.put(text)
+        return len(text)
+
+
 class UserInterface:
 
+    # Optional input backend; None reads from the console with input()
+    backend: InterfaceBackend | None = None
+
+    # Lines per page of displayed tables; None displays tables whole
+    page_size: int | None = None
+    # Renders the header and rows of displayed tables into lines, e.g. format_rows or format_columns
+    table_formatter = staticmethod(format_rows)
+
+    @staticmethod
+    def use_backend(backend: InterfaceBackend | None) -> None:
+        UserInterface.backend = backend
+
     @staticmethod
     def get_user_input(prompt) -> str:
+        if UserInterface.backend is not None:
+            return UserInterface.backend.read(prompt)
         return input(prompt)
+
+    @staticmethod
+    def write_lines(lines: Iterable[str], page_size: int | None = None) -> None:
+        """
+        Write lines to standard output buffered into few writes instead of one print per line, writing the buffer
+        once it holds OUTPUT_BUFFER_CHARS or its first line has waited OUTPUT_FLUSH_SECONDS. A line that took
+        OUTPUT_FLUSH_SECONDS to produce is written at once, as the next one may be as slow to come.
+        With a page size, or UserInterface.page_size, stop after each page until the user asks for more.
+        """
+        if page_size is None:
+            page_size = UserInterface.page_size
+        buffer: list[str] = []
+        buffered_chars: int = 0
+        buffered_since: float = 0.0
+        page_lines: int = 0
+        requested_at: float = perf_counter()  # When the next line was asked for
+
+        def write_buffer() -> None:
+            sys.stdout.write('\n'.join(buffer) + '\n')
+            sys.stdout.flush()
+
+        for line in lines:
+            produced_at: float = perf_counter()
+            if page_size is not None and page_lines == page_size:
+                if buffer:
+                    write_buffer()
+                buffer, buffered_chars, page_lines = [], 0, 0
+                if UserInterface.get_user_input(prompt=PAGE_PROMPT).lower().startswith('q'):
+                    return
+            if not buffer:
+                buffered_since = perf_counter()
+            buffer.append(line)
+            buffered_chars += len(line) + 1
+            page_lines += 1
+            if (buffered_chars >= OUTPUT_BUFFER_CHARS or produced_at - requested_at >= OUTPUT_FLUSH_SECONDS
+                    or perf_counter() - buffered_since >= OUTPUT_FLUSH_SECONDS):
+                write_buffer()
+                buffer, buffered_chars = [], 0
+            requested_at = perf_counter()
+        if buffer:
+            write_buffer()
@@ -1,6 +1,34 @@
 from online_shopping_cart.user.user_authentication import UserAuthenticator, PasswordValidator
 from online_shopping_cart.user.user_interface import UserInterface
-from online_shopping_cart.user.user_data import UserDataManager
+from online_shopping_cart.user.user_data import UserDataManager, UserRecords
+
+######################
+# USER LOGIN CLASSES #
+######################
+
+
+class LoginSession:
+    """
+    Loads the user data once per login and shares it, indexed once, between existence check, registration
+    and authentication
+    """
+
+    def __init__(self) -> None:
+        self.reads: int = 0  # Number of loads from the users file or store
+        self.__user_data: UserRecords | None = None
+
+    def load(self, username: str) -> UserRecords:
+        if self.__user_data is None:
+            if UserDataManager.store is None:
+                self.__user_data = UserRecords.of(UserDataManager.load_users())
+            else:
+                # Only the record of this user is needed, so fetch a single row from the store
+                user = UserDataManager.get_user(username)
+                self.__user_data = UserRecords([user] if user is not None else [])
+            self.reads += 1
+        return self.__user_data
+
+
 ########################
 # USER LOGIN FUNCTIONS #
 ########################
@@ -8,19 +36,17 @@ from online_shopping_cart.user.user_data import UserDataManager
 def is_quit(input_argument: str) -> bool:
     return input_argument.lower() == 'q'
 
-def login() -> dict[str, str | float] | None:
+def login(session: LoginSession | None = None) -> dict[str, str | float] | None:
     username: str = UserInterface.get_user_input(prompt="Enter your username (or 'q' to quit): ")
     if is_quit(input_argument=username):
         exit(0)  # The user has quit
 
-    # loading data
-    user_data = UserDataManager.load_users()
+    # loading data once for the whole login
+    if session is None:
+        session = LoginSession()
+    user_data: UserRecords = session.load(username)
     #Check whether the user exists
-    user_exists = False
-    for user in user_data:
-        if user['username'] == username:
-            user_exists = True
-            break
+    user_exists = user_data.find(username) is not None
     #Task 1: Handling Logic for Non-Existent Users
     if not user_exists:
         print(f"User '{username}' not found.")
@@ -71,7 +97,7 @@ def login() -> dict[str, str | float] | None:
     is_authentic_user: dict[str, str | float] = UserAuthenticator().login(
         username=username,
         password=password,
-        data=UserDataManager.load_users()
+        data=user_data
     )
     if is_authentic_user is not None:
         return is_authentic_user
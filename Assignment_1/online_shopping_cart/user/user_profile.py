@@ -9,27 +9,20 @@ def manage_credit_cards(current_username: str):
     """
     print(f"\n--- Managing Credit Cards for User: {current_username} ---")
 
-    # 1. reload the latest data to ensure data consistency
-    all_users = UserDataManager.load_users()
-
-    # 2. fined the current user object
-    target_user = None
-    for user in all_users:
-        if user['username'] == current_username:
-            target_user = user
-            break
+    # 1. fetch the latest record of the current user to ensure data consistency
+    target_user = UserDataManager.get_user(current_username)
 
     if not target_user:
         print("Error: User profile not found in database.")
         return
 
-    # 3. Ensure 'cards' key exists
+    # 2. Ensure 'cards' key exists
     if 'cards' not in target_user:
         target_user['cards'] = []
 
-    # 4. loop for managing cards
+    # 3. loop for managing cards
     while True:
-        # 4.1 show existing cards
+        # 3.1 show existing cards
         current_cards = target_user['cards']
         if not current_cards:
             print("\n[Status] No saved credit cards.")
@@ -40,7 +33,7 @@ def manage_credit_cards(current_username: str):
                 masked_num = card.get('card_number', '****')[-4:]
                 print(f"  {idx + 1}. {card.get('name')} (Ends in {masked_num}) - Exp: {card.get('expiry')}")
 
-        # 4.2 ask for user action
+        # 3.2 ask for user action
         choice = UserInterface.get_user_input(
             prompt="\nOptions: (a) Add new card, (b) Back to main menu: "
         ).lower()
@@ -62,8 +55,8 @@ def manage_credit_cards(current_username: str):
             # add to user's card list
             target_user['cards'].append(new_card)
 
-            # save updated users data
-            UserDataManager.save_users(all_users)
+            # save the updated cards of this user only
+            UserDataManager.update_user(current_username, cards=target_user['cards'])
             print("✅ Card added and saved successfully!")
 
         elif choice == 'b':
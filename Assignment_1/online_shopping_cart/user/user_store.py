@@ -0,0 +1,245 @@
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from copy import deepcopy
+from threading import Lock
+
+from online_shopping_cart.user.user_writer import atomic_write_json
+
+######################
+# USER STORE CLASSES #
+######################
+
+
+class UserStore(ABC):
+    """
+    Base class for the user-store backends UserDataManager can delegate to
+    """
+
+    @abstractmethod
+    def load_users(self) -> list[dict[str, str | float]]:
+        pass
+
+    @abstractmethod
+    def save_users(self, data: list[dict[str, str | float]]) -> None:
+        pass
+
+    @abstractmethod
+    def get_user(self, username: str) -> dict[str, str | float] | None:
+        pass
+
+    @abstractmethod
+    def add_user(self, user: dict[str, str | float]) -> None:
+        """
+        Store a new user, raising ValueError if the username is already taken
+        """
+
+    @abstractmethod
+    def update_user(self, username: str, **fields) -> bool:
+        pass
+
+
+class SqliteUserStore(UserStore):
+    """
+    User store keeping one row per user in a SQLite database, uniquely indexed by case-insensitive username
+    """
+
+    def __init__(self, db_pathname: str) -> None:
+        self.lock: Lock = Lock()
+        self.connection: sqlite3.Connection = sqlite3.connect(database=db_pathname, check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY, username_key TEXT NOT NULL, record TEXT NOT NULL)'
+            )
+            # Replaces the non-unique index of earlier databases
+            self.connection.execute('DROP INDEX IF EXISTS users_username_key')
+            self.connection.execute('CREATE UNIQUE INDEX IF NOT EXISTS users_username_unique ON users (username_key)')
+
+    @staticmethod
+    def username_key(username: str) -> str:
+        return username.casefold()
+
+    def load_users(self) -> list[dict[str, str | float]]:
+        with self.lock:
+            rows = self.connection.execute('SELECT record FROM users ORDER BY id').fetchall()
+        return [json.loads(record) for record, in rows]
+
+    def save_users(self, data: list[dict[str, str | float]]) -> None:
+        """
+        Replace every stored user with the given list, keeping its order; usernames must be unique
+        """
+        keys: list[str] = [self.username_key(user['username']) for user in data]
+        if len(set(keys)) != len(keys):
+            raise ValueError('Usernames must be unique.')
+        with self.lock, self.connection:
+            self.connection.execute('DELETE FROM users')
+            self.connection.executemany(
+                'INSERT INTO users (username_key, record) VALUES (?, ?)',
+                [(key, json.dumps(user)) for key, user in zip(keys, data)]
+            )
+
+    def get_user(self, username: str) -> dict[str, str | float] | None:
+        with self.lock:
+            row = self.connection.execute(
+                'SELECT record FROM users WHERE username_key = ?', (self.username_key(username),)
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def add_user(self, user: dict[str, str | float]) -> None:
+        with self.lock, self.connection:
+            if self.connection.execute(
+                'SELECT 1 FROM users WHERE username_key = ?', (self.username_key(user['username']),)
+            ).fetchone() is not None:
+                raise ValueError(f"User '{user['username']}' already exists.")
+            self.connection.execute(
+                'INSERT INTO users (username_key, record) VALUES (?, ?)',
+                (self.username_key(user['username']), json.dumps(user))
+            )
+
+    def update_user(self, username: str, **fields) -> bool:
+        """
+        Update the given fields of a single user row, returning False if the user does not exist
+        """
+        with self.lock, self.connection:
+            row = self.connection.execute(
+                'SELECT id, record FROM users WHERE username_key = ?', (self.username_key(username),)
+            ).fetchone()
+            if row is None:
+                return False
+            user_id, record = row
+            user: dict[str, str | float] = json.loads(record)
+            user.update(fields)
+            self.connection.execute('UPDATE users SET record = ? WHERE id = ?', (json.dumps(user), user_id))
+        return True
+
+
+class JournalUserStore(UserStore):
+    """
+    User store keeping a users.json-format snapshot plus an append-only journal of compact delta records.
+    Every mutation appends one journal line; the journal is folded into the snapshot every compact_every records.
+    Journal records only ever set absolute values, so replaying them over a snapshot that already holds them is safe.
+    """
+
+    def __init__(self, snapshot_pathname: str, journal_pathname: str | None = None, compact_every: int = 1000,
+                 fsync: bool = True) -> None:
+        self.snapshot_pathname: str = snapshot_pathname
+        self.journal_pathname: str = journal_pathname or f'{snapshot_pathname}.journal'
+        self.compact_every: int = compact_every
+        self.fsync: bool = fsync
+        self.lock: Lock = Lock()
+        self.__users: list[dict[str, str | float]] = list()
+        self.__index: dict[str, dict[str, str | float]] = dict()
+        self.__journal_records: int = 0
+        self.__replay()
+
+    @staticmethod
+    def username_key(username: str) -> str:
+        return username.casefold()
+
+    def __reset(self, users: list[dict[str, str | float]]) -> None:
+        self.__users = users
+        self.__index = dict()
+        for user in users:
+            self.__index.setdefault(self.username_key(user['username']), user)
+
+    def __apply(self, record: dict) -> None:
+        if record['op'] == 'add':
+            # The user may already be in the snapshot if a compaction was interrupted before clearing the journal
+            if self.username_key(record['user']['username']) not in self.__index:
+                self.__users.append(record['user'])
+                self.__index[self.username_key(record['user']['username'])] = record['user']
+        elif record['op'] == 'update':
+            user = self.__index.get(self.username_key(record['username']))
+            if user is not None:
+                user.update(record['fields'])
+        elif record['op'] == 'replace':
+            self.__reset(record['users'])
+
+    def __replay(self) -> None:
+        """
+        Load the snapshot and replay the journal, dropping a torn last record left by a crash mid-append
+        """
+        try:
+            with open(file=self.snapshot_pathname, mode='r') as file:
+                self.__reset(json.load(fp=file))
+        except FileNotFoundError:
+            self.__reset(list())
+
+        valid_length: int = 0
+        try:
+            with open(file=self.journal_pathname, mode='rb') as file:
+                for line in file:
+                    if not line.endswith(b'\n'):
+                        break
+                    try:
+                        record: dict = json.loads(line)
+                    except ValueError:
+                        break
+                    self.__apply(record)
+                    self.__journal_records += 1
+                    valid_length += len(line)
+        except FileNotFoundError:
+            return
+        if os.path.getsize(self.journal_pathname) != valid_length:
+            os.truncate(self.journal_pathname, valid_length)
+
+    def __sync(self, file) -> None:
+        file.flush()
+        if self.fsync:
+            os.fsync(file.fileno())
+
+    def __append(self, record: dict, compact: bool = True) -> None:
+        """
+        Durably append a record to the journal before applying it in memory
+        """
+        with open(file=self.journal_pathname, mode='a') as file:
+            file.write(json.dumps(record, separators=(',', ':')) + '\n')
+            self.__sync(file)
+        self.__apply(record)
+        self.__journal_records += 1
+        if compact and self.__journal_records >= self.compact_every:
+            self.__compact()
+
+    def __compact(self) -> None:
+        """
+        Atomically replace the snapshot with the current users, then clear the journal
+        """
+        atomic_write_json(pathname=self.snapshot_pathname, data=self.__users, fsync=self.fsync)
+        with open(file=self.journal_pathname, mode='w') as file:
+            self.__sync(file)
+        self.__journal_records = 0
+
+    def compact(self) -> None:
+        with self.lock:
+            self.__compact()
+
+    def load_users(self) -> list[dict[str, str | float]]:
+        with self.lock:
+            return deepcopy(self.__users)
+
+    def save_users(self, data: list[dict[str, str | float]]) -> None:
+        """
+        Replace every stored user; the full list is journaled first so a crash during compaction cannot lose it
+        """
+        with self.lock:
+            self.__append({'op': 'replace', 'users': deepcopy(data)}, compact=False)
+            self.__compact()
+
+    def get_user(self, username: str) -> dict[str, str | float] | None:
+        with self.lock:
+            user = self.__index.get(self.username_key(username))
+            return deepcopy(user) if user is not None else None
+
+    def add_user(self, user: dict[str, str | float]) -> None:
+        with self.lock:
+            if self.username_key(user['username']) in self.__index:
+                raise ValueError(f"User '{user['username']}' already exists.")
+            self.__append({'op': 'add', 'user': deepcopy(user)})
+
+    def update_user(self, username: str, **fields) -> bool:
+        with self.lock:
+            if self.username_key(username) not in self.__index:
+                return False
+            self.__append({'op': 'update', 'username': username, 'fields': deepcopy(fields)})
+        return True
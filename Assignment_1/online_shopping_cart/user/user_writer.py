@@ -0,0 +1,148 @@
+import json
+import os
+from collections import deque
+from copy import deepcopy
+from threading import Condition, Thread, get_ident
+from time import perf_counter, sleep
+
+#########################
+# USER WRITER CONSTANTS #
+#########################
+
+
+# Failed batches remembered for their waiters; a waiter only ever asks about a recent batch
+FAILED_BATCHES_KEPT: int = 64
+
+
+#########################
+# USER WRITER FUNCTIONS #
+#########################
+
+
+def atomic_write_json(pathname: str, data, fsync: bool = True) -> None:
+    """
+    Write data as JSON to a temporary file next to pathname, then rename it over pathname
+    """
+    # Unique per process and thread, so concurrent writers never share a temporary file
+    temp_pathname: str = os.path.join(
+        os.path.dirname(os.path.abspath(pathname)), f'.{os.path.basename(pathname)}.{os.getpid()}.{get_ident()}.tmp'
+    )
+    try:
+        with open(file=temp_pathname, mode='w') as file:
+            json.dump(obj=data, fp=file, indent=2)
+            file.flush()
+            if fsync:
+                os.fsync(file.fileno())
+        os.replace(temp_pathname, pathname)
+    except BaseException:
+        if os.path.exists(temp_pathname):
+            os.remove(temp_pathname)
+        raise
+
+
+#######################
+# USER WRITER CLASSES #
+#######################
+
+
+class GroupCommitWriter:
+    """
+    Coalesces the saves submitted within flush_interval seconds into a single atomic write of the latest data
+    """
+
+    def __init__(self, pathname: str, flush_interval: float = 0.005, fsync: bool = True) -> None:
+        self.pathname: str = pathname
+        self.flush_interval: float = flush_interval
+        self.fsync: bool = fsync
+        self.__condition: Condition = Condition()
+        self.__latest = None  # Most recently submitted data, kept until it is on disk
+        self.__submitted: int = 0
+        self.__committed: int = 0
+        self.__flushing: bool = False
+        # (first ticket - 1, last ticket, error) of each recent batch whose write failed
+        self.__failures: deque[tuple[int, int, Exception]] = deque(maxlen=FAILED_BATCHES_KEPT)
+        # Metrics
+        self.batches: int = 0
+        self.max_batch_size: int = 0
+        self.total_write_seconds: float = 0.0
+        self.max_write_seconds: float = 0.0
+
+    def latest(self):
+        """
+        Return the submitted data not yet written to disk, or None if everything is committed
+        """
+        with self.__condition:
+            return self.__latest
+
+    def submit(self, data) -> int:
+        """
+        Queue a snapshot of data for the next group write without waiting, returning a ticket for wait().
+        Later changes to data by the caller are not written unless it is submitted again.
+        """
+        snapshot = deepcopy(data)
+        with self.__condition:
+            self.__latest = snapshot
+            self.__submitted += 1
+            if not self.__flushing:
+                self.__flushing = True
+                Thread(target=self.__flush_loop, daemon=True).start()
+            return self.__submitted
+
+    def wait(self, ticket: int) -> None:
+        """
+        Block until the write covering the given ticket is done, raising its error if it failed
+        """
+        with self.__condition:
+            self.__condition.wait_for(lambda: self.__committed >= ticket)
+            for first, last, error in self.__failures:
+                if first < ticket <= last:
+                    raise error
+
+    def save(self, data) -> None:
+        self.wait(self.submit(data))
+
+    def flush(self) -> None:
+        with self.__condition:
+            ticket: int = self.__submitted
+        self.wait(ticket)
+
+    def metrics(self) -> dict[str, float]:
+        with self.__condition:
+            return {
+                'saves': self.__committed,
+                'batches': self.batches,
+                'mean_batch_size': self.__committed / self.batches if self.batches else 0.0,
+                'max_batch_size': self.max_batch_size,
+                'mean_write_ms': self.total_write_seconds / self.batches * 1e3 if self.batches else 0.0,
+                'max_write_ms': self.max_write_seconds * 1e3,
+            }
+
+    def __flush_loop(self) -> None:
+        while True:
+            sleep(self.flush_interval)  # Let concurrent saves join this batch
+            with self.__condition:
+                data = self.__latest
+                sequence: int = self.__submitted
+
+            start: float = perf_counter()
+            error: Exception | None = None
+            try:
+                atomic_write_json(pathname=self.pathname, data=data, fsync=self.fsync)
+            except Exception as e:  # Such as a value json cannot serialize; reported to the batch's waiters
+                error = e
+            elapsed: float = perf_counter() - start
+
+            with self.__condition:
+                batch_size: int = sequence - self.__committed
+                if error is not None:
+                    self.__failures.append((self.__committed, sequence, error))
+                self.__committed = sequence
+                self.batches += 1
+                self.max_batch_size = max(self.max_batch_size, batch_size)
+                self.total_write_seconds += elapsed
+                self.max_write_seconds = max(self.max_write_seconds, elapsed)
+                self.__condition.notify_all()
+                if self.__submitted == sequence:
+                    self.__latest = None
+                    self.__flushing = False
+                    return